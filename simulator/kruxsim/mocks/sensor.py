@@ -46,12 +46,16 @@ class Mockhistogram:
 
 
 class Mockqrcode:
-    def __init__(self, data):
+    def __init__(self, data, rect=(0, 0, 0, 0)):
         self.data = data
+        self._rect = rect
 
     def payload(self):
         return self.data
 
+    def rect(self):
+        return self._rect
+
 
 capturer = None
 
@@ -73,9 +77,8 @@ def run(on):
 
 def find_qrcodes(img):
     codes = []
-    data = pyzbar.pyzbar.decode(img)
-    if data:
-        codes.append(Mockqrcode(data[0].data.decode()))
+    for data in pyzbar.pyzbar.decode(img):
+        codes.append(Mockqrcode(data.data.decode(), tuple(data.rect)))
     return codes
 
 
@@ -89,6 +92,8 @@ def snapshot():
             img = sequence_executor.camera_image
 
             m.get_frame.return_value = frame
+            m.width.return_value = frame.shape[1]
+            m.height.return_value = frame.shape[0]
             m.get_histogram.return_value = Mockhistogram()
             m.find_qrcodes.return_value = find_qrcodes(img)
 
@@ -102,6 +107,8 @@ def snapshot():
         img = PIL.Image.fromarray(frame)
 
         m.get_frame.return_value = frame
+        m.width.return_value = frame.shape[1]
+        m.height.return_value = frame.shape[0]
         m.get_histogram.return_value = Mockhistogram()
         m.find_qrcodes.return_value = find_qrcodes(img)
         m.to_bytes.return_value = frame.tobytes()
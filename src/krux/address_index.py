@@ -0,0 +1,188 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2022 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import hashlib
+from embit.descriptor.checksum import checksum
+
+ADDRESS_INDEX_MAGIC = b"KAI\x01"
+# Addresses added to each branch every time the index is extended
+ADDRESS_INDEX_STEP = 1000
+HASH_SIZE = 4
+ENTRY_SIZE = HASH_SIZE + 4
+CHECKSUM_SIZE = 8
+BRANCHES = 2
+
+
+def scriptpubkey_hash(sc):
+    """Returns the truncated hash a scriptpubkey is indexed by"""
+    return hashlib.sha256(sc.data).digest()[:HASH_SIZE]
+
+
+class AddressIndex:
+    """Sorted table of truncated scriptpubkey hashes mapped to (branch, index),
+    stored on the SD card and keyed to the wallet descriptor's checksum.
+
+    The table only narrows down where to look: every hit is confirmed by
+    deriving the address again, so a tampered or colliding entry can never
+    make a foreign address look valid.
+
+    A table read from a file stays there and is binary searched by seeking, so
+    the file must be open while looking addresses up. It is only loaded into
+    memory to be extended.
+    """
+
+    def __init__(self, wallet):
+        self.wallet = wallet
+        self.checksum = checksum(wallet.descriptor.to_string())
+        self.depths = [0] * BRANCHES
+        self.entries = bytearray()
+        self.stream = None
+        self.offset = 0
+
+    def filename(self):
+        """Returns the name of the index file of this wallet"""
+        return "addresses-%s.idx" % self.checksum
+
+    def read_from(self, stream):
+        """Checks the header of the index in the stream, which the entries are
+        then looked up in
+        """
+        header = stream.read(len(ADDRESS_INDEX_MAGIC) + CHECKSUM_SIZE + 4 * BRANCHES)
+        if header[: len(ADDRESS_INDEX_MAGIC)] != ADDRESS_INDEX_MAGIC:
+            raise ValueError("invalid address index")
+        offset = len(header)
+        header = header[len(ADDRESS_INDEX_MAGIC) :]
+        if header[:CHECKSUM_SIZE] != self.checksum.encode():
+            raise ValueError("address index does not match wallet")
+        depths = [
+            int.from_bytes(
+                header[CHECKSUM_SIZE + 4 * i : CHECKSUM_SIZE + 4 * i + 4], "big"
+            )
+            for i in range(BRANCHES)
+        ]
+        if stream.seek(0, 2) - offset != sum(depths) * ENTRY_SIZE:
+            raise ValueError("invalid address index")
+        self.depths = depths
+        self.entries = bytearray()
+        self.stream = stream
+        self.offset = offset
+
+    def load(self):
+        """Reads the entries of the stream into memory, in a single buffer"""
+        if self.stream is None:
+            return
+        self.entries = bytearray(sum(self.depths) * ENTRY_SIZE)
+        self.stream.seek(self.offset)
+        self.stream.readinto(self.entries)
+        self.stream = None
+
+    def write_to(self, stream):
+        """Writes the index to the stream"""
+        self.load()
+        stream.write(ADDRESS_INDEX_MAGIC)
+        stream.write(self.checksum.encode())
+        for depth in self.depths:
+            stream.write(depth.to_bytes(4, "big"))
+        stream.write(self.entries)
+
+    def extend(self, count=ADDRESS_INDEX_STEP, progress=None):
+        """Indexes the next count addresses of every branch, calling
+        progress(branch, index) for each one
+        """
+        self.load()
+        added = []
+        for branch in range(BRANCHES):
+            start = self.depths[branch]
+            for i, sc in enumerate(
+                self.wallet.obtain_scriptpubkeys(
+                    start, limit=count, branch_index=branch
+                )
+            ):
+                if progress is not None:
+                    progress(branch, start + i)
+                added.append(
+                    scriptpubkey_hash(sc)
+                    + ((branch << 31) | (start + i)).to_bytes(4, "big")
+                )
+            self.depths[branch] = start + count
+        added.sort()
+
+        # Merge into the table in place, from its end: every run of entries
+        # larger than the next added one is moved straight to its final place
+        end = len(self.entries) // ENTRY_SIZE
+        self.entries.extend(bytes(len(added) * ENTRY_SIZE))
+        for j in range(len(added) - 1, -1, -1):
+            position = self._bisect(added[j], end)
+            if position < end:
+                self.entries[
+                    (position + j + 1) * ENTRY_SIZE : (end + j + 1) * ENTRY_SIZE
+                ] = self.entries[position * ENTRY_SIZE : end * ENTRY_SIZE]
+            self.entries[
+                (position + j) * ENTRY_SIZE : (position + j + 1) * ENTRY_SIZE
+            ] = added[j]
+            end = position
+
+    def _entry(self, i):
+        """Returns the entry at position i, from memory or the stream"""
+        if self.stream is None:
+            return self.entries[i * ENTRY_SIZE : (i + 1) * ENTRY_SIZE]
+        self.stream.seek(self.offset + i * ENTRY_SIZE)
+        return self.stream.read(ENTRY_SIZE)
+
+    def _bisect(self, target, end):
+        """Returns the position of the first of the first end entries that is not
+        smaller than target
+        """
+        lo, hi = 0, end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def lookup(self, sc, branch_index=0):
+        """Returns the index of the scriptpubkey on the branch, or None if it is
+        not among the indexed addresses
+        """
+        target = scriptpubkey_hash(sc)
+        num_entries = (
+            sum(self.depths)
+            if self.stream is not None
+            else len(self.entries) // ENTRY_SIZE
+        )
+        # The smallest entry with the hash has location 0
+        position = self._bisect(target + bytes(4), num_entries)
+        while position < num_entries:
+            entry = self._entry(position)
+            if entry[:HASH_SIZE] != target:
+                break
+            location = int.from_bytes(entry[HASH_SIZE:], "big")
+            branch, index = location >> 31, location & 0x7FFFFFFF
+            # Never trust the table alone, confirm by deriving the address
+            if (
+                branch == branch_index
+                and self.wallet.addresses.scriptpubkey(index, branch) == sc
+            ):
+                return index
+            position += 1
+        return None
@@ -27,6 +27,22 @@ assert len(B43CHARS) == 43
 B58CHARS = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 assert len(B58CHARS) == 58
 
+# Digits converted per big integer operation. 58**5 and 43**5 still fit in a
+# MicroPython small int, so each chunk is split or built without allocating
+CHUNK_DIGITS = 5
+
+
+def _reverse_lookup(chars):
+    # Maps each byte to its digit value plus one, leaving 0 for forbidden bytes
+    table = bytearray(256)
+    for digit, char in enumerate(chars.encode()):
+        table[char] = digit + 1
+    return bytes(table)
+
+
+B43LOOKUP = _reverse_lookup(B43CHARS)
+B58LOOKUP = _reverse_lookup(B58CHARS)
+
 
 def base_decode(v, base):
     """Decodes v from base encoding and returns the decoded bytes"""
@@ -41,31 +57,39 @@ def base_decode(v, base):
     if base == 64:
         return a2b_base64(v)
 
-    chars = B58CHARS if base == 58 else B43CHARS
+    lookup = B58LOOKUP if base == 58 else B43LOOKUP
+    chunk_base = base**CHUNK_DIGITS
     long_value = 0
-    power_of_base = 1
-    for char in reversed(v):
-        digit = chars.find(bytes([char]).decode())
-        if digit == -1:
-            raise ValueError("forbidden character {} for base {}".format(char, base))
-        long_value += digit * power_of_base
-        power_of_base *= base
-    result = bytearray()
-    while long_value >= 256:
-        div, mod = divmod(long_value, 256)
-        result.append(mod)
-        long_value = div
-    if long_value > 0:
-        result.append(long_value)
+    chunk = 0
+    chunk_len = 0
     n_pad = 0
+    leading = True
     for char in v:
-        if bytes([char]).decode() == chars[0]:
-            n_pad += 1
-        else:
-            break
-    if n_pad > 0:
-        result.extend(b"\x00" * n_pad)
-    return bytes(reversed(result))
+        digit = lookup[char] - 1
+        if digit == -1:
+            raise ValueError("forbidden character {} for base {}".format(char, base))
+        # Bitcoin does a little leading-zero-compression:
+        # leading zero digits stand for leading 0-bytes
+        if leading:
+            if digit == 0:
+                n_pad += 1
+                continue
+            leading = False
+        chunk = chunk * base + digit
+        chunk_len += 1
+        if chunk_len == CHUNK_DIGITS:
+            long_value = long_value * chunk_base + chunk
+            chunk = 0
+            chunk_len = 0
+    if chunk_len > 0:
+        long_value = long_value * base**chunk_len + chunk
+
+    # Upper bound of the bytes needed, as base < 2**6
+    result = long_value.to_bytes((len(v) - n_pad) * 6 // 8 + 1, "big")
+    start = 0
+    while start < len(result) and result[start] == 0:
+        start += 1
+    return b"\x00" * n_pad + result[start:]
 
 
 def base_encode(v, base):
@@ -82,19 +106,18 @@ def base_encode(v, base):
     if base == 64:
         return b2a_base64(v).rstrip()
 
-    chars = B58CHARS if base == 58 else B43CHARS
-    long_value = 0
-    power_of_base = 1
-    for char in reversed(v):
-        long_value += power_of_base * char
-        power_of_base <<= 8
+    chars = (B58CHARS if base == 58 else B43CHARS).encode()
+    chunk_base = base**CHUNK_DIGITS
+    long_value = int.from_bytes(v, "big")
+    # Digits are produced least significant first
     result = bytearray()
-    while long_value >= base:
-        div, mod = divmod(long_value, base)
-        result.extend(chars[mod].encode())
-        long_value = div
-    if long_value > 0:
-        result.extend(chars[long_value].encode())
+    while long_value > 0:
+        long_value, chunk = divmod(long_value, chunk_base)
+        for _ in range(CHUNK_DIGITS):
+            if long_value == 0 and chunk == 0:
+                break
+            chunk, digit = divmod(chunk, base)
+            result.append(chars[digit])
     # Bitcoin does a little leading-zero-compression:
     # leading 0-bytes in the input become leading-1s
     n_pad = 0
@@ -104,5 +127,5 @@ def base_encode(v, base):
         else:
             break
     if n_pad > 0:
-        result.extend((chars[0] * n_pad).encode())
+        result.extend(chars[0:1] * n_pad)
     return bytes(reversed(result))
@@ -21,10 +21,12 @@
 # THE SOFTWARE.
 import hashlib
 import gc
+import time
 import sensor
 import lcd
 import board
 from .qr import QRPartParser
+from .krux_settings import Settings, ScannerSettings
 from .wdt import wdt
 
 OV2640_ID = 0x2642  # Lenses, vertical flip - Bit
@@ -32,6 +34,20 @@ OV5642_ID = 0x5642  # Lenses, horizontal flip - Bit
 OV7740_ID = 0x7742  # No lenses, no Flip - M5sitckV, Amigo
 GC0328_ID = 0x9D  # Dock
 
+# While tracking a code, find_qrcodes searches only a region around where the
+# last codes were found, padded by this fraction of the region's size
+QR_ROI_PADDING = 0.5
+# Search the full frame once every this many frames while tracking
+QR_FULL_FRAME_PERIOD = 10
+
+# Camera preview policies while scanning, chosen in the scanner settings
+PREVIEW_ALWAYS = ScannerSettings.PREVIEW_ALWAYS_TXT
+# Only every board.config["krux"]["camera"]["preview_period"] frames
+PREVIEW_PERIODIC = ScannerSettings.PREVIEW_PERIODIC_TXT
+# Only until the first part is captured, then decode at full speed
+PREVIEW_UNTIL_LOCK = ScannerSettings.PREVIEW_UNTIL_LOCK_TXT
+PREVIEW_PERIOD = 2
+
 
 class Camera:
     """Camera is a singleton interface for interacting with the device's camera"""
@@ -39,6 +55,12 @@ class Camera:
     def __init__(self):
         self.cam_id = None
         self.antiglare_enabled = False
+        self.fps = 0
+        self.decode_time = 0
+        self.preview_time = 0
+        camera_config = board.config["krux"].get("camera", {})
+        self.preview_policy = PREVIEW_ALWAYS
+        self.preview_period = camera_config.get("preview_period", PREVIEW_PERIOD)
         self.initialize_sensor()
 
     def initialize_sensor(self, grayscale=False):
@@ -116,18 +138,78 @@ class Camera:
             img.rotation_corr(z_rotation=180)
         return img
 
+    def qr_roi(self, img, codes):
+        """Returns the region of the image to search for codes in the next frame:
+        the bounding box of the codes found, padded and clipped to the image
+        """
+        left, top, right, bottom = img.width(), img.height(), 0, 0
+        for code in codes:
+            x, y, w, h = code.rect()
+            left = min(left, x)
+            top = min(top, y)
+            right = max(right, x + w)
+            bottom = max(bottom, y + h)
+        pad_x = int((right - left) * QR_ROI_PADDING)
+        pad_y = int((bottom - top) * QR_ROI_PADDING)
+        left = max(0, left - pad_x)
+        top = max(0, top - pad_y)
+        right = min(img.width(), right + pad_x)
+        bottom = min(img.height(), bottom + pad_y)
+        return (left, top, right - left, bottom - top)
+
+    def find_qrcodes(self, img, roi=None):
+        """Finds the QR codes in the image, searching only the region of interest
+        when given and falling back to the full frame if nothing is found there
+        """
+        if roi is not None:
+            res = img.find_qrcodes(roi=roi)
+            if res:
+                return res
+        return img.find_qrcodes()
+
+    def display_preview(self, img):
+        """Shows the camera image on the screen, leaving room for the progress bar"""
+        # different cases of lcd.display to show a progress bar on different devices!
+        if board.config["type"] == "m5stickv":
+            img.lens_corr(strength=1.0, zoom=0.56)
+            lcd.display(img, oft=(0, 0), roi=(68, 52, 185, 135))
+        elif board.config["type"].startswith("amigo"):
+            lcd.display(img, oft=(40, 40))
+        else:
+            lcd.display(img, oft=(0, 0), roi=(0, 0, 304, 240))
+
+    def should_preview(self, frame, parsed_count):
+        """Returns whether the given frame should be previewed under the scanner
+        preview setting
+        """
+        if self.preview_policy == PREVIEW_PERIODIC:
+            return frame % self.preview_period == 0
+        if self.preview_policy == PREVIEW_UNTIL_LOCK:
+            return parsed_count == 0
+        return True
+
     def capture_qr_code_loop(self, callback):
         """Captures either singular or animated QRs and parses their contents until
         all parts of the message have been captured. The part data are then ordered
         and assembled into one message and returned.
         """
-        self.initialize_sensor()
+        self.initialize_sensor(
+            grayscale=Settings().scanner.color_mode == ScannerSettings.GRAYSCALE_TXT
+        )
+        self.preview_policy = Settings().scanner.preview
         sensor.run(1)
 
         parser = QRPartParser()
 
         prev_parsed_count = 0
+        prev_payloads = set()
         new_part = False
+        roi = None
+        roi_frames = 0
+        frames = 0
+        decode_time = 0
+        preview_time = 0
+        start_time = time.ticks_ms()
         while True:
             wdt.feed()
             command = callback(parser.total_count(), parser.parsed_count(), new_part)
@@ -135,29 +217,55 @@ class Camera:
                 break
             new_part = False
 
+            frame_start = time.ticks_ms()
             img = self.snapshot()
-            res = img.find_qrcodes()
+            full_frame = roi is None or roi_frames >= QR_FULL_FRAME_PERIOD
+            res = self.find_qrcodes(img, None if full_frame else roi)
+            decode_end = time.ticks_ms()
+            decode_time += decode_end - frame_start
+
+            if self.should_preview(frames, parser.parsed_count()):
+                self.display_preview(img)
+                preview_time += time.ticks_ms() - decode_end
+            frames += 1
+
+            # A frame may hold several codes (e.g. a sheet of PMofN parts), parse
+            # each of them once, skipping those already parsed on the last frame
+            payloads = set()
+            for code in res:
+                data = code.payload()
+                if data in payloads:
+                    continue
+                payloads.add(data)
+                if data in prev_payloads:
+                    continue
 
-            # different cases of lcd.display to show a progress bar on different devices!
-            if board.config["type"] == "m5stickv":
-                img.lens_corr(strength=1.0, zoom=0.56)
-                lcd.display(img, oft=(0, 0), roi=(68, 52, 185, 135))
-            elif board.config["type"].startswith("amigo"):
-                lcd.display(img, oft=(40, 40))
-            else:
-                lcd.display(img, oft=(0, 0), roi=(0, 0, 304, 240))
+                parser.parse(data)
 
-            if len(res) > 0:
-                data = res[0].payload()
+                if parser.is_complete():
+                    break
+            prev_payloads = payloads
 
-                parser.parse(data)
+            # Track the codes found so the next frame searches around them
+            if res:
+                roi = self.qr_roi(img, res)
+                roi_frames = 1 if full_frame else roi_frames + 1
+            else:
+                roi = None
 
-                if parser.parsed_count() > prev_parsed_count:
-                    prev_parsed_count = parser.parsed_count()
-                    new_part = True
+            if parser.parsed_count() > prev_parsed_count:
+                prev_parsed_count = parser.parsed_count()
+                new_part = True
 
             if parser.is_complete():
                 break
+        elapsed = time.ticks_ms() - start_time
+        if elapsed:
+            self.fps = frames * 1000 // elapsed
+        if frames:
+            # Average milliseconds per frame spent on capture and decode, and on preview
+            self.decode_time = decode_time // frames
+            self.preview_time = preview_time // frames
         gc.collect()
         sensor.run(0)
 
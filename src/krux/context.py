@@ -49,6 +49,8 @@ class Context:
 
     def clear(self):
         """Clears all sensitive data from the context, resetting it"""
+        if self.wallet is not None:
+            self.wallet.key.clear()
         self.wallet = None
         if self.printer is not None:
             self.printer.clear()
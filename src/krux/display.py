@@ -24,6 +24,7 @@ import lcd
 import board
 from machine import I2C
 from .themes import theme
+from .qr_matrix import qr_matrix
 
 DEFAULT_PADDING = 10
 FONT_WIDTH, FONT_HEIGHT = board.config["krux"]["display"]["font"]
@@ -328,26 +329,35 @@ class Display:
         time.sleep_ms(duration)
         self.clear()
 
-    def add_qr_frame(self, qr_code):
-        """Add a 1 block white border around the code before displaying"""
-        qr_code = qr_code.strip()
-        lines = qr_code.split("\n")
-        size = len(lines)
-        size += 2
-        new_lines = ["0" * size]
-        for line in lines:
-            new_lines.append("0" + line + "0")
-        new_lines.append("0" * size)
-        return size, "\n".join(new_lines)
-
     def draw_qr_code(
         self, offset_y, qr_code, dark_color=QR_DARK_COLOR, light_color=QR_LIGHT_COLOR
     ):
-        """Draws a QR code on the screen"""
-        _, qr_code = self.add_qr_frame(qr_code)
-        lcd.draw_qr_code(
-            offset_y, qr_code, self.width(), dark_color, light_color, theme.bg_color
-        )
+        """Draws a QR code on the screen, scaled to the display's width with a
+        1 block light border, straight from its packed rows
+        """
+        qr_code = qr_matrix(qr_code)
+        size = qr_code.size + 2
+        scale = self.width() // size
+        offset = (self.width() - size * scale) // 2
+        offset_y += offset
+        self.fill_rectangle(offset, offset_y, size * scale, size * scale, light_color)
+        y = 0
+        while y < qr_code.size:
+            # Identical rows are drawn together as a taller band
+            row = qr_code.row(y)
+            height = 1
+            while y + height < qr_code.size and qr_code.row(y + height) == row:
+                height += 1
+            for x, length, dark in qr_code.runs(y):
+                if dark:
+                    self.fill_rectangle(
+                        offset + (x + 1) * scale,
+                        offset_y + (y + 1) * scale,
+                        length * scale,
+                        height * scale,
+                        dark_color,
+                    )
+            y += height
 
     def set_backlight(self, level):
         """Sets the backlight of the display to the given power level, from 0 to 8"""
@@ -166,12 +166,13 @@ class Input:
                 return None
             time.sleep_ms(10)
 
-    def wait_for_button(self, block=True):
+    def wait_for_button(self, block=True, wait_duration=QR_ANIM_PERIOD):
         """Waits for any button to release, optionally blocking if block=True.
-        Returns the button that was released, or None if nonblocking.
+        Returns the button that was released, or None if nonblocking and none
+        was pressed within wait_duration ms.
         """
         self.wait_for_release()
-        btn = self.wait_for_press(block)
+        btn = self.wait_for_press(block, wait_duration)
 
         if btn == BUTTON_ENTER:
             # Wait for release
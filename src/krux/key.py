@@ -21,6 +21,7 @@
 # THE SOFTWARE.
 # pylint: disable=W0102
 import time
+import hashlib
 
 try:
     import urandom as random
@@ -35,6 +36,36 @@ from .krux_settings import t
 DER_SINGLE = "m/84h/%dh/0h"
 DER_MULTI = "m/48h/%dh/0h/2h"
 
+PBKDF2_ROUNDS = 2048
+
+# Seed of the last (mnemonic, passphrase) derived in the session
+SEED_MEMO = {}
+
+
+def mnemonic_to_seed(mnemonic, passphrase=""):
+    """Returns the BIP-39 seed for the mnemonic and passphrase, reusing the
+    last derived seed when both are unchanged
+    """
+    if (mnemonic, passphrase) in SEED_MEMO:
+        return SEED_MEMO[(mnemonic, passphrase)]
+    # Raises ValueError for an invalid mnemonic
+    bip39.mnemonic_to_bytes(mnemonic)
+    seed = hashlib.pbkdf2_hmac(
+        "sha512",
+        mnemonic.encode("utf-8"),
+        ("mnemonic" + passphrase).encode("utf-8"),
+        PBKDF2_ROUNDS,
+        64,
+    )
+    SEED_MEMO.clear()
+    SEED_MEMO[(mnemonic, passphrase)] = seed
+    return seed
+
+
+def forget_seed():
+    """Drops the memoized seed"""
+    SEED_MEMO.clear()
+
 
 class Key:
     """Represents a BIP-39 mnemonic-based private key"""
@@ -44,11 +75,15 @@ class Key:
         self.multisig = multisig
         self.network = network
         self.root = bip32.HDKey.from_seed(
-            bip39.mnemonic_to_seed(mnemonic, passphrase), version=network["xprv"]
+            mnemonic_to_seed(mnemonic, passphrase), version=network["xprv"]
         )
         self.fingerprint = self.root.child(0).fingerprint
         self.derivation = self.get_default_derivation(self.multisig, network)
-        self.account = self.root.derive(self.derivation).to_public()
+        account = self.root.derive(self.derivation)
+        self.account = account.to_public()
+        # Private account node and its receive/change branches, kept so that
+        # signing never has to redo the hardened derivation from the root
+        self.signing_nodes = {None: account}
 
     def xpub(self, version=None):
         """Returns the xpub representation of the extended master public key"""
@@ -81,9 +116,24 @@ class Key:
         formatted_txt = t("Derivation: %s") if pretty else "%s"
         return formatted_txt % self.derivation
 
+    def signing_node(self, branch=None):
+        """Returns the private account node, or its receive (0) or change (1)
+        branch node, deriving and caching it on first use
+        """
+        if branch not in self.signing_nodes:
+            if branch not in (0, 1):
+                raise ValueError("invalid branch")
+            self.signing_nodes[branch] = self.signing_node().child(branch)
+        return self.signing_nodes[branch]
+
     def sign(self, message_hash):
         """Signs a message with the extended master private key"""
-        return self.root.derive(self.derivation).sign(message_hash)
+        return self.signing_node().sign(message_hash)
+
+    def clear(self):
+        """Drops the cached private nodes and the memoized seed"""
+        self.signing_nodes.clear()
+        forget_seed()
 
     @staticmethod
     def pick_final_word(entropy, words):
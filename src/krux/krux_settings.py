@@ -263,11 +263,13 @@ class PersistSettings(SettingsNamespace):
 
     namespace = "settings.persist"
     location = CategorySetting("location", FLASH_PATH, [FLASH_PATH, SD_PATH])
+    wallet_cache = CategorySetting("wallet_cache", False, [False, True])
 
     def label(self, attr):
         """Returns a label for UI when given a setting name or namespace"""
         return {
             "location": t("Location"),
+            "wallet_cache": t("Cache Wallets"),
         }[attr]
 
 
@@ -292,6 +294,40 @@ class EncryptionSettings(SettingsNamespace):
         }[attr]
 
 
+class ScannerSettings(SettingsNamespace):
+    """QR scanner settings"""
+
+    GRAYSCALE_TXT = "grayscale"
+    COLOR_TXT = "color"
+    namespace = "settings.scanner"
+    # Grayscale frames are half the size and faster to search for QR codes,
+    # Amigo keeps color by default for the quality of its larger preview
+    color_mode = CategorySetting(
+        "color_mode",
+        COLOR_TXT if board.config["type"].startswith("amigo") else GRAYSCALE_TXT,
+        [GRAYSCALE_TXT, COLOR_TXT],
+    )
+    PREVIEW_ALWAYS_TXT = "always"
+    PREVIEW_PERIODIC_TXT = "periodic"
+    PREVIEW_UNTIL_LOCK_TXT = "until_lock"
+    # M5StickV lens corrects and crops every preview for its small display, so
+    # it refreshes the preview periodically and leaves the rest to decoding
+    preview = CategorySetting(
+        "preview",
+        PREVIEW_PERIODIC_TXT
+        if board.config["type"] == "m5stickv"
+        else PREVIEW_ALWAYS_TXT,
+        [PREVIEW_ALWAYS_TXT, PREVIEW_PERIODIC_TXT, PREVIEW_UNTIL_LOCK_TXT],
+    )
+
+    def label(self, attr):
+        """Returns a label for UI when given a setting name or namespace"""
+        return {
+            "color_mode": t("Color Mode"),
+            "preview": t("Camera Preview"),
+        }[attr]
+
+
 class ThemeSettings(SettingsNamespace):
     """Theme settings"""
 
@@ -332,6 +368,7 @@ class Settings(SettingsNamespace):
         self.printer = PrinterSettings()
         self.persist = PersistSettings()
         self.appearance = ThemeSettings()
+        self.scanner = ScannerSettings()
         if board.config["type"].startswith("amigo"):
             self.touch = TouchSettings()
 
@@ -345,6 +382,7 @@ class Settings(SettingsNamespace):
             "persist": t("Persist"),
             "printer": t("Printer"),
             "appearance": t("Theme"),
+            "scanner": t("Scanner"),
         }
         if board.config["type"].startswith("amigo"):
             main_menu["touchscreen"] = t("Touchscreen")
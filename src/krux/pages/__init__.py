@@ -38,7 +38,7 @@ from ..input import (
     PRESSED,
 )
 from ..display import DEFAULT_PADDING, FLASH_MSG_TIME
-from ..qr import to_qr_codes
+from ..qr import to_qr_codes, QRCodeCache
 from ..krux_settings import t, Settings, LoggingSettings, BitcoinSettings
 from ..printers.cnc import FilePrinter
 from ..sd_card import SDHandler
@@ -54,6 +54,7 @@ WAIT_TO_CHECK_INPUT = 200
 ANTI_GLARE_WAIT_TIME = 500
 QR_CODE_STEP_TIME = 100
 CAMERA_INIT_TIME = 1000
+PREFETCH_STEP_TIME = 50  # ms of prefetching between input polls
 
 LIST_FILE_DIGITS = 9  # len on large devices per menu item
 LIST_FILE_DIGITS_SMALL = 5  # len on small devices per menu item
@@ -255,6 +256,14 @@ class Page:
             code, qr_format = self.ctx.camera.capture_qr_code_loop(callback)
         except:
             self.ctx.log.exception("Exception occurred capturing QR code")
+        self.ctx.log.debug(
+            "Captured QR Code at %s fps (%s ms decode, %s ms preview per frame)"
+            % (
+                self.ctx.camera.fps,
+                self.ctx.camera.decode_time,
+                self.ctx.camera.preview_time,
+            )
+        )
         if self.ctx.light:
             self.ctx.light.turn_off()
         self.ctx.display.to_portrait()
@@ -305,20 +314,11 @@ class Page:
         in the specified format
         """
         done = False
-        i = 0
-        code_generator = to_qr_codes(data, self.ctx.display.qr_data_width(), qr_format)
+        frames = QRCodeCache(data, self.ctx.display.qr_data_width(), qr_format)
         self.ctx.display.clear()
         bright = theme.bg_color == WHITE
         while not done:
-            code = None
-            num_parts = 0
-            try:
-                code, num_parts = next(code_generator)
-            except:
-                code_generator = to_qr_codes(
-                    data, self.ctx.display.qr_data_width(), qr_format
-                )
-                code, num_parts = next(code_generator)
+            code, num_parts, i = frames.next_frame()
             if bright:
                 self.ctx.display.draw_qr_code(0, code, light_color=WHITE)
             else:
@@ -336,7 +336,6 @@ class Page:
                 theme.bg_color,
             )
             self.ctx.display.draw_hcentered_text(subtitle, offset_y)
-            i = (i + 1) % num_parts
             # There are cases we can allow any btn to change the screen
             btn = self.wait_for_proceed_qr(block=num_parts == 1, any_btn=allow_any_btn)
             if btn == TOGGLE_BRIGHTNESS:
@@ -344,6 +343,7 @@ class Page:
             elif btn is True:
                 done = True
             # interval done in input.py using timers
+        frames.clear()
 
     def display_mnemonic(self, mnemonic):
         """Displays the 12 or 24-word list of words to the user"""
@@ -642,9 +642,10 @@ class Menu:
         )
         self.menu_view = ListView(self.menu, max_viewable)
 
-    def run_loop(self, start_from_index=None):
+    def run_loop(self, start_from_index=None, prefetch=None):
         """Runs the menu loop until one of the menu items returns either a MENU_EXIT
-        or MENU_SHUTDOWN status
+        or MENU_SHUTDOWN status. If given, prefetch is an iterator stepped while
+        the menu waits for input, so its work is done while the user reads it.
         """
         start_from_submenu = False
         selected_item_index = 0
@@ -667,7 +668,7 @@ class Menu:
                     return (self.menu_view.index(selected_item_index), status)
                 start_from_submenu = False
             else:
-                btn = self.ctx.input.wait_for_button()
+                btn, prefetch = self._wait_for_button(prefetch)
                 if self.ctx.input.touch is not None:
                     if btn == BUTTON_TOUCH:
                         selected_item_index = self.ctx.input.touch.current_index()
@@ -697,6 +698,24 @@ class Menu:
                 elif btn == SWIPE_DOWN:
                     self.menu_view.move_backward()
 
+    def _wait_for_button(self, prefetch):
+        """Waits for a button, running the prefetch iterator for up to
+        PREFETCH_STEP_TIME ms at a time between input polls until it is done.
+        Returns the button and what is left of the prefetch, or None.
+        """
+        while prefetch is not None:
+            started = time.ticks_ms()
+            for _ in prefetch:
+                if time.ticks_ms() > started + PREFETCH_STEP_TIME:
+                    break
+            else:
+                prefetch = None
+                break
+            btn = self.ctx.input.wait_for_button(block=False, wait_duration=0)
+            if btn is not None:
+                return btn, prefetch
+        return self.ctx.input.wait_for_button(), None
+
     def _clicked_item(self, selected_item_index):
         try:
             self.ctx.display.clear()
@@ -0,0 +1,419 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2023 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import gc
+from ..themes import theme
+from ..display import DEFAULT_PADDING
+from ..qr import FORMAT_NONE, FORMAT_PMOFN
+from ..krux_settings import t
+from ..sd_card import SDHandler
+from . import Page, Menu, MENU_CONTINUE, MENU_EXIT
+import board
+
+LIST_ADDRESS_QTD = 4  # qtd of address per page
+LIST_ADDRESS_DIGITS = 8  # len on large devices per menu item
+LIST_ADDRESS_DIGITS_SMALL = 4  # len on small devices per menu item
+
+SCAN_ADDRESS_LIMIT = 20
+BATCH_SCAN_ADDRESS_LIMIT = 100
+
+
+class Addresses(Page):
+    """Lists the wallet's addresses and checks scanned ones against them"""
+
+    def __init__(self, ctx):
+        super().__init__(ctx, None)
+
+    def list_address_type(self, addr_type=0):
+        """Handler for the 'receive addresses' or 'change addresses' menu item"""
+        # only show address for single-key or multisig with wallet output descriptor loaded
+        if self.ctx.wallet.is_loaded() or not self.ctx.wallet.is_multisig():
+            custom_start_digits = (
+                LIST_ADDRESS_DIGITS + 3
+            )  # 3 more because of bc1 address
+            custom_end_digts = LIST_ADDRESS_DIGITS
+            custom_separator = ". "
+            if board.config["type"] == "m5stickv":
+                custom_start_digits = (
+                    LIST_ADDRESS_DIGITS_SMALL + 3
+                )  # 3 more because of bc1 address
+                custom_end_digts = LIST_ADDRESS_DIGITS_SMALL
+                custom_separator = " "
+            start_digits = custom_start_digits
+
+            loading_txt = t("Loading receive address %d..")
+            if addr_type == 1:
+                loading_txt = t("Loading change address %d..")
+
+            num_checked = 0
+            while True:
+                items = []
+                if num_checked + 1 > LIST_ADDRESS_QTD:
+                    items.append(
+                        (
+                            "%d..%d" % (num_checked - LIST_ADDRESS_QTD, num_checked),
+                            lambda: MENU_EXIT,
+                        )
+                    )
+
+                for addr in self._address_page(num_checked, addr_type, loading_txt):
+                    if num_checked + 1 > 99:
+                        start_digits = custom_start_digits - 1
+                    pos_str = str(num_checked + 1)
+                    items.append(
+                        (
+                            pos_str
+                            + custom_separator
+                            + addr[:start_digits]
+                            + ".."
+                            + addr[len(addr) - custom_end_digts :],
+                            self.show_address,
+                            (addr, pos_str + ". " + addr),
+                        )
+                    )
+
+                    num_checked += 1
+
+                items.append(
+                    (
+                        "%d..%d" % (num_checked + 1, num_checked + LIST_ADDRESS_QTD),
+                        lambda: MENU_EXIT,
+                    )
+                )
+                items.append((t("Back"), lambda: MENU_EXIT))
+
+                submenu = Menu(self.ctx, items)
+                next_page = num_checked
+                stay_on_this_addr_menu = True
+                while stay_on_this_addr_menu:
+                    # Derive the next page while the user reads this one
+                    index, _ = submenu.run_loop(
+                        prefetch=self.ctx.wallet.prefetch_address_page(
+                            next_page, LIST_ADDRESS_QTD, addr_type
+                        )
+                    )
+
+                    # Back
+                    if index == len(submenu.menu) - 1:
+                        del submenu, items
+                        gc.collect()
+                        return MENU_CONTINUE
+                    # Next
+                    if index == len(submenu.menu) - 2:
+                        stay_on_this_addr_menu = False
+                    # Prev
+                    if index == 0 and num_checked > LIST_ADDRESS_QTD:
+                        stay_on_this_addr_menu = False
+                        num_checked -= 2 * LIST_ADDRESS_QTD
+
+        return MENU_CONTINUE
+
+    def _address_page(self, i, addr_type, loading_txt):
+        """Returns a page of LIST_ADDRESS_QTD addresses from index i, showing a
+        progress bar while any of them has to be derived
+        """
+        bar_y = self.ctx.display.height() - 2 * DEFAULT_PADDING
+
+        def progress(num_derived):
+            if num_derived == 1:
+                self.ctx.display.clear()
+                self.ctx.display.draw_centered_text(loading_txt % (i + 1))
+            self.ctx.display.fill_rectangle(
+                0,
+                bar_y,
+                self.ctx.display.width() * num_derived // LIST_ADDRESS_QTD,
+                DEFAULT_PADDING,
+                theme.fg_color,
+            )
+
+        return self.ctx.wallet.address_page(
+            i, LIST_ADDRESS_QTD, addr_type, progress=progress
+        )
+
+    def show_address(self, addr, title="", qr_format=FORMAT_NONE):
+        """Show addr provided as a QRCode"""
+        self.display_qr_codes(addr, qr_format, title, allow_any_btn=True)
+        self.print_qr_prompt(addr, qr_format, title)
+        return MENU_CONTINUE
+
+    def load_address_index(self, sd):
+        """Returns the wallet's address index from the SD card loaded into memory,
+        or None if there is no usable one
+        """
+        from ..address_index import AddressIndex
+
+        index = AddressIndex(self.ctx.wallet)
+        try:
+            with sd.open_binary(index.filename()) as file:
+                index.read_from(file)
+                index.load()
+        except (OSError, ValueError):
+            return None
+        return index
+
+    def lookup_indexed(self, scs, branches):
+        """Looks the scriptpubkeys up on the branches in the wallet's address index,
+        searched in place on the SD card. Returns the indexed depths and the
+        (branch, index) of every scriptpubkey, or None where it isn't indexed, or
+        None if there is no usable index
+        """
+        from ..address_index import AddressIndex
+
+        index = AddressIndex(self.ctx.wallet)
+        results = [None] * len(scs)
+        try:
+            with SDHandler() as sd:
+                with sd.open_binary(index.filename()) as file:
+                    index.read_from(file)
+                    for i, sc in enumerate(scs):
+                        for branch in branches:
+                            position = index.lookup(sc, branch)
+                            if position is not None:
+                                results[i] = (branch, position)
+                                break
+        except (OSError, ValueError):
+            return None
+        return index.depths, results
+
+    def index_addresses(self):
+        """Handler for the 'index addresses' menu item, extends the wallet's
+        address index on the SD card by ADDRESS_INDEX_STEP addresses per branch
+        """
+        from ..address_index import AddressIndex, ADDRESS_INDEX_STEP
+
+        loading_txts = [
+            t("Loading receive address %d.."),
+            t("Loading change address %d.."),
+        ]
+
+        def progress(branch, i):
+            if i % 10 == 0:
+                self.ctx.display.clear()
+                self.ctx.display.draw_centered_text(loading_txts[branch] % (i + 1))
+
+        try:
+            with SDHandler() as sd:
+                index = self.load_address_index(sd) or AddressIndex(self.ctx.wallet)
+                index.extend(ADDRESS_INDEX_STEP, progress)
+                sd.write_stream(index.filename(), index)
+        except OSError:
+            self.ctx.display.flash_text(t("SD card not detected"), theme.error_color)
+            return MENU_CONTINUE
+        self.ctx.display.flash_text(t("Indexed %d addresses") % sum(index.depths))
+        return MENU_CONTINUE
+
+    def scan_address(self, addr_type=0):
+        """Handler for the 'receive' or 'change' menu item"""
+        data, qr_format = self.capture_qr_code()
+        if data is None or qr_format != FORMAT_NONE:
+            self.ctx.display.flash_text(t("Failed to load address"), theme.error_color)
+            return MENU_CONTINUE
+
+        addr = None
+        try:
+            from ..wallet import parse_address
+
+            addr = parse_address(data)
+        except:
+            self.ctx.display.flash_text(t("Invalid address"), theme.error_color)
+            return MENU_CONTINUE
+
+        self.show_address(data, title=addr, qr_format=qr_format)
+
+        if self.ctx.wallet.is_loaded() or not self.ctx.wallet.is_multisig():
+            self.ctx.display.clear()
+            if not self.prompt(
+                t("Check that address belongs to this wallet?"),
+                self.ctx.display.height() // 2,
+            ):
+                return MENU_CONTINUE
+
+            checking_match_txt = t("Checking receive address %d for match..")
+            checked_no_match_txt = t("Checked %d receive addresses with no matches.")
+            is_valid_txt = t("%s\n\nis a valid receive address!")
+            not_found_txt = t("%s\n\nwas NOT FOUND in the first %d receive addresses")
+            if addr_type == 1:
+                checking_match_txt = t("Checking change address %d for match..")
+                checked_no_match_txt = t("Checked %d change addresses with no matches.")
+                is_valid_txt = t("%s\n\nis a valid change address!")
+                not_found_txt = t(
+                    "%s\n\nwas NOT FOUND in the first %d change addresses"
+                )
+
+            from embit.script import address_to_scriptpubkey
+
+            # Compare scriptpubkeys, so no candidate has to be encoded as an address
+            addr_sc = address_to_scriptpubkey(addr)
+            found = False
+            num_checked = 0
+            indexed = self.lookup_indexed([addr_sc], (addr_type,))
+            if indexed is not None:
+                depths, (result,) = indexed
+                found = result is not None
+                # Not found among the indexed addresses, continue past them
+                num_checked = result[1] + 1 if found else depths[addr_type]
+            while not found:
+                for some_sc in self.ctx.wallet.obtain_scriptpubkeys(
+                    num_checked, limit=SCAN_ADDRESS_LIMIT, branch_index=addr_type
+                ):
+                    self.ctx.display.clear()
+                    self.ctx.display.draw_centered_text(
+                        checking_match_txt % (num_checked + 1)
+                    )
+
+                    num_checked += 1
+
+                    found = addr_sc == some_sc
+                    if found:
+                        break
+
+                gc.collect()
+
+                if not found:
+                    self.ctx.display.clear()
+                    self.ctx.display.draw_centered_text(
+                        checked_no_match_txt % num_checked
+                    )
+                    if not self.prompt(
+                        t("Try more?"), self.ctx.display.bottom_prompt_line
+                    ):
+                        break
+
+            self.ctx.display.clear()
+            result_message = (
+                is_valid_txt % (str(num_checked) + ". \n\n" + addr)
+                if found
+                else not_found_txt % (addr, num_checked)
+            )
+            self.ctx.display.draw_centered_text(result_message)
+            self.ctx.input.wait_for_button()
+        return MENU_CONTINUE
+
+    def check_addresses(self):
+        """Handler for the 'check addresses' menu item, verifies a list of
+        addresses from a QR code or a file on the SD card in a single sweep of
+        the receive and change branches
+        """
+        data, qr_format = self.capture_qr_code()
+
+        if data is None:
+            # Try to read the addresses from a file on the SD card
+            qr_format = FORMAT_NONE
+            self.ctx.display.clear()
+            self.ctx.display.draw_centered_text(t("Checking for SD card.."))
+            try:
+                with SDHandler() as sd:
+                    self.ctx.display.clear()
+                    if self.prompt(
+                        t("Load addresses from SD card?"),
+                        self.ctx.display.height() // 2,
+                    ):
+                        filename = self.select_file()
+                        if filename:
+                            data = sd.read(filename[4:])  # remove "/sd/" prefix
+            except OSError:
+                pass
+
+        if data is None or qr_format not in (FORMAT_NONE, FORMAT_PMOFN):
+            self.ctx.display.flash_text(t("Failed to load address"), theme.error_color)
+            return MENU_CONTINUE
+
+        try:
+            from ..wallet import parse_addresses
+
+            addrs = parse_addresses(data)
+        except:
+            self.ctx.display.flash_text(t("Invalid address"), theme.error_color)
+            return MENU_CONTINUE
+
+        from embit.script import address_to_scriptpubkey
+
+        # (branch, index) of every address, or None while not found
+        results = [None] * len(addrs)
+        scs = [address_to_scriptpubkey(addr) for addr in addrs]
+        # Every sweep step matches all the pending addresses at once
+        pending = {sc.data: i for i, sc in enumerate(scs)}
+
+        num_checked = 0
+        indexed = self.lookup_indexed(scs, (0, 1))
+        if indexed is not None:
+            depths, indexed_results = indexed
+            for i, result in enumerate(indexed_results):
+                if result is not None:
+                    results[i] = result
+                    del pending[scs[i].data]
+            # What the index doesn't hold can only be past its depth
+            num_checked = min(depths)
+
+        wallet = self.ctx.wallet
+        while pending:
+            for receive_sc, change_sc in zip(
+                wallet.obtain_scriptpubkeys(num_checked, BATCH_SCAN_ADDRESS_LIMIT, 0),
+                wallet.obtain_scriptpubkeys(num_checked, BATCH_SCAN_ADDRESS_LIMIT, 1),
+            ):
+                if num_checked % 10 == 0:
+                    self.ctx.display.clear()
+                    self.ctx.display.draw_centered_text(
+                        t("Checking address %d for match..") % (num_checked + 1)
+                    )
+                for branch, sc in enumerate((receive_sc, change_sc)):
+                    i = pending.pop(sc.data, None)
+                    if i is not None:
+                        results[i] = (branch, num_checked)
+                num_checked += 1
+                if not pending:
+                    break
+
+            gc.collect()
+
+            if pending:
+                self.ctx.display.clear()
+                self.ctx.display.draw_centered_text(
+                    t("%d of %d addresses found")
+                    % (len(addrs) - len(pending), len(addrs))
+                )
+                if not self.prompt(t("Try more?"), self.ctx.display.bottom_prompt_line):
+                    break
+
+        self.ctx.display.clear()
+        self.ctx.display.draw_centered_text(
+            t("%d of %d addresses found") % (len(addrs) - len(pending), len(addrs))
+        )
+        self.ctx.input.wait_for_button()
+        is_valid_txts = [
+            t("%s\n\nis a valid receive address!"),
+            t("%s\n\nis a valid change address!"),
+        ]
+        for addr, result in zip(addrs, results):
+            self.ctx.display.clear()
+            if result is None:
+                self.ctx.display.draw_centered_text(
+                    t("%s\n\nwas NOT FOUND in the first %d receive or change addresses")
+                    % (addr, num_checked)
+                )
+            else:
+                branch, position = result
+                self.ctx.display.draw_centered_text(
+                    is_valid_txts[branch] % (str(position + 1) + ". \n\n" + addr)
+                )
+            self.ctx.input.wait_for_button()
+        return MENU_CONTINUE
@@ -21,9 +21,10 @@
 # THE SOFTWARE.
 
 import gc
+from embit.base import EmbitError
 from ..themes import theme
 from ..display import DEFAULT_PADDING
-from ..psbt import PSBTSigner
+from ..psbt import PSBTSigner, summary_message
 from ..qr import FORMAT_NONE, FORMAT_PMOFN
 from ..krux_settings import t, Settings, AES_BLOCK_SIZE
 from . import (
@@ -40,7 +41,6 @@ from ..sd_card import SDHandler
 
 from ..printers import create_printer
 from ..printers.cnc import FilePrinter
-import board
 import uos
 import time
 
@@ -55,13 +55,6 @@ WALLET_XPUB_START = 4
 # len of the xpub to show
 WALLET_XPUB_DIGITS = 4
 
-
-LIST_ADDRESS_QTD = 4  # qtd of address per page
-LIST_ADDRESS_DIGITS = 8  # len on large devices per menu item
-LIST_ADDRESS_DIGITS_SMALL = 4  # len on small devices per menu item
-
-SCAN_ADDRESS_LIMIT = 20
-
 FILE_SPECIAL = "0123456789()-.[]_~"
 
 PSBT_FILE_SUFFIX = "-signed"
@@ -69,6 +62,9 @@ PSBT_FILE_EXTENSION = ".psbt"
 MESSAGE_SIG_FILE_EXTENSION = ".sig"
 MESSAGE_SIG_FILE_SUFFIX = PSBT_FILE_SUFFIX
 
+# Errors a malformed or foreign PSBT can raise while checking or signing it
+PSBT_ERRORS = (ValueError, IndexError, KeyError, EmbitError)
+
 
 class Home(Page):
     """Home is the main menu page of the app"""
@@ -310,11 +306,11 @@ class Home(Page):
         self.ctx.display.draw_centered_text(t("Processing ..."))
 
         from ..encryption import EncryptedQRCode
-        import qrcode
+        from ..qr_matrix import QRMatrix
 
         encrypted_qr = EncryptedQRCode()
         qr_data = encrypted_qr.create(key, mnemonic_id, words, i_vector)
-        code = qrcode.encode_to_string(qr_data)
+        code = QRMatrix.encode(qr_data)
         del encrypted_qr
 
         from .qr_view import SeedQRView
@@ -393,11 +389,33 @@ class Home(Page):
             from ..wallet import Wallet
 
             wallet = Wallet(self.ctx.wallet.key)
-            wallet.load(wallet_data, qr_format)
+            # Wallets are only cached once the user opts in
+            cache_path = None
+            if Settings().persist.wallet_cache:
+                cache_path = "/%s/%s" % (
+                    Settings().persist.location,
+                    wallet.cache_filename(wallet_data),
+                )
+            cached = False
+            if cache_path is not None:
+                try:
+                    with open(cache_path, "rb") as file:
+                        wallet.load_cached(wallet_data, qr_format, file)
+                    cached = True
+                except (OSError, ValueError):
+                    pass
+            if not cached:
+                wallet.load(wallet_data, qr_format)
             self.ctx.display.clear()
             self.display_wallet(wallet, include_qr=False)
             if self.prompt(t("Load?"), self.ctx.display.bottom_prompt_line):
                 self.ctx.wallet = wallet
+                if cache_path is not None and not cached:
+                    try:
+                        with open(cache_path, "wb") as file:
+                            wallet.write_cache(file)
+                    except OSError:
+                        self.ctx.log.exception("Exception occurred caching wallet")
                 self.ctx.log.debug(
                     "Wallet output descriptor: %s"
                     % self.ctx.wallet.descriptor.to_string()
@@ -429,107 +447,21 @@ class Home(Page):
             )
             return MENU_CONTINUE
 
+        from .addresses import Addresses
+
+        addresses = Addresses(self.ctx)
         submenu = Menu(
             self.ctx,
             [
                 ((t("Scan Address"), self.pre_scan_address)),
-                (t("Receive Addresses"), self.list_address_type),
-                (t("Change Addresses"), lambda: self.list_address_type(1)),
+                (t("Receive Addresses"), addresses.list_address_type),
+                (t("Change Addresses"), lambda: addresses.list_address_type(1)),
                 (t("Back"), lambda: MENU_EXIT),
             ],
         )
         submenu.run_loop()
         return MENU_CONTINUE
 
-    def list_address_type(self, addr_type=0):
-        """Handler for the 'receive addresses' or 'change addresses' menu item"""
-        # only show address for single-key or multisig with wallet output descriptor loaded
-        if self.ctx.wallet.is_loaded() or not self.ctx.wallet.is_multisig():
-            custom_start_digits = (
-                LIST_ADDRESS_DIGITS + 3
-            )  # 3 more because of bc1 address
-            custom_end_digts = LIST_ADDRESS_DIGITS
-            custom_separator = ". "
-            if board.config["type"] == "m5stickv":
-                custom_start_digits = (
-                    LIST_ADDRESS_DIGITS_SMALL + 3
-                )  # 3 more because of bc1 address
-                custom_end_digts = LIST_ADDRESS_DIGITS_SMALL
-                custom_separator = " "
-            start_digits = custom_start_digits
-
-            loading_txt = t("Loading receive address %d..")
-            if addr_type == 1:
-                loading_txt = t("Loading change address %d..")
-
-            num_checked = 0
-            while True:
-                items = []
-                if num_checked + 1 > LIST_ADDRESS_QTD:
-                    items.append(
-                        (
-                            "%d..%d" % (num_checked - LIST_ADDRESS_QTD, num_checked),
-                            lambda: MENU_EXIT,
-                        )
-                    )
-
-                for addr in self.ctx.wallet.obtain_addresses(
-                    num_checked, limit=LIST_ADDRESS_QTD, branch_index=addr_type
-                ):
-                    self.ctx.display.clear()
-                    self.ctx.display.draw_centered_text(loading_txt % (num_checked + 1))
-
-                    if num_checked + 1 > 99:
-                        start_digits = custom_start_digits - 1
-                    pos_str = str(num_checked + 1)
-                    items.append(
-                        (
-                            pos_str
-                            + custom_separator
-                            + addr[:start_digits]
-                            + ".."
-                            + addr[len(addr) - custom_end_digts :],
-                            self.show_address,
-                            (addr, pos_str + ". " + addr),
-                        )
-                    )
-
-                    num_checked += 1
-
-                items.append(
-                    (
-                        "%d..%d" % (num_checked + 1, num_checked + LIST_ADDRESS_QTD),
-                        lambda: MENU_EXIT,
-                    )
-                )
-                items.append((t("Back"), lambda: MENU_EXIT))
-
-                submenu = Menu(self.ctx, items)
-                stay_on_this_addr_menu = True
-                while stay_on_this_addr_menu:
-                    index, _ = submenu.run_loop()
-
-                    # Back
-                    if index == len(submenu.menu) - 1:
-                        del submenu, items
-                        gc.collect()
-                        return MENU_CONTINUE
-                    # Next
-                    if index == len(submenu.menu) - 2:
-                        stay_on_this_addr_menu = False
-                    # Prev
-                    if index == 0 and num_checked > LIST_ADDRESS_QTD:
-                        stay_on_this_addr_menu = False
-                        num_checked -= 2 * LIST_ADDRESS_QTD
-
-        return MENU_CONTINUE
-
-    def show_address(self, addr, title="", qr_format=FORMAT_NONE):
-        """Show addr provided as a QRCode"""
-        self.display_qr_codes(addr, qr_format, title, allow_any_btn=True)
-        self.print_qr_prompt(addr, qr_format, title)
-        return MENU_CONTINUE
-
     def pre_scan_address(self):
         """Handler for the 'scan address' menu item"""
         # only show address for single-key or multisig with wallet output descriptor loaded
@@ -539,100 +471,29 @@ class Home(Page):
             )
             return MENU_CONTINUE
 
+        from .addresses import Addresses
+
+        addresses = Addresses(self.ctx)
         submenu = Menu(
             self.ctx,
             [
-                (t("Receive"), self.scan_address),
-                (t("Change"), lambda: self.scan_address(1)),
+                (t("Receive"), addresses.scan_address),
+                (t("Change"), lambda: addresses.scan_address(1)),
+                (t("Check Addresses"), addresses.check_addresses),
+                (t("Index Addresses"), addresses.index_addresses),
                 (t("Back"), lambda: MENU_EXIT),
             ],
         )
         submenu.run_loop()
         return MENU_CONTINUE
 
-    def scan_address(self, addr_type=0):
-        """Handler for the 'receive' or 'change' menu item"""
-        data, qr_format = self.capture_qr_code()
-        if data is None or qr_format != FORMAT_NONE:
-            self.ctx.display.flash_text(t("Failed to load address"), theme.error_color)
-            return MENU_CONTINUE
-
-        addr = None
-        try:
-            from ..wallet import parse_address
-
-            addr = parse_address(data)
-        except:
-            self.ctx.display.flash_text(t("Invalid address"), theme.error_color)
-            return MENU_CONTINUE
-
-        self.show_address(data, title=addr, qr_format=qr_format)
-
-        if self.ctx.wallet.is_loaded() or not self.ctx.wallet.is_multisig():
-            self.ctx.display.clear()
-            if not self.prompt(
-                t("Check that address belongs to this wallet?"),
-                self.ctx.display.height() // 2,
-            ):
-                return MENU_CONTINUE
-
-            checking_match_txt = t("Checking receive address %d for match..")
-            checked_no_match_txt = t("Checked %d receive addresses with no matches.")
-            is_valid_txt = t("%s\n\nis a valid receive address!")
-            not_found_txt = t("%s\n\nwas NOT FOUND in the first %d receive addresses")
-            if addr_type == 1:
-                checking_match_txt = t("Checking change address %d for match..")
-                checked_no_match_txt = t("Checked %d change addresses with no matches.")
-                is_valid_txt = t("%s\n\nis a valid change address!")
-                not_found_txt = t(
-                    "%s\n\nwas NOT FOUND in the first %d change addresses"
-                )
-
-            found = False
-            num_checked = 0
-            while not found:
-                for some_addr in self.ctx.wallet.obtain_addresses(
-                    num_checked, limit=SCAN_ADDRESS_LIMIT, branch_index=addr_type
-                ):
-                    self.ctx.display.clear()
-                    self.ctx.display.draw_centered_text(
-                        checking_match_txt % (num_checked + 1)
-                    )
-
-                    num_checked += 1
-
-                    found = addr == some_addr
-                    if found:
-                        break
-
-                gc.collect()
-
-                if not found:
-                    self.ctx.display.clear()
-                    self.ctx.display.draw_centered_text(
-                        checked_no_match_txt % num_checked
-                    )
-                    if not self.prompt(
-                        t("Try more?"), self.ctx.display.bottom_prompt_line
-                    ):
-                        break
-
-            self.ctx.display.clear()
-            result_message = (
-                is_valid_txt % (str(num_checked) + ". \n\n" + addr)
-                if found
-                else not_found_txt % (addr, num_checked)
-            )
-            self.ctx.display.draw_centered_text(result_message)
-            self.ctx.input.wait_for_button()
-        return MENU_CONTINUE
-
     def sign(self):
         """Handler for the 'sign' menu item"""
         submenu = Menu(
             self.ctx,
             [
                 (t("PSBT"), self.sign_psbt),
+                (t("PSBT Batch"), self.sign_psbt_batch),
                 (t("Message"), self.sign_message),
                 (t("Back"), lambda: MENU_EXIT),
             ],
@@ -642,8 +503,10 @@ class Home(Page):
             return MENU_CONTINUE
         return status
 
-    def sign_psbt(self):
-        """Handler for the 'sign psbt' menu item"""
+    def _proceed_without_descriptor(self):
+        """Warns if the wallet output descriptor is not loaded, returning whether
+        to proceed anyway
+        """
         if not self.ctx.wallet.is_loaded():
             self.ctx.display.draw_centered_text(
                 t(
@@ -651,11 +514,17 @@ class Home(Page):
                     Some checks cannot be performed."""
                 )
             )
-            if not self.prompt(t("Proceed?"), self.ctx.display.bottom_prompt_line):
-                return MENU_CONTINUE
+            return self.prompt(t("Proceed?"), self.ctx.display.bottom_prompt_line)
+        return True
+
+    def sign_psbt(self):
+        """Handler for the 'sign psbt' menu item"""
+        if not self._proceed_without_descriptor():
+            return MENU_CONTINUE
 
         # Try to read a PSBT from camera
         psbt_filename = ""
+        signer = None
         data, qr_format = self.capture_qr_code()
 
         if data is None:
@@ -713,32 +582,45 @@ class Home(Page):
                             if self.prompt(
                                 t("Load?"), self.ctx.display.bottom_prompt_line
                             ):
-                                data = sd.read_binary(psbt_filename)
+                                # Parse the PSBT straight from the file
+                                self.ctx.display.clear()
+                                self.ctx.display.draw_centered_text(t("Loading.."))
+                                with sd.open_binary(psbt_filename) as psbt_file:
+                                    signer = PSBTSigner(
+                                        self.ctx.wallet, psbt_file, FORMAT_PMOFN
+                                    )
             except OSError:
                 pass
 
-        if data is None:
+        if data is None and signer is None:
             # Both the camera and the file on SD card failed!
             self.ctx.display.flash_text(t("Failed to load PSBT"), theme.error_color)
             return MENU_CONTINUE
 
         # PSBT read OK! Will try to sign
-        self.ctx.display.clear()
-        self.ctx.display.draw_centered_text(t("Loading.."))
-
-        # TODO: FIX, FORMAT_UR increases QR Code data by a factor of 4.8 compared to FORMAT_PMOFN!!
-        qr_format = FORMAT_PMOFN if qr_format == FORMAT_NONE else qr_format
-        signer = PSBTSigner(self.ctx.wallet, data, qr_format)
-        self.ctx.log.debug("Received PSBT: %s" % signer.psbt)
+        if signer is None:
+            self.ctx.display.clear()
+            self.ctx.display.draw_centered_text(t("Loading.."))
+
+            # A single QR code may not fit the signed PSBT, return it as base64
+            # parts instead (UR and PMofN are returned in their own format)
+            qr_format = FORMAT_PMOFN if qr_format == FORMAT_NONE else qr_format
+            signer = PSBTSigner(self.ctx.wallet, data, qr_format)
+        self.ctx.log.debug(
+            "Received PSBT (%s): %s" % (signer.source_encoding, signer.psbt)
+        )
 
-        outputs = signer.outputs()
-        for message in outputs:
+        summary, messages = signer.outputs()
+        self.ctx.display.clear()
+        self.ctx.display.draw_centered_text(summary)
+        self.ctx.input.wait_for_button()
+        for message in messages:
             self.ctx.display.clear()
             self.ctx.display.draw_centered_text(message)
             self.ctx.input.wait_for_button()
 
         # memory management
-        del data, outputs
+        del data, summary, messages
         gc.collect()
 
         # If user confirm, Krux will sign
@@ -747,7 +629,7 @@ class Home(Page):
             self.ctx.log.debug("Signed PSBT: %s" % signer.psbt)
 
             qr_signed_psbt, qr_format = signer.psbt_qr()
-            serialized_signed_psbt = signer.psbt.serialize()
+            signed_psbt = signer.psbt
 
             # memory management
             del signer
@@ -782,7 +664,7 @@ class Home(Page):
 
                             # if user defined a filename and it is ok, save!
                             if not filename_undefined:
-                                sd.write_binary(psbt_filename, serialized_signed_psbt)
+                                sd.write_stream(psbt_filename, signed_psbt)
                                 self.ctx.display.clear()
                                 self.ctx.display.flash_text(
                                     t("Saved PSBT to SD card:\n%s") % psbt_filename
@@ -794,6 +676,130 @@ class Home(Page):
 
         return MENU_CONTINUE
 
+    def sign_psbt_batch(self):
+        """Handler for the 'psbt batch' menu item. Signs every PSBT in the folder of
+        the selected file after a single confirmation, writing the signed ones
+        next to them
+        """
+        if not self._proceed_without_descriptor():
+            return MENU_CONTINUE
+
+        self.ctx.display.clear()
+        self.ctx.display.draw_centered_text(t("Checking for SD card.."))
+        try:
+            with SDHandler() as sd:
+                selected_filename = self.select_file(file_extension=PSBT_FILE_EXTENSION)
+                if not selected_filename:
+                    return MENU_CONTINUE
+
+                # Files are opened relative to the SD card, without the "/sd/" prefix
+                folder = selected_filename[: selected_filename.rindex("/")]
+                prefix = folder[4:] + "/" if len(folder) > 3 else ""
+                psbt_filenames = [
+                    prefix + filename
+                    for filename in sorted(uos.listdir(folder))
+                    if filename.endswith(PSBT_FILE_EXTENSION)
+                    and not filename.endswith(PSBT_FILE_SUFFIX + PSBT_FILE_EXTENSION)
+                ]
+
+                # Validate every PSBT without signing it, keeping only its txid
+                # and totals. The wallet derivation cache is shared by all of them
+                batch = []
+                num_inputs = 0
+                inp_amount = 0
+                counts = [0, 0, 0]
+                amounts = [0, 0, 0]
+                for i, psbt_filename in enumerate(psbt_filenames):
+                    self.ctx.display.clear()
+                    self.ctx.display.draw_centered_text(
+                        t("Loading..") + "\n\n%d/%d" % (i + 1, len(psbt_filenames))
+                    )
+                    try:
+                        with sd.open_binary(psbt_filename) as psbt_file:
+                            signer = PSBTSigner(
+                                self.ctx.wallet, psbt_file, FORMAT_PMOFN
+                            )
+                        _, amount, kind_counts, kind_amounts = signer.classify_outputs()
+                        signer.check_signable()
+                        txid = signer.psbt.tx.txid()
+                    except PSBT_ERRORS:
+                        self.ctx.log.exception(
+                            "Exception occurred loading PSBT %s" % psbt_filename
+                        )
+                        self.ctx.display.flash_text(
+                            t("Failed to load PSBT") + "\n\n" + psbt_filename,
+                            theme.error_color,
+                        )
+                        continue
+                    batch.append((psbt_filename, txid))
+                    num_inputs += len(signer.psbt.inputs)
+                    inp_amount += amount
+                    for kind in range(3):
+                        counts[kind] += kind_counts[kind]
+                        amounts[kind] += kind_amounts[kind]
+                    del signer
+                    gc.collect()
+
+                if not batch:
+                    self.ctx.display.flash_text(
+                        t("Failed to load PSBT"), theme.error_color
+                    )
+                    return MENU_CONTINUE
+
+                self.ctx.display.clear()
+                self.ctx.display.draw_centered_text(
+                    (t("PSBTs: %d") % len(batch))
+                    + "\n\n"
+                    + summary_message(num_inputs, inp_amount, counts, amounts)
+                )
+                if not self.prompt(t("Sign?"), self.ctx.display.bottom_prompt_line):
+                    return MENU_CONTINUE
+
+                # Sign them one at a time, so only one is held in memory. A file
+                # that fails is reported and skipped, the others are still saved
+                started = time.ticks_ms()
+                saved = 0
+                for i, (psbt_filename, txid) in enumerate(batch):
+                    self.ctx.display.clear()
+                    self.ctx.display.draw_centered_text(
+                        t("Processing ...") + "\n\n%d/%d" % (i + 1, len(batch))
+                    )
+                    try:
+                        with sd.open_binary(psbt_filename) as psbt_file:
+                            signer = PSBTSigner(
+                                self.ctx.wallet, psbt_file, FORMAT_PMOFN
+                            )
+                        if signer.psbt.tx.txid() != txid:
+                            raise ValueError("PSBT changed: %s" % psbt_filename)
+                        signer.sign()
+                    except PSBT_ERRORS:
+                        self.ctx.log.exception(
+                            "Exception occurred signing PSBT %s" % psbt_filename
+                        )
+                        self.ctx.display.flash_text(
+                            t("Failed to load PSBT") + "\n\n" + psbt_filename,
+                            theme.error_color,
+                        )
+                        continue
+                    sd.write_stream(
+                        psbt_filename[: -len(PSBT_FILE_EXTENSION)]
+                        + PSBT_FILE_SUFFIX
+                        + PSBT_FILE_EXTENSION,
+                        signer.psbt,
+                    )
+                    saved += 1
+                    del signer
+                    gc.collect()
+
+                self.ctx.log.debug(
+                    "Signed %d PSBTs in %dms" % (saved, time.ticks_ms() - started)
+                )
+                self.ctx.display.flash_text(t("Saved %d PSBTs to SD card") % saved)
+        except OSError:
+            self.ctx.display.flash_text(t("Failed to load PSBT"), theme.error_color)
+
+        return MENU_CONTINUE
+
     def sign_message(self):
         """Handler for the 'sign message' menu item"""
 
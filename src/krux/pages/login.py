@@ -26,7 +26,7 @@ from embit import bip39
 from ..themes import theme
 from ..krux_settings import Settings
 from ..qr import FORMAT_UR
-from ..key import Key
+from ..key import Key, forget_seed
 from ..wallet import Wallet
 from ..printers import create_printer
 from ..krux_settings import t
@@ -396,6 +396,9 @@ class Login(Page):
                 self.ctx.display.height() // 2,
             ):
                 break
+            # Don't keep the seed of a rejected key memoized
+            del temp_key
+            forget_seed()
 
         submenu = Menu(
             self.ctx,
@@ -20,12 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import qrcode
 from embit.wordlists.bip39 import WORDLIST
 from . import Page
 from ..themes import theme, WHITE, BLACK
 from ..krux_settings import t, Settings
-from ..qr import get_size
+from ..qr_matrix import QRMatrix, qr_matrix
 from ..display import DEFAULT_PADDING, MIN_BACKLIGHT, Display
 from . import MENU_CONTINUE
 from ..printers.cnc import FilePrinter
@@ -55,7 +54,7 @@ class SeedQRView(Page):
         self.ctx = ctx
         self.binary = binary
         if code:
-            self.code = code
+            self.code = qr_matrix(code)
             self.title = title
         else:
             if self.binary:
@@ -64,7 +63,7 @@ class SeedQRView(Page):
             else:
                 self.title = t("SeedQR")
                 self.code = self._seed_qr()
-        self.qr_size = get_size(self.code)
+        self.qr_size = self.code.size
         self.region_size = 7 if self.qr_size == 21 else 5
         self.columns = (self.qr_size + self.region_size - 1) // self.region_size
         self.lr_index = 0
@@ -79,12 +78,12 @@ class SeedQRView(Page):
         for word in words:
             numbers += str("%04d" % WORDLIST.index(word))
         # qr_size = 25 if len(words) == 12 else 29
-        return qrcode.encode_to_string(numbers)  # , qr_size
+        return QRMatrix.encode(numbers)  # , qr_size
 
     def _binary_seed_qr(self):
         binary_seed = self._to_compact_seed_qr(self.ctx.wallet.key.mnemonic)
         # qr_size = 21 if len(binary_seed) == 16 else 25
-        return qrcode.encode_to_string(binary_seed)  # , qr_size
+        return QRMatrix.encode(binary_seed)  # , qr_size
 
     def _to_compact_seed_qr(self, mnemonic):
         mnemonic = mnemonic.split(" ")
@@ -98,7 +97,7 @@ class SeedQRView(Page):
     def highlight_qr_region(self, code, region=(0, 0, 0, 0), zoom=False):
         """Draws in white a highlighted region of the QR code"""
         reg_x, reg_y, reg_width, reg_height = region
-        size, code = self.ctx.display.add_qr_frame(code)
+        size = code.size + 2
         max_width = self.ctx.display.width()
         if zoom:
             max_width -= DEFAULT_PADDING
@@ -118,9 +117,7 @@ class SeedQRView(Page):
         offset = (self.ctx.display.width() - qr_width) // 2
         for y in range(reg_height):  # vertical blocks loop
             for x in range(reg_width):  # horizontal blocks loop
-                xy_index = (reg_y + y + 1) * (size + 1)
-                xy_index += reg_x + x + 1
-                if code[xy_index] == "0":
+                if not code.get(reg_x + x, reg_y + y):
                     self.ctx.display.fill_rectangle(
                         offset + (offset_x + x) * scale,
                         offset + (offset_y + y) * scale,
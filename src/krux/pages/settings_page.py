@@ -263,6 +263,14 @@ class SettingsPage(Page):
             if setting.attr == "theme":
                 theme.update()
 
+        # Opting out of the wallet cache deletes the cached wallets
+        if (
+            setting.attr == "wallet_cache"
+            and starting_category
+            and not setting.__get__(settings_namespace)
+        ):
+            self._delete_wallet_caches()
+
         # When changing locale, exit Login to force recreate with new locale
         if (
             setting.attr == "locale"
@@ -280,6 +288,22 @@ class SettingsPage(Page):
 
         return MENU_CONTINUE
 
+    def _delete_wallet_caches(self):
+        """Deletes the cached wallets from flash and the SD card"""
+        from ..wallet import delete_wallet_caches
+
+        deleted = 0
+        try:
+            deleted += delete_wallet_caches("/" + FLASH_PATH)
+        except OSError:
+            pass
+        try:
+            with SDHandler():
+                deleted += delete_wallet_caches("/" + SD_PATH)
+        except OSError:
+            pass
+        self.ctx.display.flash_text(t("Deleted %d cached wallets") % deleted)
+
     def number_setting(self, settings_namespace, setting):
         """Handler for viewing and editing a NumberSetting"""
 
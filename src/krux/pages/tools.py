@@ -214,9 +214,9 @@ class Tools(Page):
                 self.ctx.log.exception("Exception occurred connecting to printer")
 
             from .qr_view import SeedQRView
-            import qrcode
+            from ..qr_matrix import QRMatrix
 
-            code = qrcode.encode_to_string(text)
+            code = QRMatrix.encode(text)
             seed_qr_view = SeedQRView(self.ctx, code=code, title="Custom QR Code")
             return seed_qr_view.display_seed_qr()
         return MENU_CONTINUE
@@ -22,6 +22,7 @@
 # pylint: disable=W0231
 import math
 from ..krux_settings import Settings
+from ..qr_matrix import qr_matrix
 from ..wdt import wdt
 from . import Printer
 from ..sd_card import SDHandler
@@ -68,9 +69,8 @@ class GCodeGenerator(Printer):
 
     def print_qr_code(self, qr_code):
         """Prints a QR code, scaling it up as large as possible"""
-        size = 0
-        while qr_code[size] != "\n":
-            size += 1
+        qr_code = qr_matrix(qr_code)
+        size = qr_code.size
 
         cell_size = (self.part_size - (self.border_padding * 2)) / size
 
@@ -93,10 +93,7 @@ class GCodeGenerator(Printer):
                     x_index = x
                     if y % 2 == 0:
                         x_index = size - 1 - x
-                    cell = qr_code[y * (size + 1) + x_index]
-                    cut = (cell == "1" and not self.invert) or (
-                        cell == "0" and self.invert
-                    )
+                    cut = qr_code.get(x_index, y) != self.invert
                     if cut:
                         # Flip the y coord
                         self.cut_cell(x_index, size - 1 - y, cell_size, plunge_depth)
@@ -41,6 +41,7 @@ from machine import UART
 
 # from ..settings import CategorySetting, NumberSetting, SettingsNamespace
 from ..krux_settings import Settings
+from ..qr_matrix import qr_matrix
 
 # from ..krux_settings import t
 from ..wdt import wdt
@@ -179,9 +180,8 @@ class AdafruitPrinter(Printer):
 
     def print_qr_code(self, qr_code):
         """Prints a QR code, scaling it up as large as possible"""
-        size = 0
-        while qr_code[size] != "\n":
-            size += 1
+        qr_code = qr_matrix(qr_code)
+        size = qr_code.size
 
         scale = Settings().printer.thermal.adafruit.paper_width // size
         scale *= Settings().printer.thermal.adafruit.scale
@@ -193,11 +193,10 @@ class AdafruitPrinter(Printer):
         for y in range(size):
             # Scale the line (width) by scaling factor
             line = 0
-            for char in qr_code[y * (size + 1) : y * (size + 1) + size]:
-                bit = int(char)
-                for _ in range(scale):
-                    line <<= 1
-                    line |= bit
+            for _, length, dark in qr_code.runs(y):
+                line <<= length * scale
+                if dark:
+                    line |= (1 << (length * scale)) - 1
             line_bytes = line.to_bytes(line_bytes_size, "big")
             # Print height * scale lines out to scale by
 
@@ -19,17 +19,30 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-from embit import script
-from embit.psbt import DerivationPath, PSBT
+from embit import bip32, script
+from embit.descriptor.arguments import Key as DescriptorKey, KeyOrigin
+from embit import compact
+from embit.psbt import DerivationPath, InputScope, PSBT, PSBTError
 from embit.finalizer import parse_multisig
 from ur.ur import UR
 import urtypes
 from urtypes.crypto import CRYPTO_PSBT
-from .baseconv import base_encode, base_decode
+from .baseconv import base_encode, base_decode, B43LOOKUP, B58LOOKUP
 from .format import satcomma
 from .krux_settings import t
 from .qr import FORMAT_PMOFN
 
+PSBT_MAGIC = b"psbt\xff"
+# PSBT_MAGIC in base64
+PSBT_BASE64_PREFIX = b"cHNidP"
+
+# Longest CBOR byte string header: the major type and a 4 byte length
+CBOR_BYTES_HEADER_MAX_SIZE = 5
+
+OUTPUT_SPEND = 0
+OUTPUT_SELF_TRANSFER = 1
+OUTPUT_CHANGE = 2
+
 
 class PSBTSigner:
     """Responsible for validating and signing PSBTs"""
@@ -39,6 +52,8 @@ class PSBTSigner:
         self.base_encoding = None
         self.ur_type = None
         self.qr_format = qr_format
+        # Encoding the PSBT was read in: "ur", "binary" or the base number
+        self.source_encoding = None
         # Parse the PSBT
         if isinstance(psbt_data, UR):
             try:
@@ -46,50 +61,64 @@ class PSBTSigner:
                     urtypes.crypto.PSBT.from_cbor(psbt_data.cbor).data
                 )
                 self.ur_type = CRYPTO_PSBT
+                self.source_encoding = "ur"
                 # self.base_encoding = 64
             except:
                 raise ValueError("invalid PSBT")
         else:
+            stream = None
+            if hasattr(psbt_data, "read"):
+                # A binary file, e.g. on the SD card. Only text encoded PSBTs
+                # are read whole, binary ones are parsed straight from it
+                stream = psbt_data
+                psbt_data = stream.read(len(PSBT_MAGIC))
+                if psbt_data != PSBT_MAGIC:
+                    psbt_data += stream.read()
             # Process as bytes
             psbt_data = psbt_data.encode() if isinstance(psbt_data, str) else psbt_data
+            encoding = detect_encoding(psbt_data)
+            if encoding is None:
+                raise ValueError("invalid PSBT")
             try:
-                self.psbt = PSBT.parse(psbt_data)
-                if self.qr_format == FORMAT_PMOFN:
-                    # We can't return the PSBT as a multi-part sequence of bytes, so convert to
-                    # base64 first
-                    self.base_encoding = 64
+                if encoding == "binary":
+                    if stream is not None:
+                        # Parse straight from the file instead of reading it into
+                        # memory first, one input at a time
+                        stream.seek(0)
+                        self.psbt = StreamedPSBT.read_from(stream)
+                    else:
+                        self.psbt = PSBT.parse(psbt_data)
+                    if self.qr_format == FORMAT_PMOFN:
+                        # We can't return the PSBT as a multi-part sequence of bytes, so convert to
+                        # base64 first
+                        self.base_encoding = 64
+                else:
+                    self.psbt = PSBT.parse(base_decode(psbt_data, encoding))
+                    self.base_encoding = encoding
             except:
-                try:
-                    self.psbt = PSBT.parse(base_decode(psbt_data, 64))
-                    self.base_encoding = 64
-                except:
-                    try:
-                        self.psbt = PSBT.parse(base_decode(psbt_data, 58))
-                        self.base_encoding = 58
-                    except:
-                        try:
-                            self.psbt = PSBT.parse(base_decode(psbt_data, 43))
-                            self.base_encoding = 43
-                        except:
-                            raise ValueError("invalid PSBT")
+                raise ValueError("invalid PSBT")
+            self.source_encoding = encoding
         # Validate the PSBT
         # From: https://github.com/diybitcoinhardware/embit/blob/master/examples/change.py#L110
-        xpubs = self.xpubs()
+        self.validator = PolicyValidator(self.xpubs(), self.wallet.derivations)
         self.policy = None
         for inp in self.psbt.inputs:
             # get policy of the input
             try:
-                inp_policy = get_policy(inp, inp.witness_utxo.script_pubkey, xpubs)
+                # if policy is None - parse it in full from the first input
+                if self.policy is None:
+                    self.policy = self.validator.parse(
+                        inp, inp.witness_utxo.script_pubkey
+                    )
+                    continue
+                same_policy = self.validator.matches(
+                    inp, inp.witness_utxo.script_pubkey
+                )
             except:
                 raise ValueError("Unable to get policy")
-            # if policy is None - assign current
-            if self.policy is None:
-                self.policy = inp_policy
             # otherwise check that everything in the policy is the same
-            else:
-                # check policy is the same
-                if self.policy != inp_policy:
-                    raise ValueError("mixed inputs in the tx")
+            if not same_policy:
+                raise ValueError("mixed inputs in the tx")
 
         if is_multisig(self.policy) and not self.wallet.is_multisig():
             raise ValueError("multisig tx")
@@ -103,153 +132,148 @@ class PSBTSigner:
                 raise ValueError("policy mismatch")
 
     def outputs(self):
-        """Returns a list of messages describing where amounts are going"""
+        """Returns the summary message of where amounts are going and a generator
+        of the messages describing each output, built only as they are shown
+        """
+        # Classify the outputs up front, as only the totals are needed now
+        kinds, inp_amount, counts, amounts = self.classify_outputs()
+        summary = summary_message(len(self.psbt.inputs), inp_amount, counts, amounts)
+        return summary, self._output_messages(kinds)
+
+    def classify_outputs(self):
+        """Returns the kind of each output, the input amount and the count and
+        amount of the outputs of each kind
+        """
         inp_amount = 0
         for inp in self.psbt.inputs:
             inp_amount += inp.witness_utxo.value
-        resume_inputs_str = (
-            (t("Inputs (%d): ") % len(self.psbt.inputs))
-            + ("₿ %s" % satcomma(inp_amount))
-            + "\n\n"
-        )
-
-        self_transfer_list = []
-        change_list = []
-        spend_list = []
-
-        self_amount = 0
-        change_amount = 0
-        spend_amount = 0
-        resume_spend_str = ""
-        resume_self_or_change_str = ""
 
-        xpubs = self.xpubs()
+        kinds = bytearray(len(self.psbt.outputs))
+        counts = [0, 0, 0]
+        amounts = [0, 0, 0]
         for i, out in enumerate(self.psbt.outputs):
-            out_policy = get_policy(out, self.psbt.tx.vout[i].script_pubkey, xpubs)
-
-            address_from_my_wallet = False
-            # if policy is the same - probably change
-            if out_policy == self.policy:
-                # double-check that it's change
-                # we already checked in get_cosigners and parse_multisig
-                # that pubkeys are generated from cosigners,
-                # and witness script is corresponding multisig
-                # so we only need to check that scriptpubkey is generated from
-                # witness script
-
-                # empty script by default
-                sc = script.Script(b"")
-                # multisig, we know witness script
-                if self.policy["type"] == "p2wsh":
-                    sc = script.p2wsh(out.witness_script)
-                elif self.policy["type"] == "p2sh-p2wsh":
-                    sc = script.p2sh(script.p2wsh(out.witness_script))
-                # single-sig
-                elif "pkh" in self.policy["type"]:
-                    if len(list(out.bip32_derivations.values())) > 0:
-                        der = list(out.bip32_derivations.values())[0].derivation
-                        my_hd_prvkey = self.wallet.key.root.derive(der)
-                        if self.policy["type"] == "p2wpkh":
-                            sc = script.p2wpkh(my_hd_prvkey)
-                        elif self.policy["type"] == "p2sh-p2wpkh":
-                            sc = script.p2sh(script.p2wpkh(my_hd_prvkey))
-
-                address_from_my_wallet = (
-                    sc.data == self.psbt.tx.vout[i].script_pubkey.data
-                )
+            kind = self.output_kind(i, out)
+            kinds[i] = kind
+            counts[kind] += 1
+            amounts[kind] += self.psbt.tx.vout[i].value
+        return kinds, inp_amount, counts, amounts
+
+    def _output_messages(self, kinds):
+        # sequence of spend, then self_transfer, then change
+        for kind, message in (
+            (OUTPUT_SPEND, t("%d. Spend: \n\n%s\n\n")),
+            (OUTPUT_SELF_TRANSFER, t("%d. Self-transfer: \n\n%s\n\n")),
+            (OUTPUT_CHANGE, t("%d. Change: \n\n%s\n\n")),
+        ):
+            number = 0
+            for i, out_kind in enumerate(kinds):
+                if out_kind != kind:
+                    continue
+                number += 1
+                vout = self.psbt.tx.vout[i]
+                address = vout.script_pubkey.address(network=self.wallet.key.network)
+                yield (message % (number, address)) + ("₿ %s" % satcomma(vout.value))
+
+    def output_kind(self, i, out):
+        """Returns whether the output at index i spends, self-transfers or is change"""
+        # if policy is the same - probably change
+        if not self.validator.matches(out, self.psbt.tx.vout[i].script_pubkey):
+            # Address is from other wallet
+            return OUTPUT_SPEND
+
+        # double-check that it's change
+        # we already checked in PolicyValidator and parse_multisig
+        # that pubkeys are generated from cosigners,
+        # and witness script is corresponding multisig
+        # so we only need to check that scriptpubkey is generated from
+        # witness script
+
+        # empty script by default
+        sc = script.Script(b"")
+        derivations = list(out.bip32_derivations.values())
+        # multisig, we know witness script
+        if self.policy["type"] == "p2wsh":
+            sc = script.p2wsh(out.witness_script)
+        elif self.policy["type"] == "p2sh-p2wsh":
+            sc = script.p2sh(script.p2wsh(out.witness_script))
+        # single-sig
+        elif "pkh" in self.policy["type"]:
+            if len(derivations) > 0:
+                my_hd_pubkey = self.derive_own(derivations[0].derivation)
+                if self.policy["type"] == "p2wpkh":
+                    sc = script.p2wpkh(my_hd_pubkey)
+                elif self.policy["type"] == "p2sh-p2wpkh":
+                    sc = script.p2sh(script.p2wpkh(my_hd_pubkey))
+
+        if sc.data != self.psbt.tx.vout[i].script_pubkey.data:
+            # Address is from other wallet
+            return OUTPUT_SPEND
+
+        # Address is from my wallet, is addr_type change?
+        if len(derivations) > 0 and derivations[0].derivation[3] == 1:
+            return OUTPUT_CHANGE
+        return OUTPUT_SELF_TRANSFER
+
+    def derive_own(self, derivation):
+        """Returns our key at the derivation, derived publicly from the account
+        xpub through the wallet derivation cache when the path is below it with
+        no hardened steps
+        """
+        account = self.wallet.key.account
+        account_derivation = bip32.parse_path(self.wallet.key.derivation)
+        depth = len(account_derivation)
+        if derivation[:depth] == account_derivation and all(
+            index < bip32.HARDENED_INDEX for index in derivation[depth:]
+        ):
+            return self.wallet.derivations.derive(account, derivation[depth:])
+        return self.wallet.key.root.derive(derivation)
 
-            # Address is from my wallet
-            if address_from_my_wallet:
-                # is addr_type change?
-                if (
-                    len(list(out.bip32_derivations.values())) > 0
-                    and list(out.bip32_derivations.values())[0].derivation[3] == 1
-                ):
-                    change_list.append(
-                        (
-                            self.psbt.tx.vout[i].script_pubkey.address(
-                                network=self.wallet.key.network
-                            ),
-                            self.psbt.tx.vout[i].value,
-                        )
-                    )
-                    change_amount += self.psbt.tx.vout[i].value
-                else:
-                    self_transfer_list.append(
-                        (
-                            self.psbt.tx.vout[i].script_pubkey.address(
-                                network=self.wallet.key.network
-                            ),
-                            self.psbt.tx.vout[i].value,
-                        )
-                    )
-                    self_amount += self.psbt.tx.vout[i].value
-            else:  # Address is from other wallet
-                spend_list.append(
-                    (
-                        self.psbt.tx.vout[i].script_pubkey.address(
-                            network=self.wallet.key.network
-                        ),
-                        self.psbt.tx.vout[i].value,
-                    )
+    def signing_key(self):
+        """Returns the cached private node to sign with, wrapped with its origin
+        so that only the non-hardened steps below it are derived per input.
+        Falls back to the root when an input of ours is outside the account.
+        """
+        key = self.wallet.key
+        account_derivation = bip32.parse_path(key.derivation)
+        depth = len(account_derivation)
+        branches = set()
+        for inp in self.psbt.inputs:
+            for derivation in inp.bip32_derivations.values():
+                if derivation.fingerprint != key.fingerprint:
+                    continue
+                if derivation.derivation[:depth] != account_derivation:
+                    return key.root
+                # The account key itself has no branch below it
+                branches.add(
+                    derivation.derivation[depth]
+                    if len(derivation.derivation) > depth
+                    else None
                 )
-                spend_amount += self.psbt.tx.vout[i].value
-
-        if len(spend_list) > 0:
-            resume_spend_str = (
-                (t("Spend (%d): ") % len(spend_list))
-                + ("₿ %s" % satcomma(spend_amount))
-                + "\n\n"
-            )
-
-        if len(self_transfer_list) + len(change_list) > 0:
-            resume_self_or_change_str = (
-                (
-                    t("Self-transfer or Change (%d): ")
-                    % (len(self_transfer_list) + len(change_list))
+        if len(branches) == 1:
+            branch = branches.pop()
+            if branch in (0, 1):
+                return DescriptorKey(
+                    key.signing_node(branch),
+                    origin=KeyOrigin(key.fingerprint, account_derivation + [branch]),
                 )
-                + ("₿ %s" % satcomma(self_amount + change_amount))
-                + "\n\n"
-            )
-
-        fee = inp_amount - spend_amount - self_amount - change_amount
-        resume_fee_str = t("Fee: ") + ("₿ %s" % satcomma(fee))
-
-        messages = []
-        # first screen - resume
-        messages.append(
-            resume_inputs_str
-            + resume_spend_str
-            + resume_self_or_change_str
-            + resume_fee_str
+        return DescriptorKey(
+            key.signing_node(), origin=KeyOrigin(key.fingerprint, account_derivation)
         )
 
-        # sequence of spend
-        for i, out in enumerate(spend_list):
-            messages.append(
-                (t("%d. Spend: \n\n%s\n\n") % (i + 1, out[0]))
-                + ("₿ %s" % satcomma(out[1]))
-            )
-
-        # sequence of self_transfer
-        for i, out in enumerate(self_transfer_list):
-            messages.append(
-                (t("%d. Self-transfer: \n\n%s\n\n") % (i + 1, out[0]))
-                + ("₿ %s" % satcomma(out[1]))
-            )
-
-        # sequence of change
-        for i, out in enumerate(change_list):
-            messages.append(
-                (t("%d. Change: \n\n%s\n\n") % (i + 1, out[0]))
-                + ("₿ %s" % satcomma(out[1]))
-            )
-
-        return messages
+    def check_signable(self):
+        """Raises a ValueError unless an input derives from the wallet key, without
+        signing anything
+        """
+        fingerprint = self.wallet.key.fingerprint
+        for inp in self.psbt.inputs:
+            for der in inp.bip32_derivations.values():
+                if der.fingerprint == fingerprint:
+                    return
+        raise ValueError("cannot sign")
 
     def sign(self):
         """Signs the PSBT"""
-        sigs_added = self.psbt.sign_with(self.wallet.key.root)
+        sigs_added = self.psbt.sign_with(self.signing_key())
         if sigs_added == 0:
             raise ValueError("cannot sign")
 
@@ -261,21 +285,34 @@ class PSBTSigner:
 
     def psbt_qr(self):
         """Returns the psbt in the same form it was read as a QR code"""
-        psbt_data = self.psbt.serialize()
-        if self.base_encoding is not None:
-            psbt_data = base_encode(psbt_data, self.base_encoding).decode()
-
-        # TODO: FIX data in the UR type. It increases the size of the data by a factor of 4.8 !!
         if self.ur_type == CRYPTO_PSBT:
+            # Never base encoded: the raw PSBT is serialized right after its CBOR
+            # byte string header, so the buffer is the minimal crypto-psbt CBOR
             return (
-                UR(
-                    CRYPTO_PSBT.type,
-                    urtypes.crypto.PSBT(psbt_data).to_cbor(),
-                ),
+                UR(CRYPTO_PSBT.type, self.serialize(cbor=True)),
                 self.qr_format,
             )
+
+        psbt_data = self.serialize()
+        if self.base_encoding is not None:
+            psbt_data = base_encode(psbt_data, self.base_encoding).decode()
         return psbt_data, self.qr_format
 
+    def serialize(self, cbor=False):
+        """Returns the PSBT serialized in a single pass into one growing buffer,
+        prefixed by its CBOR byte string header if cbor is True
+        """
+        # Room for the longest header, as the size is only known once written
+        reserved = CBOR_BYTES_HEADER_MAX_SIZE if cbor else 0
+        buffer = bytearray(reserved)
+        size = self.psbt.write_to(BufferWriter(buffer))
+        if cbor:
+            header = cbor_bytes_header(size)
+            start = reserved - len(header)
+            buffer[start:reserved] = header
+            del buffer[:start]
+        return buffer
+
     def xpubs(self):
         """Returns the xpubs in the PSBT mapped to their derivations, falling back to
         the wallet descriptor xpubs if not found
@@ -301,6 +338,112 @@ class PSBTSigner:
         return xpubs
 
 
+def summary_message(num_inputs, inp_amount, counts, amounts):
+    """Returns the message summarizing where the amounts of the inputs go, given
+    the count and amount of the outputs of each kind
+    """
+    resume_inputs_str = (
+        (t("Inputs (%d): ") % num_inputs) + ("₿ %s" % satcomma(inp_amount)) + "\n\n"
+    )
+
+    resume_spend_str = ""
+    if counts[OUTPUT_SPEND] > 0:
+        resume_spend_str = (
+            (t("Spend (%d): ") % counts[OUTPUT_SPEND])
+            + ("₿ %s" % satcomma(amounts[OUTPUT_SPEND]))
+            + "\n\n"
+        )
+
+    resume_self_or_change_str = ""
+    self_or_change_count = counts[OUTPUT_SELF_TRANSFER] + counts[OUTPUT_CHANGE]
+    if self_or_change_count > 0:
+        resume_self_or_change_str = (
+            (t("Self-transfer or Change (%d): ") % self_or_change_count)
+            + (
+                "₿ %s"
+                % satcomma(amounts[OUTPUT_SELF_TRANSFER] + amounts[OUTPUT_CHANGE])
+            )
+            + "\n\n"
+        )
+
+    fee = inp_amount - sum(amounts)
+    resume_fee_str = t("Fee: ") + ("₿ %s" % satcomma(fee))
+
+    return (
+        resume_inputs_str
+        + resume_spend_str
+        + resume_self_or_change_str
+        + resume_fee_str
+    )
+
+
+class StreamedInputScope(InputScope):
+    """Input scope that keeps only the spent output of a non_witness_utxo.
+    The previous transaction is hashed while it streams by and checked against
+    the input's txid, instead of being kept whole in memory. Every other key,
+    like the signatures of other cosigners, is kept.
+    """
+
+    def read_value(self, stream, k):
+        if k == b"\x00" and self.txid and self.vout is not None:
+            if self._txhash is not None:
+                raise PSBTError("Duplicated utxo value")
+            compact.read_from(stream)
+            self._utxo, self._txhash = self.TX_CLS.read_vout(stream, self.vout)
+            self.verify()
+            return
+        super().read_value(stream, k)
+
+
+class StreamedPSBT(PSBT):
+    """PSBT read with StreamedInputScope inputs"""
+
+    PSBTIN_CLS = StreamedInputScope
+
+
+class BufferWriter:
+    """Stream appending to a bytearray, which grows in place"""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def write(self, data):
+        """Appends data to the buffer"""
+        self.buffer.extend(data)
+        return len(data)
+
+
+def cbor_bytes_header(length):
+    """Returns the CBOR header (major type 2) of a byte string of the length"""
+    if length < 24:
+        return bytes([0x40 | length])
+    for info, size in ((24, 1), (25, 2), (26, 4)):
+        if length < 1 << (8 * size):
+            return bytes([0x40 | info]) + length.to_bytes(size, "big")
+    raise ValueError("too long")
+
+
+def detect_encoding(psbt_data):
+    """Returns the encoding of the PSBT bytes from their magic, prefix or character
+    set: "binary", 64, 58 or 43, or None if it can't be a PSBT
+    """
+    if psbt_data.startswith(PSBT_MAGIC):
+        return "binary"
+    if psbt_data.startswith(PSBT_BASE64_PREFIX):
+        return 64
+    if not psbt_data:
+        return None
+    # Any base58 string of a real PSBT has lowercase letters, so prefer it
+    # when the characters fit both sets
+    for encoding, lookup in ((58, B58LOOKUP), (43, B43LOOKUP)):
+        for char in psbt_data:
+            if not lookup[char]:
+                break
+        else:
+            return encoding
+    return None
+
+
 def is_multisig(policy):
     """Returns a boolean indicating if the policy is a multisig"""
     return (
@@ -312,34 +455,8 @@ def is_multisig(policy):
     )
 
 
-# From: https://github.com/diybitcoinhardware/embit/blob/master/examples/change.py#L41
-def get_cosigners(pubkeys, derivations, xpubs):
-    """Returns xpubs used to derive pubkeys using global xpub field from psbt"""
-    cosigners = []
-    for _, pubkey in enumerate(pubkeys):
-        if pubkey not in derivations:
-            raise ValueError("missing derivation")
-        der = derivations[pubkey]
-        for xpub in xpubs:
-            origin_der = xpubs[xpub]
-            # check fingerprint
-            if origin_der.fingerprint == der.fingerprint:
-                # check derivation - last two indexes give pub from xpub
-                if origin_der.derivation == der.derivation[:-2]:
-                    # check that it derives to pubkey actually
-                    if xpub.derive(der.derivation[-2:]).key == pubkey:
-                        # append strings so they can be sorted and compared
-                        cosigners.append(xpub.to_base58())
-                        break
-    if len(cosigners) != len(pubkeys):
-        raise ValueError("cannot get all cosigners")
-    return sorted(cosigners)
-
-
-# From: https://github.com/diybitcoinhardware/embit/blob/master/examples/change.py#L64
-def get_policy(scope, scriptpubkey, xpubs):
-    """Parse scope and get policy"""
-    # we don't know the policy yet, let's parse it
+def get_script_type(scope, scriptpubkey):
+    """Returns the script type of the scope, telling nested segwit apart"""
     script_type = scriptpubkey.script_type()
     # p2sh can be either legacy multisig, or nested segwit multisig
     # or nested segwit singlesig
@@ -351,11 +468,86 @@ def get_policy(scope, scriptpubkey, xpubs):
             and scope.redeem_script.script_type() == "p2wpkh"
         ):
             script_type = "p2sh-p2wpkh"
-    policy = {"type": script_type}
-    # expected multisig
-    if "p2wsh" in script_type and scope.witness_script is not None:
+    return script_type
+
+
+# From: https://github.com/diybitcoinhardware/embit/blob/master/examples/change.py#L41
+class PolicyValidator:
+    """Parses the policy of one scope in full, then checks that other scopes share
+    it without rebuilding it: by script type, threshold and the raw keys of the
+    cosigners their pubkeys derive from
+    """
+
+    def __init__(self, xpubs, cache=None):
+        self.cache = cache
+        # Candidate cosigners and their raw keys by (fingerprint, derivation)
+        self.origins = {}
+        for xpub, origin_der in xpubs.items():
+            origin = (origin_der.fingerprint, tuple(origin_der.derivation))
+            self.origins.setdefault(origin, []).append((xpub, xpub.serialize()))
+        self.policy = None
+        self.threshold = None
+        self.cosigner_keys = None
+
+    def parse(self, scope, scriptpubkey):
+        """Returns the policy of the scope, keeping it as the one to match"""
+        policy = {"type": get_script_type(scope, scriptpubkey)}
+        self.threshold = None
+        self.cosigner_keys = None
+        # expected multisig
+        if "p2wsh" in policy["type"] and scope.witness_script is not None:
+            self.threshold, cosigners = self.cosigners(scope)
+            self.cosigner_keys = sorted(key for _, key in cosigners)
+            policy.update(
+                {
+                    "m": self.threshold,
+                    "n": len(cosigners),
+                    # strings so they can be sorted and compared
+                    "cosigners": sorted(xpub.to_base58() for xpub, _ in cosigners),
+                }
+            )
+        self.policy = policy
+        return policy
+
+    def matches(self, scope, scriptpubkey):
+        """Returns a boolean indicating if the scope has the parsed policy"""
+        script_type = get_script_type(scope, scriptpubkey)
+        if script_type != self.policy["type"]:
+            return False
+        multisig = "p2wsh" in script_type and scope.witness_script is not None
+        if multisig != (self.cosigner_keys is not None):
+            return False
+        if not multisig:
+            return True
+        m, cosigners = self.cosigners(scope)
+        return (
+            m == self.threshold
+            and sorted(key for _, key in cosigners) == self.cosigner_keys
+        )
+
+    def cosigners(self, scope):
+        """Returns the multisig threshold of the scope and the (xpub, raw key) of
+        the cosigner each of its pubkeys is derived from
+        """
         m, pubkeys = parse_multisig(scope.witness_script)
-        # check pubkeys are derived from cosigners
-        cosigners = get_cosigners(pubkeys, scope.bip32_derivations, xpubs)
-        policy.update({"m": m, "n": len(cosigners), "cosigners": cosigners})
-    return policy
+        cosigners = []
+        for pubkey in pubkeys:
+            if pubkey not in scope.bip32_derivations:
+                raise ValueError("missing derivation")
+            der = scope.bip32_derivations[pubkey]
+            # check fingerprint and derivation - last two indexes give pub from xpub
+            origin = (der.fingerprint, tuple(der.derivation[:-2]))
+            for xpub, key in self.origins.get(origin, ()):
+                # check that it derives to pubkey actually
+                if self.derive(xpub, der.derivation[-2:]).key == pubkey:
+                    cosigners.append((xpub, key))
+                    break
+            else:
+                raise ValueError("cannot get all cosigners")
+        return m, cosigners
+
+    def derive(self, xpub, path):
+        """Derives through the derivation cache, if any"""
+        if self.cache is not None:
+            return self.cache.derive(xpub, path)
+        return xpub.derive(path)
@@ -22,15 +22,76 @@
 # pylint: disable=E1101
 import io
 import math
-import qrcode
 from ur.ur_encoder import UREncoder
 from ur.ur_decoder import URDecoder
 from ur.ur import UR
+from .qr_matrix import QRMatrix
 
 FORMAT_NONE = 0
 FORMAT_PMOFN = 1
 FORMAT_UR = 2
 
+QR_MODE_NUMERIC = 0
+QR_MODE_ALPHANUMERIC = 1
+QR_MODE_BYTE = 2
+
+QR_NUMERIC_CHARS = "0123456789"
+QR_ALPHANUMERIC_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:"
+
+# Character count indicator bits per mode for versions 1-9, 10-26 and 27-40
+QR_COUNT_BITS = ((10, 12, 14), (9, 11, 13), (8, 16, 16))
+
+# Data codewords available at error correction level L, the one we encode with,
+# for each QR version from 1 to 40
+QR_DATA_CODEWORDS = (
+    19,
+    34,
+    55,
+    80,
+    108,
+    136,
+    156,
+    194,
+    232,
+    274,
+    324,
+    370,
+    428,
+    461,
+    523,
+    589,
+    647,
+    721,
+    795,
+    861,
+    932,
+    1006,
+    1094,
+    1174,
+    1276,
+    1370,
+    1468,
+    1531,
+    1631,
+    1735,
+    1843,
+    1955,
+    2071,
+    2191,
+    2306,
+    2434,
+    2566,
+    2702,
+    2812,
+    2956,
+)
+
+# Number of last parsed payloads QRPartParser skips when captured again
+QR_PARSER_RECENT_PAYLOADS = 4
+
+# Memory budget for the encoded frames of an animated QR code
+QR_CACHE_MAX_BYTES = 48 * 1024
+
 
 class QRPartParser:
     """Responsible for parsing either a singular or animated series of QR codes
@@ -38,61 +99,118 @@ class QRPartParser:
     """
 
     def __init__(self):
-        self.parts = {}
+        self.parts = []
         self.total = -1
         self.format = None
         self.decoder = URDecoder()
+        self.recent = []
+        self.parsed = 0
+        self.expected = -1
+        self.received = None
+        self.buffer = None
+        self.part_len = 0
+        self.last_len = 0
 
     def parsed_count(self):
         """Returns the number of parsed parts so far"""
-        if self.format == FORMAT_UR:
-            # Single-part URs have no expected part indexes
-            if self.decoder.fountain_decoder.expected_part_indexes is None:
-                return 1 if self.decoder.result is not None else 0
-            completion_pct = self.decoder.estimated_percent_complete()
-            return math.ceil(completion_pct * self.total_count())
-        return len(self.parts)
+        return self.parsed
 
     def total_count(self):
         """Returns the total number of parts there should be"""
+        return self.expected
+
+    def _update_counts(self):
         if self.format == FORMAT_UR:
             # Single-part URs have no expected part indexes
             if self.decoder.fountain_decoder.expected_part_indexes is None:
-                return 1
-            return self.decoder.expected_part_count()
-        return self.total
+                self.expected = 1
+                self.parsed = 1 if self.decoder.result is not None else 0
+            else:
+                self.expected = self.decoder.expected_part_count()
+                completion_pct = self.decoder.estimated_percent_complete()
+                self.parsed = math.ceil(completion_pct * self.expected)
+        else:
+            self.expected = self.total
 
     def parse(self, data):
         """Parses the QR data, extracting part information"""
+        # Animated codes are captured several times in a row, skip the payloads
+        # just parsed instead of decoding them again
+        if data in self.recent:
+            return
+        self.recent.append(data)
+        if len(self.recent) > QR_PARSER_RECENT_PAYLOADS:
+            self.recent.pop(0)
+
         if self.format is None:
             self.format = detect_format(data)
 
         if self.format == FORMAT_NONE:
-            self.parts[1] = data
+            self.parts = [data]
             self.total = 1
+            self.parsed = 1
         elif self.format == FORMAT_PMOFN:
             part, index, total = parse_pmofn_qr_part(data)
-            self.parts[index] = part
-            self.total = total
+            self._receive_pmofn(part, index, total)
         elif self.format == FORMAT_UR:
             self.decoder.receive_part(data)
+        self._update_counts()
+
+    def _receive_pmofn(self, part, index, total):
+        if self.total == -1:
+            self.total = total
+            self.parts = [None] * total
+            self.received = bytearray((total + 7) // 8)
+        # Ignore parts from another sequence
+        if total != self.total or not 1 <= index <= total:
+            return
+        index -= 1
+        bit = 1 << (index & 7)
+        if self.received[index >> 3] & bit:
+            return
+        self.received[index >> 3] |= bit
+        self.parsed += 1
+
+        # Parts of a sequence are usually the same length but the last, so the
+        # first part that is not the last sizes a buffer for the whole payload
+        # and parts are copied into place as they arrive
+        part_bytes = part.encode()
+        last = index == total - 1
+        if self.buffer is None and not last:
+            self.part_len = len(part_bytes)
+            self.buffer = bytearray(self.part_len * total)
+        if self.buffer is not None and (
+            len(part_bytes) == self.part_len
+            or (last and len(part_bytes) <= self.part_len)
+        ):
+            offset = index * self.part_len
+            self.buffer[offset : offset + len(part_bytes)] = part_bytes
+            if last:
+                self.last_len = len(part_bytes)
+        else:
+            self.parts[index] = part
 
     def is_complete(self):
         """Returns a boolean indicating whether or not enough parts have been parsed"""
         if self.format == FORMAT_UR:
             return self.decoder.is_complete()
-        return (
-            self.total != -1
-            and self.parsed_count() == self.total_count()
-            and sum(self.parts.keys()) == sum(range(1, self.total + 1))
-        )
+        return self.total != -1 and self.parsed == self.total
 
     def result(self):
         """Returns the combined part data"""
         if self.format == FORMAT_UR:
             return UR(self.decoder.result.type, bytearray(self.decoder.result.cbor))
+        if self.format == FORMAT_NONE:
+            return self.parts[0]
+        if self.buffer is not None and self.parts.count(None) == self.total:
+            size = (self.total - 1) * self.part_len + self.last_len
+            return str(memoryview(self.buffer)[:size], "utf-8")
         code_buffer = io.StringIO("")
-        for _, part in sorted(self.parts.items()):
+        for index, part in enumerate(self.parts):
+            if part is None:
+                offset = index * self.part_len
+                size = self.last_len if index == self.total - 1 else self.part_len
+                part = str(memoryview(self.buffer)[offset : offset + size], "utf-8")
             code_buffer.write(part)
         code = code_buffer.getvalue()
         code_buffer.close()
@@ -103,9 +221,16 @@ def to_qr_codes(data, max_width, qr_format):
     """Returns the list of QR codes necessary to represent the data in the qr format, given
     the max_width constraint
     """
+    for part, num_parts in to_qr_parts(data, max_width, qr_format):
+        yield (QRMatrix.encode(part), num_parts)
+
+
+def to_qr_parts(data, max_width, qr_format):
+    """Returns the sequence of part payloads that to_qr_codes encodes, without
+    the cost of encoding each of them as a QR code
+    """
     if qr_format == FORMAT_NONE:
-        code = qrcode.encode_to_string(data)
-        yield (code, 1)
+        yield (data, 1)
     else:
         num_parts = find_min_num_parts(data, max_width, qr_format)
         while math.ceil(data_len(data) / num_parts) > 128:
@@ -120,14 +245,82 @@ def to_qr_codes(data, max_width, qr_format):
                     part = part_number + data[i * part_size :]
                 else:
                     part = part_number + data[i * part_size : i * part_size + part_size]
-                code = qrcode.encode_to_string(part)
-                yield (code, num_parts)
+                yield (part, num_parts)
         elif qr_format == FORMAT_UR:
             encoder = UREncoder(data, part_size, 0)
             while True:
                 part = encoder.next_part()
-                code = qrcode.encode_to_string(part)
-                yield (code, encoder.fountain_encoder.seq_len())
+                yield (part, encoder.fountain_encoder.seq_len())
+
+
+class QRCodeCache:
+    """Holds the encoded frames of a (possibly animated) QR code sequence so they
+    can be replayed in a loop without encoding each part again.
+
+    The parts come from a single generator kept alive for the whole display.
+    Frames of the first pass are kept up to max_bytes, and past the budget
+    only the part payloads are kept, so later loops encode them again without
+    splitting the data anew. For UR, cached pure fragments are interleaved
+    with fresh mixed fountain parts after the first pass, so a receiver that
+    missed a frame doesn't have to wait a full loop for it.
+    """
+
+    def __init__(self, data, max_width, qr_format, max_bytes=QR_CACHE_MAX_BYTES):
+        self.data = data
+        self.max_width = max_width
+        self.qr_format = qr_format
+        self.max_bytes = max_bytes
+        self.frames = {}
+        self.payloads = {}
+        self.cached_bytes = 0
+        self.num_parts = None
+        self.count = 0
+        self.parts = None
+        self.replay = 0
+
+    def next_frame(self):
+        """Returns the next (code, num_parts, index) frame of the sequence, wrapping
+        back to the first part after the last one
+        """
+        count = self.count
+        self.count += 1
+        if self.num_parts is None or count < self.num_parts:
+            return self._first_pass_frame(count)
+
+        index = count % self.num_parts
+        if self.qr_format == FORMAT_UR:
+            # Every other frame is a new mixed part from the fountain encoder
+            if (count - self.num_parts) % 2 == 0 and self.frames:
+                indexes = sorted(self.frames)
+                index = indexes[self.replay % len(indexes)]
+                self.replay += 1
+                return self.frames[index], self.num_parts, index
+            part, _ = next(self.parts)
+            return QRMatrix.encode(part), self.num_parts, index
+
+        code = self.frames.get(index)
+        if code is None:
+            code = QRMatrix.encode(self.payloads[index])
+        return code, self.num_parts, index
+
+    def _first_pass_frame(self, index):
+        if self.parts is None:
+            self.parts = to_qr_parts(self.data, self.max_width, self.qr_format)
+        part, self.num_parts = next(self.parts)
+        code = QRMatrix.encode(part)
+        if self.cached_bytes + len(code.data) <= self.max_bytes:
+            self.frames[index] = code
+            self.cached_bytes += len(code.data)
+        elif self.qr_format != FORMAT_UR:
+            self.payloads[index] = part
+        return code, self.num_parts, index
+
+    def clear(self):
+        """Releases all cached frames"""
+        self.frames = {}
+        self.payloads = {}
+        self.cached_bytes = 0
+        self.parts = None
 
 
 def get_size(qr_code):
@@ -145,13 +338,61 @@ def data_len(data):
     return len(data)
 
 
+def qr_version(part):
+    """Returns the smallest QR version (1 to 40) able to hold the part at the error
+    correction level we encode with, or None if the part does not fit any version
+    """
+    if isinstance(part, str):
+        if all(char in QR_NUMERIC_CHARS for char in part):
+            mode, length = QR_MODE_NUMERIC, len(part)
+        elif all(char in QR_ALPHANUMERIC_CHARS for char in part):
+            mode, length = QR_MODE_ALPHANUMERIC, len(part)
+        else:
+            mode, length = QR_MODE_BYTE, len(part.encode())
+    else:
+        mode, length = QR_MODE_BYTE, len(part)
+
+    if mode == QR_MODE_NUMERIC:
+        data_bits = 10 * (length // 3) + (0, 4, 7)[length % 3]
+    elif mode == QR_MODE_ALPHANUMERIC:
+        data_bits = 11 * (length // 2) + 6 * (length % 2)
+    else:
+        data_bits = 8 * length
+
+    for version in range(1, 41):
+        # Character count indicator width grows at versions 10 and 27
+        count_bits = QR_COUNT_BITS[mode][
+            0 if version < 10 else 1 if version < 27 else 2
+        ]
+        if 4 + count_bits + data_bits <= 8 * QR_DATA_CODEWORDS[version - 1]:
+            return version
+    return None
+
+
+def qr_byte_capacity(version):
+    """Returns how many bytes fit in a byte mode QR code of the given version"""
+    count_bits = QR_COUNT_BITS[QR_MODE_BYTE][0 if version < 10 else 1]
+    return (8 * QR_DATA_CODEWORDS[version - 1] - 4 - count_bits) // 8
+
+
 def find_min_num_parts(data, max_width, qr_format):
     """Finds the minimum number of QR parts necessary to encode the data in
     the specified format within the max_width constraint
     """
-    num_parts = 1
-    part_size = math.ceil(data_len(data) / num_parts)
+    max_version = min((max_width - 17) // 4, 40)
+    if max_version < 1:
+        raise ValueError("max_width too small")
+
+    # Part headers ("pMofN ", "ur:") are lowercase, so parts are always byte mode
+    # encoded. Any part count below this bound yields a first part larger than the
+    # capacity, so the search can start from it
+    capacity = qr_byte_capacity(max_version)
+    if qr_format == FORMAT_UR:
+        # Bytewords take two characters per byte
+        capacity //= 2
+    num_parts = max(1, math.ceil(data_len(data) / capacity))
     while True:
+        part_size = math.ceil(data_len(data) / num_parts)
         part = ""
         if qr_format == FORMAT_PMOFN:
             part_number = "p1of%d " % num_parts
@@ -159,14 +400,10 @@ def find_min_num_parts(data, max_width, qr_format):
         elif qr_format == FORMAT_UR:
             encoder = UREncoder(data, part_size, 0)
             part = encoder.next_part()
-        # The worst-case number of bytes needed to store one QR Code, up to and including
-        # version 40. This value equals 3918, which is just under 4 kilobytes.
-        if len(part) < 3918:
-            code = qrcode.encode_to_string(part)
-            if get_size(code) <= max_width:
-                break
+        version = qr_version(part)
+        if version is not None and version <= max_version:
+            break
         num_parts += 1
-        part_size = math.ceil(data_len(data) / num_parts)
     return num_parts
 
 
@@ -0,0 +1,113 @@
+# The MIT License (MIT)
+
+# Copyright (c) 2021-2023 Krux contributors
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+import qrcode
+
+
+class QRMatrix:
+    """A QR code packed one bit per module, most significant bit first and a set
+    bit for a dark module. Each row is padded to a whole number of bytes, so a
+    version 40 code takes 3.5KB instead of the 31KB of its text form.
+
+    border is the quiet zone, in modules, to render around the code on screen
+    """
+
+    def __init__(self, size, data=None, border=1):
+        self.size = size
+        self.border = border
+        self.row_len = (size + 7) // 8
+        self.data = bytearray(self.row_len * size) if data is None else data
+
+    @staticmethod
+    def encode(data, border=1):
+        """Encodes data as a QR code, returning it packed"""
+        return QRMatrix.from_text(qrcode.encode_to_string(data), border)
+
+    @staticmethod
+    def from_text(qr_code, border=1):
+        """Packs a QR code in the "0"/"1" text form returned by qrcode"""
+        size = qr_code.find("\n")
+        if size == -1:
+            size = len(qr_code)
+        matrix = QRMatrix(size, border=border)
+        row_len = matrix.row_len
+        padding = row_len * 8 - size
+        for y in range(size):
+            start = y * (size + 1)
+            row = int(qr_code[start : start + size], 2) << padding
+            matrix.data[y * row_len : (y + 1) * row_len] = row.to_bytes(row_len, "big")
+        return matrix
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, QRMatrix)
+            and self.size == other.size
+            and self.data == other.data
+        )
+
+    def get(self, x, y):
+        """Returns 1 if the module at x, y is dark, 0 otherwise. Modules outside
+        the code are light, as its quiet zone
+        """
+        if not (0 <= x < self.size and 0 <= y < self.size):
+            return 0
+        return (self.data[y * self.row_len + (x >> 3)] >> (7 - (x & 7))) & 1
+
+    def row(self, y):
+        """Returns row y as an int, with the leftmost module as its highest bit"""
+        start = y * self.row_len
+        row = int.from_bytes(self.data[start : start + self.row_len], "big")
+        return row >> (self.row_len * 8 - self.size)
+
+    def runs(self, y):
+        """Yields the (x, length, dark) runs of equal modules of row y"""
+        row = self.row(y)
+        start = 0
+        dark = (row >> (self.size - 1)) & 1
+        for x in range(1, self.size):
+            bit = (row >> (self.size - 1 - x)) & 1
+            if bit != dark:
+                yield (start, x - start, dark)
+                start = x
+                dark = bit
+        yield (start, self.size - start, dark)
+
+    def to_text(self, border=None):
+        """Renders the code in "0"/"1" text form, one row per line, surrounded
+        by border light modules (the quiet zone by default)
+        """
+        if border is None:
+            border = self.border
+        margin = "0" * border
+        blank = "0" * (self.size + 2 * border)
+        lines = [blank] * border
+        for y in range(self.size):
+            bits = bin(self.row(y))[2:]
+            lines.append(margin + "0" * (self.size - len(bits)) + bits + margin)
+        lines.extend([blank] * border)
+        return "\n".join(lines)
+
+
+def qr_matrix(qr_code):
+    """Returns the QR code as a QRMatrix, packing it if given in text form"""
+    if isinstance(qr_code, QRMatrix):
+        return qr_code
+    return QRMatrix.from_text(qr_code.strip())
@@ -55,6 +55,17 @@ class SDHandler:
         with open(SDHandler.PATH_STR % filename, "w") as file:
             file.write(data)
 
+    def write_stream(self, filename, obj):
+        """Writes obj into the filename through its write_to(stream) method, without
+        serializing it in memory first, truncating the file first
+        """
+        with open(SDHandler.PATH_STR % filename, "wb") as file:
+            obj.write_to(file)
+
+    def open_binary(self, filename):
+        """Opens the filename for reading in binary format and returns the file"""
+        return open(SDHandler.PATH_STR % filename, "rb")
+
     def read_binary(self, filename):
         """Reads the filename in binary format and returns the data"""
         with open(SDHandler.PATH_STR % filename, "rb") as file:
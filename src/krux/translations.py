@@ -20,4 +20,4 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # pylint: disable=C0301
-translation_table = {'pt-BR': {1185266064: '%d da %d multisig', 2004520398: '%d. Troco: \n\n%s\n\n', 3862364126: '%d. Autotransferência: \n\n%s\n\n', 3264377309: '%d. Gasto: \n\n%s\n\n', 2399232215: '%s\n\n é um endereço de troco válido!', 3921290840: '%s\n\né um endereço de recepção válido!', 1808355833: '%s\n\nNÃO FOI ENCONTRADO nos primeiros %d endereços de troco', 1306127065: '%s\n\nNÃO FOI ENCONTRADO nos primeiros %d endereços de recepção', 3772416878: ',', 248832578: '.', 2739590230: '12 palavras', 1310058127: '24 palavras', 2743272264: 'ABC', 1949634023: 'Sobre', 1517128857: 'Adafruit', 3270727197: 'Endereço', 2574498267: 'Entropia adicional da câmera necessária para o modo AES-CBC', 283202181: 'Alinhe a câmera e o Tiny Seed corretamente.', 88746165: 'Antirreflexo desativado', 1521033296: 'Antirreflexo ativado', 1056821534: 'Tem certeza?', 3247612282: 'Mnemônico BIP39', 3455872521: 'Voltar', 2541860807: 'Backing up bootloader..\n\n%d%%', 2256777600: 'Assinatura Inválida', 3937333362: 'Baudrate', 427617266: 'Bitcoin', 928727036: 'Borda', 213030954: 'CNC', 1207696150: 'Troco', 3126552510: 'Endereços de Troco', 2697733395: 'Mudanças salvas no cartão SD!', 388908871: 'Alterações só durarão até o desligamento.', 3442025874: 'Verifique o cartão SD', 3119547911: 'Verificar se este endereço pertence a carteira?', 2856261511: 'Endereço de troco %d não corresponde.', 2788541416: 'Endereço de recebimento %d não corresponde.', 2446472910: 'Verificando correspondência do endereço de troco %d ..', 2470115694: 'Verificando o cartão SD..', 3655273987: 'Verificando correspondência do endereço de recebimento %d ..', 2407028014: 'SeedQR Compacto', 4041895036: 'Continuar?', 4094072796: 'Gerar código QR', 167798282: 'Gerar código QR do texto?', 2767642191: 'Criado: ', 124617190: 'Profundidade de corte', 597912140: 'Método de corte', 2504034831: 'Decimal', 2751113454: 'Descriptografar?', 1016609898: 'Excluir arquivo?', 1364509700: 'Excluir Mnemônico', 4102535566: 'Profundidade da passagem', 2791699253: 'Derivação: %s', 1230133196: 'Armazenamento flash do dispositivo não detectado.', 3836852788: 'Feito?', 382368239: 'Driver', 374684711: 'Criptografar mnemônico', 1244124409: 'Código QR criptografado', 2968548114: 'Mnemonic criptografado não foi armazenado', 3315319371: 'Mnemônico criptografado foi armazenado com ID:', 350279787: 'Criptografia', 992186481: 'Modo de criptografia', 3504179008: 'Digite o número de cada palavra do seu mnemônico BIP-39, de 1 a 2048.', 1100685007: 'Digite o número de cada palavra do seu mnemônico BIP-39 como um número em hexadecimal, de 1 a 800.', 4090266642: 'Digite o número de cada palavra do seu mnemônico BIP-39 como um número em octal, de 1 a 4000.', 2780625730: 'Digite cada palavra do seu mnemônico BIP-39.', 784361051: 'Erro:\n%s', 1505332462: 'Esc', 3838465623: 'Explorar arquivos?', 1711312434: 'Chave Pública Estendida', 383371114: 'Falhou em descriptografar', 3048830188: 'Falhou ao carregar PSBT', 4192663412: 'Falhou ao carregar endereço', 1996021743: 'Falha ao carregar a chave', 1108715658: 'Falhou ao carregar mensagem', 1081425878: 'Falhou ao carregar mnemônico', 928667220: 'Falha ao carregar o descritor de saída', 1620572516: 'Falha ao carregar a senha', 2946146830: 'Falhou ao armazenar mnemônico', 1303554751: 'Taxa: ', 104500973: 'Taxa de Alimentação', 2526278892: 'Arquivo selecionado:\n\n%s', 3313339187: 'Nome do arquivo', 1982637349: 'O nome do arquivo %s existe no cartão SD, substituir?', 3737729752: 'Impressão digital: %s', 2542772894: 'Firmware excede o tamanho máximo: %d', 1406590538: 'Diâmetro da Fresa', 3086093110: 'Livre: ', 1893243331: 'Do armazenamento', 4120536442: 'GRBL', 299338213: 'Dê a este mnemônico um ID personalizado? Caso contrário, a impressão digital atual será usada', 602716148: 'Ir', 831562513: 'Intervalo de aquecimento', 2300171403: 'Tempo de aquecimento', 3580020863: 'Chave pública hexadecimal', 2691246967: 'Hexadecimal', 2736309107: 'Id já existe\n', 631342955: 'Entradas (%d): ', 2585599782: 'Endereço inválido', 2874529150: 'Bootloader inválido', 4093416954: 'Comprimento de mnemônico inválido', 1422874211: 'Chave pública inválida', 2443867979: 'Carteira inválida:\n%s', 4122897393: 'Invertido', 3000888649: 'Chave', 2686333978: 'Chave:', 4123798664: 'Krux\n\n\nVersão\n%s', 3835918229: 'Teste de impressão de QR krux', 766317539: 'Língua', 972436696: 'Atraso de Linha', 3596093890: 'Linha: ', 2820726296: 'Carregar Mnemônico', 1842226768: 'Carregar PSBT do cartão SD?', 1113467596: 'Carregar mensagem do cartão SD?', 669106195: 'Carregar um?', 3330705289: 'Carregar?', 2596531078: 'Carregando Câmera..', 596389387: 'Carregando endereço de troco %d..', 2538883522: 'Carregando endereço de recebimento %d..', 3159494909: 'Carregando..', 1177338798: 'Idioma', 2817059741: 'Local', 63976957: 'Nível de log', 86530918: 'Logging', 2917810189: 'Comprimento máximo excedido (%s)', 2030045667: 'Mensagem', 3928301843: 'Arquivo de assinatura faltando', 1948316555: 'Mnemônico', 2123991188: 'ID do mnemônico', 3911073154: 'ID de armazenamento', 570639842: 'Mnemônico não foi descriptografado', 1746030071: 'Mnemônico não foi criptografado', 1458925155: 'Modificado:', 1845376098: 'Multisig', 2939797024: 'Rede', 73574491: 'Novo Mnemônico', 2792272353: 'Novo firmware detectado.\n\nSHA256:\n%s\n\n\n\nInstalar?', 4063104189: 'Não', 3927838899: 'Sem senha BIP39', 4092516657: 'Jogadas insuficientes!', 1577637745: 'Octal', 2662729867: 'Iterações pbkdf2', 721090621: 'PSBT', 995862913: 'Pinte os pontos perfurados de preto para que possam ser detectados.', 2987800462: 'Largura do papel', 3050763890: 'Parte\n%d / %d', 3559456868: 'Tamanho da peça', 4249903283: 'Senha', 3712257341: 'Senha:', 140802882: 'Salvar', 1703779997: 'QR em Texto', 3561756278: 'Carregue um descritor da carteira', 784609464: 'Taxa de Mergulho', 3037062877: 'Imprimir QR de teste', 4278257699: 'Imprimir QR?\n\n%s\n\n', 516488026: 'Imprimir?\n\n%s\n\n', 1123106929: 'Impressora', 3903571079: 'Driver de impressora não está definido!', 2609799302: 'Imprimindo\n%d / %d', 844861889: 'Imprimindo ...', 2580599003: 'Seguir?', 556126964: 'Processando ...', 1848310591: 'Código QR', 710709610: 'Pino RX', 2697857197: 'Recebimento', 1746677167: 'Endereços de Recebimento', 364354944: 'Região: ', 1662254634: 'Revise os dados, edite se necessário', 2771583845: 'Role o dado pelo menos %d vezes para gerar um mnemônico.', 856795528: 'Jogadas:\n\n%s', 255086803: 'Jogadas: %d\n', 3976793317: 'Cartão SD', 2827687530: 'Cartão SD não detectado', 2736513298: 'Cartão SD não detectado.', 3593785196: 'SHA256 de jogadas:\n\n%s', 1143278725: 'Sha256 da imagem:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'Salvar PSBT no cartão SD?', 843701745: 'Salvar assinatura no cartão SD?', 242160059: 'PSBT salvo no cartão SD:\n%s', 3476501088: 'Assinatura salva no cartão SD:\n%s', 763824768: 'Escala', 4117455079: 'Escanear Endereço', 3219991109: 'Escanear a senha BIP39', 2537207336: 'Escanear código QR da chave', 4006316572: 'Escaneando as palavras 1-12 novamente', 2736506158: 'Escaneando as palavras 13-24', 266935239: 'SeedQR', 1698829144: 'Autotransferência ou Troco (%d): ', 473154195: 'Configurações', 1825881236: 'Desligar', 3672262613: 'Desligar para mudar o tema?', 2120776272: 'Desligando..', 1061961408: 'Assinar', 4282338366: 'Assinar?', 2710534130: 'Assinatura:\n\n%s', 1988416729: 'Mensagem assinada', 3672006076: 'PSBT assinada', 3279196260: 'Single-key', 4221794628: 'Total: ', 2309020186: 'Gastos (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Armazene na Flash', 720041451: 'Armazene no Cartão SD', 3514476519: 'Deslize para mudar de modo', 1898550184: 'TOQUE ou ENTER para capturar', 4228215415: 'Pino TX', 2612594937: 'Texto', 1454688268: 'Tema', 1180180513: 'Térmica', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (bits)', 725348723: 'Ferramentas', 3684696112: 'Limiar de toque', 2978718564: 'Touchscreen', 2732611775: 'Tentar mais?', 1487826746: 'Digitar a senha BIP39', 2061556020: 'Digite a chave', 2089395053: 'Unidade', 2845607430: 'Atualizando bootloader..\n\n%d%%', 4164597446: 'Atualização completa.\n\nDesligando..', 2736001501: 'Atualizando firmware..\n\n%d%%', 2674953168: 'Use uma superfície de fundo preta.', 2402455261: 'Use a entropia da câmera para criar um novo mnemônico', 236075140: 'Usado: ', 4003084591: 'Valor %s fora do alcance: [ %s, %s]', 4191058607: 'Pela câmera', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Por entrada manual', 2504354847: 'Aguarde a captura', 2297028319: 'Descritor de Carteira', 4232654916: 'Descritor da carteira', 2587172867: 'Descritor de saída da carteira carregado!', 2499782468: 'O descritor de saída da carteira não foi encontrado.', 1831109430: 'Atenção:\nDescritor de saída incompleto', 797660533: 'Palavra %d', 3742424146: 'Números de palavras', 2965123464: 'Palavras', 1303016265: 'Sim', 771968845: 'Suas alterações serão mantidas no armazenamento flash do dispositivo.', 2569054451: 'Suas alterações serão mantidas no cartão SD.'}, 'de-DE': {1185266064: '%d von %d Multisig', 2004520398: '%d. Änderung: \n\n%s\n\n', 3862364126: '%d. Selbstübertragung: \n\n%s\n\n', 3264377309: '%d. Ausgaben: \n\n%s\n\n', 2399232215: '%s\n\nist eine gültige Änderungsadresse!', 3921290840: '%s\n\nist eine gültige Empfangsadresse!', 1808355833: '  %s\n\nwurde in den ersten %d Änderungsadressen NICHT GEFUNDEN', 1306127065: '%s\n\nwurde in den ersten %d Empfangsadressen NICHT GEFUNDEN', 3772416878: '.', 248832578: ',', 2739590230: '12 Wörter', 1310058127: '24 Wörter', 2743272264: 'ABC', 1949634023: 'Über', 1517128857: 'Adafruit', 3270727197: 'Adresse', 2574498267: 'Zusätzliche Entropie aus der Kamera, die für den AES-CBC-Modus erforderlich ist', 283202181: 'Richten Sie die Kamera und Tiny Seed korrekt aus.', 88746165: 'Blendschutz deaktiviert', 1521033296: 'Blendschutz aktiviert', 1056821534: 'Bist du sicher?', 3247612282: 'BIP39 Mnemonic', 3455872521: 'Zurückkehren', 2541860807: 'Bootloader unterstützen..\n\n%d%%', 2256777600: 'Ungültige Unterschrift', 3937333362: 'Baudrate', 427617266: 'Bitcoin', 928727036: 'Randpolsterung', 213030954: 'CNC', 1207696150: 'Änderungsadresse', 3126552510: 'Änderungsadresse', 2697733395: 'Änderungen auf SD-Karte gespeichert!', 388908871: 'Änderungen dauern bis zum Herunterfahren.', 3442025874: 'Überprüfen Sie die SD -Karte', 3119547911: 'Überprüfen Sie die Adresse dieser Wallet gehört?', 2856261511: 'Überprüfte %d Änderungsadresse ohne Übereinstimmungen.', 2788541416: 'Überprüfte %d Empfängsadressen ohne Übereinstimmungen.', 2446472910: 'Überprüfen der Änderungsadresse %d auf Übereinstimmung.', 2470115694: 'Suche nach SD-Karte..', 3655273987: 'Überprüfen der Empfängsadresse %d auf Übereinstimmung.', 2407028014: 'Kompakt SeedQR', 4041895036: 'Fortsetzen?', 4094072796: 'Erstellen Sie QR -Code', 167798282: 'QR -Code aus dem Text erstellen?', 2767642191: 'Erstellt:', 124617190: 'Schnitttiefe', 597912140: 'Cut-Methode', 2504034831: 'Dezimal', 2751113454: 'Entschlüsseln?', 1016609898: 'Datei löschen?', 1364509700: 'Mnemonik löschen', 4102535566: 'Tiefe pro Durchgang', 2791699253: 'Ableitung: %s', 1230133196: 'Geräte-Flash-Speicher nicht erkannt.', 3836852788: 'Fertig?', 382368239: 'Driver', 374684711: 'Verschlüsseln Sie mnemonisch', 1244124409: 'Verschlüsselter QR -Code', 2968548114: 'Verschlüsseltes Mnemonik wurde nicht gespeichert', 3315319371: 'Verschlüsselter Mnemonik wurde mit ID gespeichert: ', 350279787: 'Verschlüsselung', 992186481: 'Verschlüsselungsmodus', 3504179008: 'Geben Sie jedes Wort Ihrer BIP-39 Mnemonic als Zahl von 1 bis 2048 ein.', 1100685007: 'Geben Sie jedes Wort Ihrer BIP-39-Mnemonik als Hexadezimalzahl von 1 bis 800 ein.', 4090266642: 'Geben Sie jedes Wort Ihrer BIP-39-Mnemonik als Oktalzahl von 1 bis 4000 ein.', 2780625730: 'Geben Sie jedes Wort Ihrer BIP-39 Mnemonic ein.', 784361051: 'Fehler:\n%s', 1505332462: 'Esc', 3838465623: 'Dateien erkunden?', 1711312434: 'Öffentlicher Schlüssel', 383371114: 'Versäumt zu entschlüsseln', 3048830188: 'PSBT könnte nicht geladen werden', 4192663412: 'Adresse könnte nicht geladen werden', 1996021743: 'Fehlgeschlagene Taste nicht laden', 1108715658: 'Nachricht konnte nicht geladen werden', 1081425878: 'Mnemonic könnte nicht geladen werden', 928667220: 'Ausgabedeskriptor konnte nicht geladen werden', 1620572516: 'Passphrase nicht laden', 2946146830: 'Mnemonisch nicht speichern', 1303554751: 'Gebühr: ', 104500973: 'Vorschubgeschwindigkeit', 2526278892: 'Datei ausgewählt:\n\n%s', 3313339187: 'Dateiname', 1982637349: 'Dateiname %s existiert auf SD-Karte, überschreiben?', 3737729752: 'Fingerabdruck: %s', 2542772894: 'Die Firmware übersteigt die maximale Größe: %d', 1406590538: 'Flötendurchmesser', 3086093110: 'Freier: ', 1893243331: 'Aus der Lagerung', 4120536442: 'GRBL', 299338213: 'Geben Sie diesem mnemonischen ID eine benutzerdefinierte ID?Andernfalls wird der aktuelle Fingerabdruck verwendet', 602716148: 'Go', 831562513: 'Wärmeintervall', 2300171403: 'Hitzezeit', 3580020863: 'Hex öffentlicher Schlüssel', 2691246967: 'Hexadezimal', 2736309107: 'ID existiert bereits\n', 631342955: 'Eingänge (%d): ', 2585599782: 'Ungültige Adresse', 2874529150: 'Ungültiger Bootloader', 4093416954: 'Ungültige mnemonische Lange', 1422874211: 'Ungültiger öffentlicher Schlüssel', 2443867979: 'Ungültige Wallet:\n%s', 4122897393: 'Umkehren', 3000888649: 'Taste', 2686333978: 'Taste:', 4123798664: 'Krux\n\n\nVersion\n%s', 3835918229: 'Krux -Drucker -Test QR', 766317539: 'Sprache', 972436696: 'Leitungsverzögerung', 3596093890: 'Linie: ', 2820726296: 'Mnemonic laden', 1842226768: 'PSBT von SD-Karte laden?', 1113467596: 'Nachricht von SD-Karte laden?', 669106195: 'Eine laden?', 3330705289: 'Laden?', 2596531078: 'Kamera laden..', 596389387: 'Lade Änderungsadresse %d..', 2538883522: 'Lade Empfangsadresse %d..', 3159494909: 'Wird geladen..', 1177338798: 'Gebietsschema', 2817059741: 'Speicherort', 63976957: 'Protokollebene', 86530918: 'Logging', 2917810189: 'Maximale Länge überschritten (%s)', 2030045667: 'Nachricht', 3928301843: 'Fehlende Signaturdatei', 1948316555: 'Mnemonic', 2123991188: 'Mnemonische ID', 3911073154: 'Mnemonische Speicher -ID', 570639842: 'Mnemonic wurde nicht entschlüsselt', 1746030071: 'Mnemonik war nicht verschlüsselt', 1458925155: 'Geändert:', 1845376098: 'Multisig', 2939797024: 'Netzwerk', 73574491: 'Neue Mnemonic', 2792272353: 'Neue Firmware erkannt.\n\nSHA256:\n%s\n\n\n\nInstallieren?', 4063104189: 'Nein', 3927838899: 'Keine bip39 Passphrase', 4092516657: 'Nicht genug Rollen!', 1577637745: 'Oktal', 2662729867: 'PBKDF2 -Iterationen', 721090621: 'PSBT', 995862913: 'Male gestanzte Punkte schwarz an, damit sie erkannt werden können.', 2987800462: 'Papierbreite', 3050763890: 'Teil\n%d / %d', 3559456868: 'Teilegröße', 4249903283: 'Passphrase', 3712257341: 'Passphrase:', 140802882: 'Speicher', 1703779997: 'Klartext-QR', 3561756278: 'Bitte laden Sie einen Brieftaschenausgangsbekriptor', 784609464: 'Tauchrate', 3037062877: 'TEST TEST QR', 4278257699: 'In QR drucken?\n\n%s\n\n', 516488026: 'Drucken?\n\n%s\n\n', 1123106929: 'Drucker', 3903571079: 'Druckertreiber nicht gesetzt!', 2609799302: 'Drucken\n%d / %d', 844861889: 'Drucken ...', 2580599003: 'Weitermachen?', 556126964: 'Wird bearbeitet ...', 1848310591: 'QR-Code', 710709610: 'RX Stift', 2697857197: 'Empfangsadresse', 1746677167: 'Empfangsadresse', 364354944: 'Region: ', 1662254634: 'Überprüfen Sie gescannte Daten und bearbeiten Sie sie bei Bedarf', 2771583845: 'Würfeln Sie mindestens %d Mal, um eine Eselsbrücke zu erzeugen.', 856795528: 'Rollen:\n\n%s', 255086803: 'Rollen: %d\n', 3976793317: 'SD-Karte', 2827687530: 'SD -Karte nicht erkannt', 2736513298: 'SD-Karte nicht erkannt.', 3593785196: 'SHA256 von Rollen:\n\n%s', 1143278725: 'SHA256 von Snapshot:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'PSBT auf SD-Karte speichern?', 843701745: 'Signatur auf SD-Karte speichern?', 242160059: 'PSBT auf SD-Karte gespeichert:\n%s', 3476501088: 'Signatur auf SD-Karte gespeichert:\n%s', 763824768: 'Skala', 4117455079: 'Adresse\nscannen', 3219991109: 'Scan bip39 Passphrase', 2537207336: 'Tastenschlüssel QR -Code scannen', 4006316572: 'Wörter 1-12 erneut scannen', 2736506158: 'Wörter 13-24 scannen', 266935239: 'Seedqr', 1698829144: 'Selbstübertragung oder Änderung (%d): ', 473154195: 'Einstellungen', 1825881236: 'Abschalten', 3672262613: 'Herunterfahren, um das Thema zu ändern?', 2120776272: 'Herunterfahren..', 1061961408: 'Unterzeichnen', 4282338366: 'Unterzeichnen?', 2710534130: 'Unterschrift:\n\n%s', 1988416729: 'Signierte Nachricht', 3672006076: 'Signiertes PSBT', 3279196260: 'Single-key', 4221794628: 'Kapazität: ', 2309020186: 'Ausgaben (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Auf Flash speichern', 720041451: 'Auf der SD -Karte speichern', 3514476519: 'Wischen Sie, um den Modus zu ändern', 1898550184: 'TOUCH oder ENTER zum Erfassen', 4228215415: 'TX Stift', 2612594937: 'Text', 1454688268: 'Thema', 1180180513: 'Thermisch', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (Bits)', 725348723: 'Werkzeug', 3684696112: 'Berühren Sie Schwellenwert', 2978718564: 'Touch-Screen', 2732611775: 'Mehr versuchen?', 1487826746: 'Typ BIP39 Passphrase', 2061556020: 'Geben Sie den Schlüssel ein', 2089395053: 'Einheit', 2845607430: 'Bootloader aktualisieren..\n\n%d%%', 4164597446: 'Upgrade abgeschlossen.\n\nHerunterfahren..', 2736001501: 'Firmware aktualisieren..\n\n%d%%', 2674953168: 'Verwenden Sie eine schwarze Hintergrundfläche.', 2402455261: 'Verwenden Sie die Entropie der Kamera, um eine neue Mnemonik zu erstellen', 236075140: 'Belegter: ', 4003084591: 'Wert %S außerhalb Bereich: [ %s, %s]', 4191058607: 'Über Kamera', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Über manuelle Eingabe', 2504354847: 'Warte auf die Gefangennahme', 2297028319: 'Wallet-Deskriptor', 4232654916: 'Brieftaschenausgang Deskriptor', 2587172867: 'Wallet-Ausgabedeskriptor geladen!', 2499782468: 'Wallet-Ausgabedeskriptor nicht gefunden.', 1831109430: 'Warnung:\nUnvollständiger Ausgabedeskriptor', 797660533: 'Wort %d', 3742424146: 'Wortzahlen', 2965123464: 'Wörter', 1303016265: 'Ja', 771968845: 'Änderungen werden im Flash-Speicher des Geräts gespeichert.', 2569054451: 'Ihre Änderungen werden auf der SD-Karte gespeichert.'}, 'fr-FR': {1185266064: '%d de %d multisignature', 2004520398: '%d. Changement : \n\n%s\n\n', 3862364126: '%d. Auto-transfert : \n\n%s\n\n', 3264377309: '%d. Dépense : \n\n%s\n\n', 2399232215: '%s\n\nest une adresse changement valide!', 3921290840: '%s\n\nest une adresse reçue valide!', 1808355833: 'INTROUVABLE dans les premières %d adresses de changement', 1306127065: '%s\n\nINTROUVABLE dans les premières %d adresses de reçues', 3772416878: '.', 248832578: ',', 2739590230: '12 mots', 1310058127: '24 mots', 2743272264: 'ABC', 1949634023: 'À propos', 1517128857: 'Adafruit', 3270727197: 'Adresse', 2574498267: 'Entropie supplémentaire de la caméra requise pour le mode AES-CBC', 283202181: 'Alignez correctement la caméra et Tiny Seed.', 88746165: 'Anti-éblouissement désactivé', 1521033296: 'Anti-éblouissement activé', 1056821534: 'Es-tu sûr?', 3247612282: 'BIP39 Mnémonique', 3455872521: 'Retour', 2541860807: 'Sauvegarde du chargeur de démarrage..\n\n%d%%', 2256777600: 'Mauvaise signature', 3937333362: 'Débit en bauds', 427617266: 'Bitcoin', 928727036: 'Rembourrage de bordure', 213030954: 'CNC', 1207696150: 'Changement', 3126552510: 'Adresses de Changement', 2697733395: 'Modifications enregistrées sur la carte SD!', 388908871: "Les modifications dureront jusqu'à l'arrêt.", 3442025874: 'Vérifiez la carte SD', 3119547911: "Vérifiez que l'adresse appartient à cette portefeuille?", 2856261511: 'Adresses %d changement vérifiées sans correspondance.', 2788541416: 'Adresses %d reçues vérifiées sans correspondance.', 2446472910: "Vérification de l'adresse changement %d pour correspondance..", 2470115694: 'Vérification de la carte SD..', 3655273987: "Vérification de l'adresse reçue %d pour correspondance..", 2407028014: 'SeedQR Compact', 4041895036: 'Continuer?', 4094072796: 'Créer du code QR', 167798282: 'Créer du code QR à partir du texte?', 2767642191: 'Créé:', 124617190: 'Profondeur de coupe', 597912140: 'Méthode de coupe', 2504034831: 'Décimal', 2751113454: 'Décrypter?', 1016609898: 'Supprimer le fichier?', 1364509700: 'Supprimer mnémonique', 4102535566: 'Profondeur par passage', 2791699253: 'Dérivation: %s', 1230133196: "Stockage flash de l'appareil non détecté.", 3836852788: 'Terminé?', 382368239: 'Conducteur', 374684711: 'Crypter mnémonique', 1244124409: 'Code QR crypté', 2968548114: "Le mnémonique crypté n'a pas été stocké", 3315319371: 'Mnémonique cryptée a été stockée avec ID:', 350279787: 'Chiffrement', 992186481: 'Mode de chiffrement', 3504179008: "Entrez chaque mot de votre BIP-39 mnémonique sous la forme d'un nombre 1 jusqu'à 2048.", 1100685007: "Entrez chaque mot de votre mnémonique BIP-39 sous la forme d'un nombre en hexadécimal de 1 à 800.", 4090266642: "Entrez chaque mot de votre mnémonique BIP-39 sous la forme d'un nombre en octal de 1 à 4000.", 2780625730: 'Entrez chaque mot de votre BIP-39 mnémonique.', 784361051: 'Erreur:\n%s', 1505332462: 'Esc', 3838465623: 'Explorer des fichiers?', 1711312434: 'Clé publique', 383371114: 'Échec de décrypter', 3048830188: 'Erreur de chargement PSBT', 4192663412: "Erreur de chargement d'adresse", 1996021743: 'Échec du chargement de la clé', 1108715658: 'Échec du chargement du message', 1081425878: 'Erreur de chargement mnémonique', 928667220: 'Échec du chargement du descripteur de sortie', 1620572516: 'Échec du chargement de la phrase secrète', 2946146830: 'Échec de stocker mnémonique', 1303554751: 'Frais: ', 104500973: "Taux d'alimentation", 2526278892: 'Fichier sélectionné :\n\n%s', 3313339187: 'Nom de fichier', 1982637349: 'Le nom de fichier %s existe sur la carte SD, écraser ?', 3737729752: 'Empreinte Digitale: %s', 2542772894: 'Le micrologiciel dépasse la taille maximale: %d', 1406590538: 'Diamètre de flûte', 3086093110: 'Libre: ', 1893243331: 'Du stockage', 4120536442: 'GRBL', 299338213: "Donnez à ce mnémonique un identifiant personnalisé?Sinon l'empreinte actuelle sera utilisée", 602716148: 'Go', 831562513: 'Intervalle de chauffe', 2300171403: 'Temps de chauffe', 3580020863: 'Clé public hexadécimal', 2691246967: 'Hexadécimal', 2736309107: 'Id existe déjà\n', 631342955: 'Entrées (%d) : ', 2585599782: 'Adresse invalide', 2874529150: 'Chargeur de démarrage invalide', 4093416954: 'Longueur mnémonique invalide', 1422874211: 'Clé publique non valide', 2443867979: 'Portefeuille invalide:\n%s', 4122897393: 'Inverser', 3000888649: 'Clé', 2686333978: 'Clé:', 4123798664: 'Krux\n\n\nVersion\n%s', 3835918229: "Test de l'imprimante Krux QR", 766317539: 'Langue', 972436696: 'Délai de Ligne', 3596093890: 'Ligne: ', 2820726296: 'Charger mnémonique', 1842226768: 'Charger PSBT de la carte SD ?', 1113467596: 'Charger le message de la carte SD ?', 669106195: "En charger qu'un?", 3330705289: 'Charger?', 2596531078: 'Caméra de Chargement..', 596389387: "Chargement de l'adresse de changement %d..", 2538883522: "Chargement de l'adresse de réception %d..", 3159494909: 'Chargement..', 1177338798: 'Paramètres régionaux', 2817059741: 'Emplacement', 63976957: 'Niveau de journalisation', 86530918: 'Enregistrement', 2917810189: 'Longueur maximale dépassée (% s)', 2030045667: 'Message', 3928301843: 'Fichier de signature manquant', 1948316555: 'Mnémonique', 2123991188: 'ID mnémonique', 3911073154: 'ID de stockage mnémonique', 570639842: "Mnémonique n'a pas été décryptée", 1746030071: "Mnémonique n'était pas cryptée", 1458925155: 'Modifié:', 1845376098: 'Multi\nsignature', 2939797024: 'Réseau', 73574491: 'Nouveau mnémonique', 2792272353: 'Nouveau micrologiciel détecté.\n\nSHA256:\n%s\n\n\n\nInstaller?', 4063104189: 'Non', 3927838899: 'Pas de phrase passante bip39', 4092516657: 'Pas assez de rouleaux !', 1577637745: 'Octale', 2662729867: 'Itérations pbkdf2', 721090621: 'PSBT', 995862913: "Peignez les points perforés en noir afin qu'ils puissent être détectés.", 2987800462: 'Largeur du papier', 3050763890: 'Partie\n%d / %d', 3559456868: 'Taille de la pièce', 4249903283: 'Phrase de passe', 3712257341: 'Phrass de passe:', 140802882: 'Persister', 1703779997: 'QR en Texte Brut', 3561756278: 'Veuillez charger un descripteur de sortie de portefeuille', 784609464: 'Taux de plongée', 3037062877: "Test d'impression QR", 4278257699: 'Imprimer en QR?\n\n%s\n\n', 516488026: 'Imprimer?\n\n%s\n\n', 1123106929: 'Imprimante', 3903571079: "Le conducteur d'imprimante n'est pas défini!", 2609799302: 'Impression\n%d / %d', 844861889: 'Impression ...', 2580599003: 'Procéder?', 556126964: 'Traitement ...', 1848310591: 'QR Code', 710709610: 'RX Fiche', 2697857197: 'Recevoir', 1746677167: 'Adresses de Réception', 364354944: 'Région: ', 1662254634: 'Examinez les données numérisées, modifiez-les si nécessaire', 2771583845: 'Lancez le dé au moins %d fois pour générer un mnémonique.', 856795528: 'Rouleaux:\n\n%s', 255086803: 'Rouleaux: %d\n', 3976793317: 'Carte SD', 2827687530: 'Carte SD non détectée', 2736513298: 'Carte SD non détectée.', 3593785196: 'SHA256 de rouleaux:\n\n%s', 1143278725: 'Sha256 de Snapshot:\n\n% s', 3338679392: 'SHA256:\n%s', 481947431: 'Enregistrer PSBT sur carte SD?', 843701745: 'Enregistrer la signature sur la carte SD?', 242160059: 'PSBT enregistré sur la carte SD:\n%s', 3476501088: 'Signature enregistrée sur la carte SD:\n%s', 763824768: "L'échelle", 4117455079: "Scannez l'adresse", 3219991109: 'Scan bip39 en phrase secrète', 2537207336: 'Scanner le code QR de la clé', 4006316572: 'Analyser à nouveau les mots 1 à 12', 2736506158: 'Analyser les mots 13 à 24', 266935239: 'Seedqr', 1698829144: 'Auto-transfert ou changement (%d): ', 473154195: 'Paramètres', 1825881236: 'Fermer', 3672262613: 'Arrêtez-vous pour changer le thème?', 2120776272: 'Éteindre..', 1061961408: 'Signature', 4282338366: 'Signature?', 2710534130: 'Signature:\n\n%s', 1988416729: 'Message signé', 3672006076: 'PSBT signé', 3279196260: 'Clé unique', 4221794628: 'Capacité: ', 2309020186: 'Dépense (%d) : ', 3355862324: 'Stackbit 1248', 3303592908: 'Stocker sur flash', 720041451: 'Stocker sur la carte SD', 3514476519: 'Faites glisser pour changer de mode', 1898550184: 'TOUCHEZ ou ENTER pour capturer', 4228215415: 'TX Fiche', 2612594937: 'Texte', 1454688268: 'Thème', 1180180513: 'Thermique', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (bits)', 725348723: 'Outils', 3684696112: 'Seuil Tactile', 2978718564: 'Écran Tactile', 2732611775: 'Réessayer?', 1487826746: 'Type Bip39 Plasque', 2061556020: 'Clé de type', 2089395053: 'Unité', 2845607430: 'Mise à jour du chargeur de démarrage..\n\n%d%%', 4164597446: 'Mise à niveau complète.\n\nÉteindre..', 2736001501: 'Mise à niveau du micrologiciel..\n\n%d%%', 2674953168: 'Utilisez une surface de fond noire.', 2402455261: "Utilisez l'entropie de la caméra pour créer un nouveau mnémonique", 236075140: 'Utilisé: ', 4003084591: 'Valeur% s hors de portée: [% s,% s]', 4191058607: 'Par caméra', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Par saisie manuelle', 2504354847: 'Attendez la capture', 2297028319: 'Descripteur de Portefeuille', 4232654916: 'Descripteur de sortie du portefeuille', 2587172867: 'Descripteur de sortie du portefeuille chargé!', 2499782468: 'Descripteur de sortie du portefeuille introuvable.', 1831109430: 'Attention:\nDescripteur de sortie incomplet', 797660533: 'Mot %d', 3742424146: 'Numéros de mots', 2965123464: 'Mots', 1303016265: 'Oui', 771968845: "Vos modifications seront conservées sur le stockage flash de l'appareil.", 2569054451: 'Vos modifications seront conservées sur la carte SD.'}, 'nl-NL': {1185266064: '%d van %d multisig', 2004520398: '%d. Wisselgeld: \n\n%s\n\n', 3862364126: '%d. Zelf overschrijving: \n\n%s\n\n', 3264377309: '%d. Uitgaven: \n\n%s\n\n', 2399232215: '%s\n\nis een valide wisselgeld-adres!', 3921290840: '%s\n\nis een valide ontvangst-adres!', 1808355833: '%s\n\nwerd NIET GEVONDEN in de eerste %d wisselgeld-adressen', 1306127065: '%s\n\nwerd NIET GEVONDEN in de eerste %d ontvangst-adressen', 3772416878: '.', 248832578: ',', 2739590230: '12 woorden', 1310058127: '24 woorden', 2743272264: 'ABC', 1949634023: 'Over', 1517128857: 'Adafruit', 3270727197: 'Adres', 2574498267: 'Aanvullende entropie van camera vereist voor AES-CBC modus', 283202181: 'Richt de camera en Tiny Seed op de juiste manier.', 88746165: 'Anti reflecterend uitgeschakeld', 1521033296: 'Anti reflecterend ingeschakeld', 1056821534: 'Weet je het zeker?', 3247612282: 'BIP-39 geheugensteun', 3455872521: 'Terug', 2541860807: 'Backup van de bootloader...\n\n%d%%', 2256777600: 'Ongeldige handtekening', 3937333362: 'Baudratio', 427617266: 'Bitcoin', 928727036: 'Rand opvulling', 213030954: 'CNC', 1207696150: 'Change', 3126552510: 'Adressen wijzigen', 2697733395: 'Wijzigingen aanhouden op SD kaart!', 388908871: 'Wijzigingen blijven van kracht tot afsluiten.', 3442025874: 'Controleer SD kaart', 3119547911: 'Controleer of dit adres bij deze portemonnee hoort?', 2856261511: 'Na %d geen wisselgeld-adressen gevonden.', 2788541416: 'Na %d geen ontvangst-adressen gevonden.', 2446472910: 'Wisselgeldadres %d controleren...', 2470115694: 'SD kaart controleren...', 3655273987: 'Ontvangstadres %d controleren...', 2407028014: 'Compact SeedQR', 4041895036: 'Doorgaan?', 4094072796: 'QR code maken', 167798282: 'QR code maken van tekst?', 2767642191: 'Aangemaakt:', 124617190: 'Snijdiepte', 597912140: 'Snijmethode', 2504034831: 'Decimaal', 2751113454: 'Ontsleutelen?', 1016609898: 'Bestand verwijderen?', 1364509700: 'Geheugensteun verwijderen', 4102535566: 'Diepte per pas', 2791699253: 'Afgeleide: %s', 1230133196: 'Opslag op apparaat is niet gedetecteerd.', 3836852788: 'Klaar?', 382368239: 'Driver', 374684711: 'Geheugensteun versleutelen', 1244124409: 'Versleutelde QR code', 2968548114: 'Versleutelde geheugensteun was niet opgeslagen', 3315319371: 'Versleutelde geheugensteun is opgeslagen met ID: ', 350279787: 'Versleutelen', 992186481: 'Versleutelen modus', 3504179008: 'Voer elk woord van jouw BIP-39 geheugensteun in als een nummer van 1 tot 2048.', 1100685007: 'Voer elk woord van jouw BIP-39 geheugensteun in als een hexadecimaal van 1 tot 800.', 4090266642: 'Voer elk woord van jouw BIP-39 geheugensteun in als een octaal van 1 tot 4000.', 2780625730: 'Voer elk woord van jouw BIP-39 geheugensteun.', 784361051: 'Fout:\n%s', 1505332462: 'Esc', 3838465623: 'Bestanden verkennen?', 1711312434: 'Uitgebreide publieke sleutel', 383371114: 'Ontsleutelen is niet gelukt', 3048830188: 'PSBT laden is niet gelukt', 4192663412: 'Adres laden is niet gelukt', 1996021743: 'Sleutel laden is niet gelukt', 1108715658: 'Bericht laden is niet gelukt', 1081425878: 'Geheugensteun laden is niet gelukt', 928667220: 'Descriptor laden is niet gelukt', 1620572516: 'Wachtwoord laden is niet gelukt', 2946146830: 'Geheugensteun opslaan is niet gelukt', 1303554751: 'Tarief: ', 104500973: 'Voedingssnelheid', 2526278892: 'Bestand geselecteerd:\n\n%s', 3313339187: 'Bestandsnaam', 1982637349: 'Bestandsnaam %s OVERSCHRIJVEN op SD kaart?', 3737729752: 'Vingerafdruk: %s', 2542772894: 'Firmware overschrijdt de maximale grootte: %d', 1406590538: 'Fluit diameter', 3086093110: 'Vrij: ', 1893243331: 'Uit data opslag', 4120536442: 'GRBL', 299338213: 'Eigen ID gebruiken voor geheugensteun? Anders vingerafdruk gebruiken', 602716148: 'Ga', 831562513: 'Warmte interval', 2300171403: 'Warmte tijd', 3580020863: 'Hex publieke sleutel', 2691246967: 'Hexadecimaal', 2736309107: 'ID bestaat al\n', 631342955: 'Invoer (%d): ', 2585599782: 'Ongeldig adres', 2874529150: 'Ongeldige bootloader', 4093416954: 'Ongeldige geheugensteun lengte', 1422874211: 'Ongeldige publieke sleutel', 2443867979: 'Ongeldige portemonnee:\n%s', 4122897393: 'Omkeren', 3000888649: 'Sleutel', 2686333978: 'Sleutel:', 4123798664: 'Krux\n\n\nVersie\n%s', 3835918229: 'Krux printer test QR', 766317539: 'Taal', 972436696: 'Lijn vertraging', 3596093890: 'Lijn: ', 2820726296: 'Geheugensteun laden', 1842226768: 'PSBT laden van SD kaart?', 1113467596: 'Bericht laden van SD kaart?', 669106195: 'Één laden?', 3330705289: 'Laden?', 2596531078: 'Camera laden...', 596389387: 'Wisselgeldadres %d laden...', 2538883522: 'Ontvangstadres %d laden...', 3159494909: 'Laden...', 1177338798: 'Taal:', 2817059741: 'Locatie', 63976957: 'Log niveau', 86530918: 'Loggen', 2917810189: 'Maximale lengte overschreden (%s)', 2030045667: 'Bericht', 3928301843: 'Handtekening bestand mist', 1948316555: 'Geheugensteun', 2123991188: 'Geheugensteun ID', 3911073154: 'Geheugensteun opslag ID', 570639842: 'Geheugensteun is niet ontsleuteld', 1746030071: 'Geheugensteun is niet versleuteld', 1458925155: 'Aangepast:', 1845376098: 'Multisig', 2939797024: 'Netwerk', 73574491: 'Geheugensteun maken', 2792272353: 'Nieuw firmware gevonden.\n\nSHA256:\n%s\n\n\n\nInstalleren?', 4063104189: 'Nee', 3927838899: 'Geen BIP-39 wachtwoord', 4092516657: 'Niet genoeg gedobbeld!', 1577637745: 'Octaal', 2662729867: 'PBKDF2 iteraties', 721090621: 'PSBT', 995862913: 'Maak geperforeerde stippen zwart zodat ze worden gedetecteerd.', 2987800462: 'Papier breedte', 3050763890: 'Deel\n%d / %d', 3559456868: 'Deel grootte', 4249903283: 'Wachtwoord', 3712257341: 'Wachtwoord:', 140802882: 'Aanhouden', 1703779997: 'Platte tekst QR', 3561756278: 'Laadt een portemonnee descriptor in', 784609464: 'Duik tarief', 3037062877: 'Test QR afdrukken', 4278257699: 'Afdrukken naar QR?\n\n%s\n\n', 516488026: 'Afdrukken?\n\n%s\n\n', 1123106929: 'Printer', 3903571079: 'Printer driver niet ingesteld!', 2609799302: 'Afdruk\n%d / %d', 844861889: 'Afdrukken...', 2580599003: 'Doorgaan?', 556126964: 'Verwerken...', 1848310591: 'QR code', 710709610: 'RX pin', 2697857197: 'Ontvangen', 1746677167: 'Ontvangstadres', 364354944: 'Regio: ', 1662254634: 'Controleer gescande gegevens en bewerk indien nodig', 2771583845: 'Dobbel een dobbelsteen minstens %d keer voor het genereren van een geheugensteun.', 856795528: 'Gedobbeld:\n\n%s', 255086803: 'Gedobbeld: %d\n', 3976793317: 'SD kaart', 2827687530: 'SD kaart niet gedetecteerd', 2736513298: 'SD kaart niet gedetecteerd.', 3593785196: 'Gedobbelde SHA256:\n\n%s', 1143278725: 'Momentopname van SHA256:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'PSBT opslaan op SD kaart?', 843701745: 'Handtekening bestand opslaan op SD kaart?', 242160059: 'Opgeslagen PSBT op SD kaart:\n%s', 3476501088: 'Opgeslagen handtekening bestanden op SD kaart:\n%s', 763824768: 'Schaal', 4117455079: 'Adres scannen', 3219991109: 'BIP-39 wachtwoord scannen', 2537207336: 'QR code sleutel scannen', 4006316572: 'Woorden 1 t/m 12 opnieuw scannen', 2736506158: 'Woorden 13 t/m 24 scannen', 266935239: 'SeedQR', 1698829144: 'Zelf overschrijving of wisselgeld (%d): ', 473154195: 'Instellingen', 1825881236: 'Afsluiten', 3672262613: 'Afsluiten voor veranderen van thema?', 2120776272: 'Bezig met afsluiten...', 1061961408: 'Ondertekenen', 4282338366: 'Ondertekenen?', 2710534130: 'Handtekening:\n\n%s', 1988416729: 'Bericht ondertekend', 3672006076: 'PSBT ondertekend', 3279196260: 'Enkele sleutel', 4221794628: 'Grootte: ', 2309020186: 'Uitgaven (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Opslaan op apparaat', 720041451: 'Opslaan op SD kaart', 3514476519: 'Verander modus', 1898550184: 'TIK of ENTER voor opname', 4228215415: 'TX pin', 2612594937: 'Tekst', 1454688268: 'Thema', 1180180513: 'Thermisch', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (Bits)', 725348723: 'Hulpmiddelen', 3684696112: 'Aanraak gevoeligheid', 2978718564: 'Aanraakscherm', 2732611775: 'Meer proberen?', 1487826746: 'Voer BIP-39 wachtwoord in', 2061556020: 'Voer sleutel in', 2089395053: 'Eenheid', 2845607430: 'Bootloader updaten...\n\n%d%%', 4164597446: 'Upgrade afgerond.\n\nBezig met afsluiten...', 2736001501: 'Firmware upgraden...\n\n%d%%', 2674953168: 'Gebruik een donker achergrond.', 2402455261: 'Gebruik de camera voor entropie voor het aanmaken van een nieuwe geheugensteun', 236075140: 'Gebruikt: ', 4003084591: 'Waarde %s is buiten bereik: [%s, %s]', 4191058607: 'Via camera', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Via handmatige invoer', 2504354847: 'Wacht op opname', 2297028319: 'Portemonnee descriptor', 4232654916: 'Portemonnee uitvoer descriptor', 2587172867: 'Portemonnee uitvoer descriptor geladen!', 2499782468: 'Portemonnee uitvoer descriptor niet gevonden.', 1831109430: 'Waarschuwing:\nIncomplete portemonnee uitvoer descriptor', 797660533: 'Woord %d', 3742424146: 'Woord nummers', 2965123464: 'Woorden', 1303016265: 'Yes', 771968845: 'Veranderingen worden opgeslagen in opslag van apparaat.', 2569054451: 'Veranderingen worden opgeslagen op SD kaart.'}, 'en-US': {1185266064: '%d of %d multisig', 2004520398: '%d. Change: \n\n%s\n\n', 3862364126: '%d. Self-transfer: \n\n%s\n\n', 3264377309: '%d. Spend: \n\n%s\n\n', 2399232215: '%s\n\nis a valid change address!', 3921290840: '%s\n\nis a valid receive address!', 1808355833: '%s\n\nwas NOT FOUND in the first %d change addresses', 1306127065: '%s\n\nwas NOT FOUND in the first %d receive addresses', 3772416878: ',', 248832578: '.', 2739590230: '12 words', 1310058127: '24 words', 2743272264: 'ABC', 1949634023: 'About', 1517128857: 'Adafruit', 3270727197: 'Address', 2574498267: 'Additional entropy from camera required for AES-CBC mode', 283202181: 'Align camera and Tiny Seed properly.', 88746165: 'Anti-glare disabled', 1521033296: 'Anti-glare enabled', 1056821534: 'Are you sure?', 3247612282: 'BIP39 Mnemonic', 3455872521: 'Back', 2541860807: 'Backing up bootloader..\n\n%d%%', 2256777600: 'Bad signature', 3937333362: 'Baudrate', 427617266: 'Bitcoin', 928727036: 'Border Padding', 213030954: 'CNC', 1207696150: 'Change', 3126552510: 'Change Addresses', 2697733395: 'Changes persisted to SD card!', 388908871: 'Changes will last until shutdown.', 3442025874: 'Check SD Card', 3119547911: 'Check that address belongs to this wallet?', 2856261511: 'Checked %d change addresses with no matches.', 2788541416: 'Checked %d receive addresses with no matches.', 2446472910: 'Checking change address %d for match..', 2470115694: 'Checking for SD card..', 3655273987: 'Checking receive address %d for match..', 2407028014: 'Compact SeedQR', 4041895036: 'Continue?', 4094072796: 'Create QR Code', 167798282: 'Create QR code from text?', 2767642191: 'Created:', 124617190: 'Cut Depth', 597912140: 'Cut Method', 2504034831: 'Decimal', 2751113454: 'Decrypt?', 1016609898: 'Delete File?', 1364509700: 'Delete Mnemonic', 4102535566: 'Depth Per Pass', 2791699253: 'Derivation: %s', 1230133196: 'Device flash storage not detected.', 3836852788: 'Done?', 382368239: 'Driver', 374684711: 'Encrypt Mnemonic', 1244124409: 'Encrypted QR Code', 2968548114: 'Encrypted mnemonic was not stored', 3315319371: 'Encrypted mnemonic was stored with ID: ', 350279787: 'Encryption', 992186481: 'Encryption mode', 3504179008: 'Enter each word of your BIP-39 mnemonic as a number from 1 to 2048.', 1100685007: 'Enter each word of your BIP-39 mnemonic as a number in hexadecimal from 1 to 800.', 4090266642: 'Enter each word of your BIP-39 mnemonic as a number in octal from 1 to 4000.', 2780625730: 'Enter each word of your BIP-39 mnemonic.', 784361051: 'Error:\n%s', 1505332462: 'Esc', 3838465623: 'Explore files?', 1711312434: 'Extended Public Key', 383371114: 'Failed to decrypt', 3048830188: 'Failed to load PSBT', 4192663412: 'Failed to load address', 1996021743: 'Failed to load key', 1108715658: 'Failed to load message', 1081425878: 'Failed to load mnemonic', 928667220: 'Failed to load output descriptor', 1620572516: 'Failed to load passphrase', 2946146830: 'Failed to store mnemonic', 1303554751: 'Fee: ', 104500973: 'Feed Rate', 2526278892: 'File selected:\n\n%s', 3313339187: 'Filename', 1982637349: 'Filename %s exists on SD card, overwrite?', 3737729752: 'Fingerprint: %s', 2542772894: 'Firmware exceeds max size: %d', 1406590538: 'Flute Diameter', 3086093110: 'Free: ', 1893243331: 'From Storage', 4120536442: 'GRBL', 299338213: 'Give this mnemonic a custom ID? Otherwise current fingerprint will be used', 602716148: 'Go', 831562513: 'Heat Interval', 2300171403: 'Heat Time', 3580020863: 'Hex Public Key', 2691246967: 'Hexadecimal', 2736309107: 'ID already exists\n', 631342955: 'Inputs (%d): ', 2585599782: 'Invalid address', 2874529150: 'Invalid bootloader', 4093416954: 'Invalid mnemonic length', 1422874211: 'Invalid public key', 2443867979: 'Invalid wallet:\n%s', 4122897393: 'Invert', 3000888649: 'Key', 2686333978: 'Key:', 4123798664: 'Krux\n\n\nVersion\n%s', 3835918229: 'Krux Printer Test QR', 766317539: 'Language', 972436696: 'Line Delay', 3596093890: 'Line: ', 2820726296: 'Load Mnemonic', 1842226768: 'Load PSBT from SD card?', 1113467596: 'Load message from SD card?', 669106195: 'Load one?', 3330705289: 'Load?', 2596531078: 'Loading Camera..', 596389387: 'Loading change address %d..', 2538883522: 'Loading receive address %d..', 3159494909: 'Loading..', 1177338798: 'Locale', 2817059741: 'Location', 63976957: 'Log Level', 86530918: 'Logging', 2917810189: 'Maximum length exceeded (%s)', 2030045667: 'Message', 3928301843: 'Missing signature file', 1948316555: 'Mnemonic', 2123991188: 'Mnemonic ID', 3911073154: 'Mnemonic Storage ID', 570639842: 'Mnemonic was not decrypted', 1746030071: 'Mnemonic was not encrypted', 1458925155: 'Modified:', 1845376098: 'Multisig', 2939797024: 'Network', 73574491: 'New Mnemonic', 2792272353: 'New firmware detected.\n\nSHA256:\n%s\n\n\n\nInstall?', 4063104189: 'No', 3927838899: 'No BIP39 passphrase', 4092516657: 'Not enough rolls!', 1577637745: 'Octal', 2662729867: 'PBKDF2 iterations', 721090621: 'PSBT', 995862913: 'Paint punched dots black so they can be detected.', 2987800462: 'Paper Width', 3050763890: 'Part\n%d / %d', 3559456868: 'Part Size', 4249903283: 'Passphrase', 3712257341: 'Passphrase:', 140802882: 'Persist', 1703779997: 'Plaintext QR', 3561756278: 'Please load a wallet output descriptor', 784609464: 'Plunge Rate', 3037062877: 'Print Test QR', 4278257699: 'Print to QR?\n\n%s\n\n', 516488026: 'Print?\n\n%s\n\n', 1123106929: 'Printer', 3903571079: 'Printer Driver not set!', 2609799302: 'Printing\n%d / %d', 844861889: 'Printing ...', 2580599003: 'Proceed?', 556126964: 'Processing ...', 1848310591: 'QR Code', 710709610: 'RX Pin', 2697857197: 'Receive', 1746677167: 'Receive Addresses', 364354944: 'Region: ', 1662254634: 'Review scanned data, edit if necessary', 2771583845: 'Roll die at least %d times to generate a mnemonic.', 856795528: 'Rolls:\n\n%s', 255086803: 'Rolls: %d\n', 3976793317: 'SD card', 2827687530: 'SD card not detected', 2736513298: 'SD card not detected.', 3593785196: 'SHA256 of rolls:\n\n%s', 1143278725: 'SHA256 of snapshot:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'Save PSBT to SD card?', 843701745: 'Save signature to SD card?', 242160059: 'Saved PSBT to SD card:\n%s', 3476501088: 'Saved signature to SD card:\n%s', 763824768: 'Scale', 4117455079: 'Scan Address', 3219991109: 'Scan BIP39 passphrase', 2537207336: 'Scan Key QR code', 4006316572: 'Scanning words 1-12 again', 2736506158: 'Scanning words 13-24', 266935239: 'SeedQR', 1698829144: 'Self-transfer or Change (%d): ', 473154195: 'Settings', 1825881236: 'Shutdown', 3672262613: 'Shutdown to change the theme?', 2120776272: 'Shutting down..', 1061961408: 'Sign', 4282338366: 'Sign?', 2710534130: 'Signature:\n\n%s', 1988416729: 'Signed Message', 3672006076: 'Signed PSBT', 3279196260: 'Single-key', 4221794628: 'Size: ', 2309020186: 'Spend (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Store on Flash', 720041451: 'Store on SD Card', 3514476519: 'Swipe to change mode', 1898550184: 'TOUCH or ENTER to capture', 4228215415: 'TX Pin', 2612594937: 'Text', 1454688268: 'Theme', 1180180513: 'Thermal', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (Bits)', 725348723: 'Tools', 3684696112: 'Touch Threshold', 2978718564: 'Touchscreen', 2732611775: 'Try more?', 1487826746: 'Type BIP39 passphrase', 2061556020: 'Type Key', 2089395053: 'Unit', 2845607430: 'Updating bootloader..\n\n%d%%', 4164597446: 'Upgrade complete.\n\nShutting down..', 2736001501: 'Upgrading firmware..\n\n%d%%', 2674953168: 'Use a black background surface.', 2402455261: "Use camera's entropy to create a new mnemonic", 236075140: 'Used: ', 4003084591: 'Value %s out of range: [%s, %s]', 4191058607: 'Via Camera', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Via Manual Input', 2504354847: 'Wait for the capture', 2297028319: 'Wallet Descriptor', 4232654916: 'Wallet output descriptor', 2587172867: 'Wallet output descriptor loaded!', 2499782468: 'Wallet output descriptor not found.', 1831109430: 'Warning:\nIncomplete output descriptor', 797660533: 'Word %d', 3742424146: 'Word Numbers', 2965123464: 'Words', 1303016265: 'Yes', 771968845: 'Your changes will be kept on device flash storage.', 2569054451: 'Your changes will be kept on the SD card.'}, 'es-MX': {1185266064: '%d de %d multisig', 2004520398: '%d. Cambio: \n\n%s\n\n', 3862364126: '%d. Autotransferencia: \n\n%s\n\n', 3264377309: '%d. Gasto: \n\n%s\n\n', 2399232215: '%s\n\n¡es una dirección de cambio válida!', 3921290840: '%s\n\nes un dirección de depósito válido!', 1808355833: '%s\n\nNO FUE ENCONTRADO en las primeras %d direcciones de cambio', 1306127065: '%s\n\nNO FUE ENCONTRADO en las primeras %d direcciones de depósito', 3772416878: ',', 248832578: '.', 2739590230: '12 palabras', 1310058127: '24 palabras', 2743272264: 'ABC', 1949634023: 'Nosotros', 1517128857: 'Adafruit', 3270727197: 'Dirección', 2574498267: 'Entropía adicional desde la cámara requerida para el modo AES-CBC', 283202181: 'Alinee la cámara y Tiny Seed correctamente.', 88746165: 'Antideslumbrante desactivado', 1521033296: 'Antideslumbrante habilitado', 1056821534: '¿Estas seguro?', 3247612282: 'BIP39 Mnemónico', 3455872521: 'Atrás', 2541860807: 'Copia de seguridad del cargador de arranque..\n\n%d%%', 2256777600: 'Mala asignatura', 3937333362: 'Velocidad en baudios', 427617266: 'Bitcoin', 928727036: 'Relleno de borde', 213030954: 'CNC', 1207696150: 'Cambio', 3126552510: 'Direcciones de Cambio', 2697733395: '¡Cambios guardados en la tarjeta SD!', 388908871: 'Los cambios durarán hasta que se apague.', 3442025874: 'Verifique la tarjeta SD', 3119547911: '¿Compruebe que la dirección pertenece a esta cartera?', 2856261511: 'La dirección de cambio %d no coincide.', 2788541416: 'Comprobado %d dirección de depósito sin coincidencias.', 2446472910: 'Verificación de coincidencia de dirección de cambio %d ..', 2470115694: 'Comprobación de la tarjeta SD..', 3655273987: 'Comprobando la dirección de depósito %d para alguna coincidencia..', 2407028014: 'SeedQR Compacto', 4041895036: '¿Continuar?', 4094072796: 'Crear código QR', 167798282: '¿Crear código QR desde el texto?', 2767642191: 'Creado: ', 124617190: 'Profundidad de corte', 597912140: 'Método de corte', 2504034831: 'Decimal', 2751113454: 'Descifrar?', 1016609898: '¿Borrar archivo?', 1364509700: 'Eliminar mnemónico', 4102535566: 'Profundidad por pasada', 2791699253: 'Derivación: %s', 1230133196: 'Almacenamiento flash del dispositivo no detectado.', 3836852788: '¿Listo?', 382368239: 'Operador', 374684711: 'Cifrado mnemónico', 1244124409: 'Código QR cifrado', 2968548114: 'Mnemonic cifrado no se almacenó', 3315319371: 'Mnemónica cifrada fue almacenada con ID:', 350279787: 'Encriptación', 992186481: 'Modo de encriptación', 3504179008: 'Ingrese cada palabra de su mnemónico BIP-39 como un número del 1 al 2048.', 1100685007: 'Ingrese cada palabra de su mnemónico BIP-39 como un número en hexadecimal del 1 al 800.', 4090266642: 'Ingrese cada palabra de su mnemónico BIP-39 como un número en octal del 1 al 4000.', 2780625730: 'Ingrese cada palabra de su mnemónico BIP-39.', 784361051: 'Error:\n%s', 1505332462: 'Esc', 3838465623: 'Explorar archivos?', 1711312434: 'Llave Pública', 383371114: 'No se descife', 3048830188: 'No se puede cargar la PSBT', 4192663412: 'No se puede cargar la address', 1996021743: 'No se pudo cargar la clave', 1108715658: 'No se pudo cargar el mensaje', 1081425878: 'No se puede cargar la mnemotécnica', 928667220: 'No se pudo cargar el descriptor de salida', 1620572516: 'No se pudo cargar frase de pases', 2946146830: 'No pudo almacenar mnemonic', 1303554751: 'Comisión: ', 104500973: 'Tasa de alimentación', 2526278892: 'Archivo seleccionado:\n\n%s', 3313339187: 'Nombre del archivo', 1982637349: 'El nombre de archivo %s existe en la tarjeta SD, ¿sobrescribir?', 3737729752: 'Huella Dactilar: %s', 2542772894: 'El firmware supera el tamaño máximo: %d', 1406590538: 'Diámetro de la flauta', 3086093110: 'Libre: ', 1893243331: 'Desde el almacenamiento', 4120536442: 'GRBL', 299338213: '¿Darle a este mnemónico una identificación personalizada?De lo contrario se utilizará la huella digital actual', 602716148: 'Ir', 831562513: 'Intervalo de calor', 2300171403: 'Tiempo de calor', 3580020863: 'Clave pública hexadecimal', 2691246967: 'Hexadecimal', 2736309107: 'ID ya existe\n', 631342955: 'Entradas (%d): ', 2585599782: 'Dirección inválida', 2874529150: 'Cargador de arranque inválido', 4093416954: 'Longitud mnemotécnica no válida', 1422874211: 'Tecla pública inválida', 2443867979: 'Cartera inválida:\n%s', 4122897393: 'Invertir', 3000888649: 'Clave', 2686333978: 'Clave:', 4123798664: 'Krux\n\n\nVersión\n%s', 3835918229: 'Prueba de impresora Krux QR', 766317539: 'Idioma', 972436696: 'Retraso de línea', 3596093890: 'Línea: ', 2820726296: 'Cargar el mnemónico', 1842226768: '¿Cargar PSBT de tarjeta SD?', 1113467596: '¿Cargar mensaje de tarjeta SD?', 669106195: '¿Cargar algo?', 3330705289: '¿Cargar?', 2596531078: 'Cargando Camara..', 596389387: 'Cargando dirección de cambio %d..', 2538883522: 'Cargando dirección de recepción %d..', 3159494909: 'Cargando..', 1177338798: 'Idioma', 2817059741: 'Ubicación', 63976957: 'Nivel de registro', 86530918: 'Registro', 2917810189: 'Longitud máxima excedida (%s)', 2030045667: 'Mensaje', 3928301843: 'Falta de firma faltante', 1948316555: 'Mnemotécnica', 2123991188: 'Identificación de lo mnemónico', 3911073154: 'ID de almacenamiento mnemónico', 570639842: 'Mnemonic no fue descifrado', 1746030071: 'Mnemonic no fue descifrado', 1458925155: 'Modificado: ', 1845376098: 'Multisig', 2939797024: 'La red', 73574491: 'Nuevo Mnemónico', 2792272353: 'Nuevo firmware detectado.\n\nSHA256:\n%s\n\n\n\n¿Instalar?', 4063104189: 'No', 3927838899: 'Sin frase de contraseña BIP39', 4092516657: '¡No hay suficientes rollos!', 1577637745: 'Octales', 2662729867: 'Iteraciones PBKDF2', 721090621: 'PSBT', 995862913: 'Pinte los puntos perforados de negro para que puedan ser detectados.', 2987800462: 'Ancho del papel', 3050763890: 'Parte\n%d / %d', 3559456868: 'Tamaño de la pieza', 4249903283: 'Contraseña', 3712257341: 'Frase de pases:', 140802882: 'Salvar', 1703779997: 'QR de Texto', 3561756278: 'Cargue un descriptor de billetera', 784609464: 'Tasa de caída', 3037062877: 'Prueba de impresión QR', 4278257699: '¿Imprimir con Codigo QR?\n\n%s\n\n', 516488026: '¿Impresión?\n\n%s\n\n', 1123106929: 'Impresora', 3903571079: '¡El controlador de impresora no está configurado!', 2609799302: 'Imprimiendo\n%d / %d', 844861889: 'Imprimiendo ...', 2580599003: '¿Continuar?', 556126964: 'Procesando ...', 1848310591: 'Código QR', 710709610: 'RX Alfiler', 2697857197: 'Recepción', 1746677167: 'Direcciones de Recepción', 364354944: 'Región: ', 1662254634: 'Revise los datos escaneados, edítelos si es necesario', 2771583845: 'Tira el dado al menos %d veces para generar un mnemotécnico.', 856795528: 'Rollos:\n\n%s', 255086803: 'Rollos: %d\n', 3976793317: 'Tarjeta SD', 2827687530: 'Tarjeta SD no detectada', 2736513298: 'Tarjeta SD no detectada.', 3593785196: 'SHA256 de rollos:\n\n%s', 1143278725: 'SHA256 de la instantánea:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: '¿Guardar PSBT en la tarjeta SD?', 843701745: '¿Guardar firma en la tarjeta SD?', 242160059: 'PSBT guardado en la tarjeta SD:\n%s', 3476501088: 'Firma guardada en la tarjeta SD:\n%s', 763824768: 'Escala', 4117455079: 'Escanear Dirección', 3219991109: 'Escanear frase de pases BIP39', 2537207336: 'Escanear el código QR', 4006316572: 'Escaneo de palabras 1-12 de nuevo', 2736506158: 'Escaneo de palabras 13-24', 266935239: 'Seedqr', 1698829144: 'Autotransferencia o Cambio (%d): ', 473154195: 'Ajustes', 1825881236: 'Apagar', 3672262613: 'Apagar para cambiar el tema?', 2120776272: 'Apagando..', 1061961408: 'Firmar', 4282338366: '¿Firmar?', 2710534130: 'Firma:\n\n%s', 1988416729: 'Mensaje firmado', 3672006076: 'PSBT firmado', 3279196260: 'Single-key', 4221794628: 'Espacio: ', 2309020186: 'Gastos (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Almacenar en flash', 720041451: 'Almacenar en la tarjeta SD', 3514476519: 'Deslizar para cambiar de modo', 1898550184: 'TOQUE o ENTER para capturar', 4228215415: 'TX Alfiler', 2612594937: 'Texto', 1454688268: 'Tema', 1180180513: 'Térmico', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (bits)', 725348723: 'Herramientas', 3684696112: 'Umbral Táctil', 2978718564: 'Pantalla táctil', 2732611775: '¿Intentar con mas?', 1487826746: 'Escriba la frase de pases BIP39', 2061556020: 'Introduzca la clave', 2089395053: 'Unidad', 2845607430: 'Actualización de Bootloader..\n\n%d%%', 4164597446: 'Actualización completa.\n\nApagando..', 2736001501: 'Actualización de firmware..\n\n%d%%', 2674953168: 'Use una superficie de fondo negra.', 2402455261: 'Use la entropía de la cámara para crear una nueva mnemónica', 236075140: 'Usado: ', 4003084591: 'Valor %s fuera del rango: [ %s, %s]', 4191058607: 'Vía cámara', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Mediante entrada manual', 2504354847: 'Espera la captura', 2297028319: 'Descriptor de Cartera', 4232654916: 'Descriptor de salida de billetera', 2587172867: '¡Se ha cargado el descriptor de salida de la cartera!', 2499782468: 'No se encontró el descriptor de salida de la cartera.', 1831109430: 'Advertencia:\nDescriptor de salida incompleto', 797660533: 'Palabra %d', 3742424146: 'Números de palabra', 2965123464: 'Palabras', 1303016265: 'Sí', 771968845: 'Sus cambios se guardarán en el almacenamiento flash del dispositivo.', 2569054451: 'Sus cambios se guardarán en la tarjeta SD.'}, 'vi-VN': {1185266064: '%d của %d đa chữ kí', 2004520398: '%d. Thay đổi: \n\n%s\n\n', 3862364126: '%d. Tự chuyển nhượng: \n\n%s\n\n', 3264377309: '%d. Chi tiêu: \n\n%s\n\n', 2399232215: '%s\n\nis một địa chỉ thay đổi hợp lệ!', 3921290840: '%s\n\nlà một địa chỉ khả dụng!', 1808355833: '%s\n\nKHÔNG TÌM ĐƯỢC trong địa chỉ %d đầu tiên', 1306127065: '%s\n\nKHÔNG TÌM ĐƯỢC trong địa chỉ %d đầu tiên', 3772416878: ',', 248832578: '.', 2739590230: '12 từ', 1310058127: '24 từ', 2743272264: 'ABC', 1949634023: 'Về chúng tôi', 1517128857: 'Adafruit', 3270727197: 'Địa chỉ', 2574498267: 'Entropy bổ sung từ máy ảnh cần thiết cho chế độ AES-CBC', 283202181: 'Căn chỉnh camera và Tiny Seed đúng cách.', 88746165: 'Chống lóa bị vô hiệu hóa', 1521033296: 'Đã bật chống lóa', 1056821534: 'Bạn có chắc không?', 3247612282: 'Mã mnemonic dạng chuẩn BIP39', 3455872521: 'Trở lại', 2541860807: 'Sao lưu bộ tải khởi động..\n\n%d%%', 2256777600: 'Chữ ký xấu', 3937333362: 'Tốc độ baud', 427617266: 'Bitcoin', 928727036: 'Đệm viền', 213030954: 'CNC', 1207696150: 'Thay đổi', 3126552510: 'Thay địa chỉ', 2697733395: 'Thay đổi được lưu trên thẻ SD!', 388908871: 'Thay đổi sẽ kéo dài cho đến khi tắt máy.', 3442025874: 'Kiểm tra thẻ SD', 3119547911: 'Kiểm tra địa chỉ đó có thuộc về ví này không?', 2856261511: 'Đã kiểm tra %d địa chỉ thay đổi không có kết quả phù hợp.', 2788541416: 'Đã kiểm tra %d địa chỉ nhận được và không tìm thấy tương thích.', 2446472910: 'Đang kiểm tra địa chỉ thay đổi %d để khớp..', 2470115694: 'Kiểm tra thẻ SD..', 3655273987: 'Đang kiểm tra %d địa chỉ..', 2407028014: 'SeedQR nhỏ gọn', 4041895036: 'Tiếp tục?', 4094072796: 'Tạo mã QR', 167798282: 'Tạo mã QR từ văn bản?', 2767642191: 'Tạo:', 124617190: 'Chiều sâu cắt', 597912140: 'Phương pháp cắt', 2504034831: 'Số thập phân', 2751113454: 'Phản đối?', 1016609898: 'Xóa tài liệu?', 1364509700: 'Xóa ghi nhớ', 4102535566: 'Độ sâu mỗi lần vượt qua', 2791699253: 'Nguồn gốc: %s', 1230133196: 'Không phát hiện bộ lưu trữ flash của thiết bị.', 3836852788: 'Hoàn tất?', 382368239: 'Người cầm lái', 374684711: 'Mã hóa Mnemonic', 1244124409: 'Mã QR được mã hóa', 2968548114: 'MNemon được mã hóa không được lưu trữ', 3315319371: 'Mnemonic được mã hóa được lưu trữ với ID:', 350279787: 'Mã hóa', 992186481: 'Chế độ mã hóa', 3504179008: 'Nhập từng kí tự của mã mnemonic BIP-39 của bạn dưới dạng số từ 1 đến 2048.', 1100685007: 'Nhập từng từ trong bản ghi nhớ BIP-39 của bạn dưới dạng số thập lục phân từ 1 đến 800.', 4090266642: 'Nhập từng từ trong bản ghi nhớ BIP-39 của bạn dưới dạng số bát phân từ 1 đến 4000.', 2780625730: 'Nhập từng kí tự của mã mnemonic BIP-39 của bạn.', 784361051: 'Lỗi:\n%s', 1505332462: 'Esc', 3838465623: 'Khám phá các tập tin?', 1711312434: 'Khóa công cộng', 383371114: 'Không giải mã được', 3048830188: 'Tải PSBT thất bại', 4192663412: 'Tải địa chỉ thất bại', 1996021743: 'Không tải khóa', 1108715658: 'Không tải được tin nhắn', 1081425878: 'Tải mã mnemonic thất bại', 928667220: 'Không thể tải bộ mô tả đầu ra', 1620572516: 'Không tải được cụm mật khẩu', 2946146830: 'Không lưu trữ MNemonic', 1303554751: 'Phí: ', 104500973: 'Tỷ lệ thức ăn', 2526278892: 'Tệp được chọn:\n\n%s', 3313339187: 'Tên tệp', 1982637349: 'Tên tệp %s tồn tại trên thẻ SD, ghi đè lên?', 3737729752: 'Dấu vân tay: %s', 2542772894: 'Phần sụn vượt quá kích thước tối đa: %d', 1406590538: 'Đường kính ống sáo', 3086093110: 'Khả dụng: ', 1893243331: 'Từ lưu trữ', 4120536442: 'GRBL', 299338213: 'Cung cấp cho Mnemonic này một ID tùy chỉnh?Nếu không thì dấu vân tay hiện tại sẽ được sử dụng', 602716148: 'Đến', 831562513: 'Khoảng thời gian nhiệt', 2300171403: 'Thời gian nhiệt', 3580020863: 'Khóa công khai Hex', 2691246967: 'Thập lục phân', 2736309107: 'Id đã tồn tại\n', 631342955: 'Đầu vào (%d): ', 2585599782: 'Địa chỉ không hợp lệ', 2874529150: 'Bộ tải khởi động không hợp lệ', 4093416954: 'Độ dài mã mnemonic không hợp lệ', 1422874211: 'Khóa công khai không hợp lệ', 2443867979: 'Ví không hợp lệ:\n%s', 4122897393: 'Đảo ngược', 3000888649: 'Chìa khóa', 2686333978: 'Chìa khóa:', 4123798664: 'Krux\n\n\nPhiên Bản\n%s', 3835918229: 'QR kiểm tra máy in Krux', 766317539: 'Ngôn ngữ', 972436696: 'Độ trễ Dòng', 3596093890: 'Đường kẻ: ', 2820726296: 'Tải mã mnemonic', 1842226768: 'Tải PSBT từ thẻ SD?', 1113467596: 'Chọn tệp tin nhắn từ thẻ SD?', 669106195: 'Tải một?', 3330705289: 'Tải?', 2596531078: 'Đang tải máy ảnh..', 596389387: 'Đang tải thay đổi địa chỉ %d..', 2538883522: 'Đang tải địa chỉ nhận %d..', 3159494909: 'Đang tải..', 1177338798: 'Ngôn ngữ', 2817059741: 'Vị trí cửa hàng', 63976957: 'Log Level', 86530918: 'Khai thác gỗ', 2917810189: 'Chiều dài tối đa vượt quá (%s)', 2030045667: 'Tin nhắn', 3928301843: 'Thiếu tập tin chữ ký', 1948316555: 'Mã mnemonic', 2123991188: 'ID ghi nhớ', 3911073154: 'ID lưu trữ ghi nhớ', 570639842: 'Ghi nhớ không được giải mã', 1746030071: 'Ghi nhớ không được mã hóa', 1458925155: 'Đã sửa đổi:', 1845376098: 'Đa chữ kí', 2939797024: 'Mạng lưới', 73574491: 'Mnemonic mới', 2792272353: 'Phát hiện phần sụn mới.\n\nSHA256:\n%s\n\n\n\nCài đặt phần mềm?', 4063104189: 'Không', 3927838899: 'Không có cụm mật khẩu BIP39', 4092516657: 'Không đủ cuộn!', 1577637745: 'Bát phân', 2662729867: 'Lặp lại PBKDF2', 721090621: 'PSBT', 995862913: 'Sơn các chấm đục lỗ màu đen để chúng có thể được phát hiện.', 2987800462: 'Chiều rộng giấy', 3050763890: 'Phần\n%d / %d', 3559456868: 'Kích thước một phần', 4249903283: 'Cụm mật khẩu', 3712257341: 'Cụm cụm:', 140802882: 'Vị trí lưu', 1703779997: 'Văn bản rõ QR', 3561756278: 'Vui lòng tải bộ mô tả đầu ra ví', 784609464: 'Tỷ lệ sụt giảm', 3037062877: 'In kiểm tra QR', 4278257699: 'In ra mã QR?\n\n%s\n\n', 516488026: 'In?\n\n%s\n\n', 1123106929: 'Máy in', 3903571079: 'Trình điều khiển máy in không đặt!', 2609799302: 'Đang in\n%d / %d', 844861889: 'In ấn ...', 2580599003: 'Thực hiện?', 556126964: 'Xử lý ...', 1848310591: 'Mã QR', 710709610: 'RX Ghim', 2697857197: 'Nhận được', 1746677167: 'Nhận địa chỉ', 364354944: 'Vùng: ', 1662254634: 'Xem lại dữ liệu đã quét, chỉnh sửa nếu cần', 2771583845: 'Lăn xúc xắc ít nhất %d lần để tạo khả năng ghi nhớ.', 856795528: 'Súc sắc cuộn:\n\n%s', 255086803: 'Súc sắc cuộn: %d\n', 3976793317: 'Thẻ SD', 2827687530: 'Thẻ SD không được phát hiện', 2736513298: 'Thẻ SD không được phát hiện.', 3593785196: 'SHA256 của súc sắc cuộn:\n\n%s', 1143278725: 'Sha256 của ảnh chụp nhanh:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'Lưu PSBT vào thẻ SD?', 843701745: 'Lưu chữ ký vào thẻ SD?', 242160059: 'Đã lưu PSBT vào thẻ SD:\n%s', 3476501088: 'Đã lưu chữ ký vào thẻ SD:\n%s', 763824768: 'Cái cân', 4117455079: 'Quét địa chỉ', 3219991109: 'Quét BIP39 Cụm cụm', 2537207336: 'Quét mã QR khóa', 4006316572: 'Quét lại từ 1-12', 2736506158: 'Quét từ 13-24', 266935239: 'SEEDQR', 1698829144: 'Tự chuyển nhượng hoặc Thay đổi (%d): ', 473154195: 'Cài đặt', 1825881236: 'Tắt', 3672262613: 'Tắt máy để thay đổi chủ đề?', 2120776272: 'Đang tắt..', 1061961408: 'Chữ kí', 4282338366: 'Kí?', 2710534130: 'Chữ ký:\n\n%s', 1988416729: 'Tin nhắn đã ký', 3672006076: 'Đã ký PSBT', 3279196260: 'Khóa đơn', 4221794628: 'Dung lượng: ', 2309020186: 'Chi tiêu (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Lưu trữ trên flash', 720041451: 'Lưu trữ trên thẻ SD', 3514476519: 'Vuốt để thay đổi chế độ', 1898550184: 'TOUCH hoặc ENTER để chụp', 4228215415: 'TX Ghim', 2612594937: 'Chữ', 1454688268: 'Chủ đề', 1180180513: 'Nhiệt', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (bit)', 725348723: 'Công cụ', 3684696112: 'Ngưỡng cảm ứng', 2978718564: 'Màn hình cảm ứng', 2732611775: 'Thử thêm nữa?', 1487826746: 'Nhập cụm BIP39', 2061556020: 'Nhập khóa', 2089395053: 'Đơn vị', 2845607430: 'Cập nhật bộ tải khởi động..\n\n%d%%', 4164597446: 'Nâng cấp hoàn tất.\n\nĐang Tắt..', 2736001501: 'Nâng cấp firmware..\n\n%d%%', 2674953168: 'Sử dụng bề mặt nền đen.', 2402455261: 'Sử dụng entropy của máy ảnh để tạo ra một bản ghi âm mới', 236075140: 'Đã sử dụng: ', 4003084591: 'Giá trị %s ngoài phạm vi: [ %s, %s]', 4191058607: 'Qua máy ảnh', 1254681955: 'Qua D20', 525309547: 'Qua D6', 590330112: 'Thông qua đầu vào thủ công', 2504354847: 'Chờ bắt', 2297028319: 'Trình mô tả ví', 4232654916: 'Ví đầu ra mô tả', 2587172867: 'Đã tải bộ mô tả đầu ra của ví!', 2499782468: 'Không tìm thấy bộ mô tả đầu ra ví.', 1831109430: 'Cảnh báo:\nBộ mô tả đầu ra chưa hoàn chỉnh', 797660533: 'Kí tự %d', 3742424146: 'Từ số', 2965123464: 'Từ ngữ', 1303016265: 'Đúng', 771968845: 'Thay đổi của bạn sẽ được lưu trên bộ nhớ flash của thiết bị.', 2569054451: 'Các thay đổi của bạn sẽ được lưu trên thẻ SD.'}}
+translation_table = {'pt-BR': {1185266064: '%d da %d multisig', 2004520398: '%d. Troco: \n\n%s\n\n', 3862364126: '%d. Autotransferência: \n\n%s\n\n', 3264377309: '%d. Gasto: \n\n%s\n\n', 2399232215: '%s\n\n é um endereço de troco válido!', 3921290840: '%s\n\né um endereço de recepção válido!', 1808355833: '%s\n\nNÃO FOI ENCONTRADO nos primeiros %d endereços de troco', 1306127065: '%s\n\nNÃO FOI ENCONTRADO nos primeiros %d endereços de recepção', 3772416878: ',', 248832578: '.', 2739590230: '12 palavras', 1310058127: '24 palavras', 2743272264: 'ABC', 1949634023: 'Sobre', 1517128857: 'Adafruit', 3270727197: 'Endereço', 2574498267: 'Entropia adicional da câmera necessária para o modo AES-CBC', 283202181: 'Alinhe a câmera e o Tiny Seed corretamente.', 88746165: 'Antirreflexo desativado', 1521033296: 'Antirreflexo ativado', 1056821534: 'Tem certeza?', 3247612282: 'Mnemônico BIP39', 3455872521: 'Voltar', 2541860807: 'Backing up bootloader..\n\n%d%%', 2256777600: 'Assinatura Inválida', 3937333362: 'Baudrate', 427617266: 'Bitcoin', 928727036: 'Borda', 213030954: 'CNC', 1207696150: 'Troco', 3126552510: 'Endereços de Troco', 2697733395: 'Mudanças salvas no cartão SD!', 388908871: 'Alterações só durarão até o desligamento.', 3442025874: 'Verifique o cartão SD', 3119547911: 'Verificar se este endereço pertence a carteira?', 2856261511: 'Endereço de troco %d não corresponde.', 2788541416: 'Endereço de recebimento %d não corresponde.', 2446472910: 'Verificando correspondência do endereço de troco %d ..', 2470115694: 'Verificando o cartão SD..', 3655273987: 'Verificando correspondência do endereço de recebimento %d ..', 2407028014: 'SeedQR Compacto', 4041895036: 'Continuar?', 4094072796: 'Gerar código QR', 167798282: 'Gerar código QR do texto?', 2767642191: 'Criado: ', 124617190: 'Profundidade de corte', 597912140: 'Método de corte', 2504034831: 'Decimal', 2751113454: 'Descriptografar?', 1016609898: 'Excluir arquivo?', 1364509700: 'Excluir Mnemônico', 4102535566: 'Profundidade da passagem', 2791699253: 'Derivação: %s', 1230133196: 'Armazenamento flash do dispositivo não detectado.', 3836852788: 'Feito?', 382368239: 'Driver', 374684711: 'Criptografar mnemônico', 1244124409: 'Código QR criptografado', 2968548114: 'Mnemonic criptografado não foi armazenado', 3315319371: 'Mnemônico criptografado foi armazenado com ID:', 350279787: 'Criptografia', 992186481: 'Modo de criptografia', 3504179008: 'Digite o número de cada palavra do seu mnemônico BIP-39, de 1 a 2048.', 1100685007: 'Digite o número de cada palavra do seu mnemônico BIP-39 como um número em hexadecimal, de 1 a 800.', 4090266642: 'Digite o número de cada palavra do seu mnemônico BIP-39 como um número em octal, de 1 a 4000.', 2780625730: 'Digite cada palavra do seu mnemônico BIP-39.', 784361051: 'Erro:\n%s', 1505332462: 'Esc', 3838465623: 'Explorar arquivos?', 1711312434: 'Chave Pública Estendida', 383371114: 'Falhou em descriptografar', 3048830188: 'Falhou ao carregar PSBT', 4192663412: 'Falhou ao carregar endereço', 1996021743: 'Falha ao carregar a chave', 1108715658: 'Falhou ao carregar mensagem', 1081425878: 'Falhou ao carregar mnemônico', 928667220: 'Falha ao carregar o descritor de saída', 1620572516: 'Falha ao carregar a senha', 2946146830: 'Falhou ao armazenar mnemônico', 1303554751: 'Taxa: ', 104500973: 'Taxa de Alimentação', 2526278892: 'Arquivo selecionado:\n\n%s', 3313339187: 'Nome do arquivo', 1982637349: 'O nome do arquivo %s existe no cartão SD, substituir?', 3737729752: 'Impressão digital: %s', 2542772894: 'Firmware excede o tamanho máximo: %d', 1406590538: 'Diâmetro da Fresa', 3086093110: 'Livre: ', 1893243331: 'Do armazenamento', 4120536442: 'GRBL', 299338213: 'Dê a este mnemônico um ID personalizado? Caso contrário, a impressão digital atual será usada', 602716148: 'Ir', 831562513: 'Intervalo de aquecimento', 2300171403: 'Tempo de aquecimento', 3580020863: 'Chave pública hexadecimal', 2691246967: 'Hexadecimal', 2736309107: 'Id já existe\n', 631342955: 'Entradas (%d): ', 2585599782: 'Endereço inválido', 2874529150: 'Bootloader inválido', 4093416954: 'Comprimento de mnemônico inválido', 1422874211: 'Chave pública inválida', 2443867979: 'Carteira inválida:\n%s', 4122897393: 'Invertido', 3000888649: 'Chave', 2686333978: 'Chave:', 4123798664: 'Krux\n\n\nVersão\n%s', 3835918229: 'Teste de impressão de QR krux', 766317539: 'Língua', 972436696: 'Atraso de Linha', 3596093890: 'Linha: ', 2820726296: 'Carregar Mnemônico', 1842226768: 'Carregar PSBT do cartão SD?', 1113467596: 'Carregar mensagem do cartão SD?', 669106195: 'Carregar um?', 3330705289: 'Carregar?', 2596531078: 'Carregando Câmera..', 596389387: 'Carregando endereço de troco %d..', 2538883522: 'Carregando endereço de recebimento %d..', 3159494909: 'Carregando..', 1177338798: 'Idioma', 2817059741: 'Local', 63976957: 'Nível de log', 86530918: 'Logging', 2917810189: 'Comprimento máximo excedido (%s)', 2030045667: 'Mensagem', 3928301843: 'Arquivo de assinatura faltando', 1948316555: 'Mnemônico', 2123991188: 'ID do mnemônico', 3911073154: 'ID de armazenamento', 570639842: 'Mnemônico não foi descriptografado', 1746030071: 'Mnemônico não foi criptografado', 1458925155: 'Modificado:', 1845376098: 'Multisig', 2939797024: 'Rede', 73574491: 'Novo Mnemônico', 2792272353: 'Novo firmware detectado.\n\nSHA256:\n%s\n\n\n\nInstalar?', 4063104189: 'Não', 3927838899: 'Sem senha BIP39', 4092516657: 'Jogadas insuficientes!', 1577637745: 'Octal', 2662729867: 'Iterações pbkdf2', 721090621: 'PSBT', 995862913: 'Pinte os pontos perfurados de preto para que possam ser detectados.', 2987800462: 'Largura do papel', 3050763890: 'Parte\n%d / %d', 3559456868: 'Tamanho da peça', 4249903283: 'Senha', 3712257341: 'Senha:', 140802882: 'Salvar', 1703779997: 'QR em Texto', 3561756278: 'Carregue um descritor da carteira', 784609464: 'Taxa de Mergulho', 3037062877: 'Imprimir QR de teste', 4278257699: 'Imprimir QR?\n\n%s\n\n', 516488026: 'Imprimir?\n\n%s\n\n', 1123106929: 'Impressora', 3903571079: 'Driver de impressora não está definido!', 2609799302: 'Imprimindo\n%d / %d', 844861889: 'Imprimindo ...', 2580599003: 'Seguir?', 556126964: 'Processando ...', 1848310591: 'Código QR', 710709610: 'Pino RX', 2697857197: 'Recebimento', 1746677167: 'Endereços de Recebimento', 364354944: 'Região: ', 1662254634: 'Revise os dados, edite se necessário', 2771583845: 'Role o dado pelo menos %d vezes para gerar um mnemônico.', 856795528: 'Jogadas:\n\n%s', 255086803: 'Jogadas: %d\n', 3976793317: 'Cartão SD', 2827687530: 'Cartão SD não detectado', 2736513298: 'Cartão SD não detectado.', 3593785196: 'SHA256 de jogadas:\n\n%s', 1143278725: 'Sha256 da imagem:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'Salvar PSBT no cartão SD?', 843701745: 'Salvar assinatura no cartão SD?', 242160059: 'PSBT salvo no cartão SD:\n%s', 3476501088: 'Assinatura salva no cartão SD:\n%s', 763824768: 'Escala', 4117455079: 'Escanear Endereço', 3219991109: 'Escanear a senha BIP39', 2537207336: 'Escanear código QR da chave', 4006316572: 'Escaneando as palavras 1-12 novamente', 2736506158: 'Escaneando as palavras 13-24', 266935239: 'SeedQR', 1698829144: 'Autotransferência ou Troco (%d): ', 473154195: 'Configurações', 1825881236: 'Desligar', 3672262613: 'Desligar para mudar o tema?', 2120776272: 'Desligando..', 1061961408: 'Assinar', 4282338366: 'Assinar?', 2710534130: 'Assinatura:\n\n%s', 1988416729: 'Mensagem assinada', 3672006076: 'PSBT assinada', 3279196260: 'Single-key', 4221794628: 'Total: ', 2309020186: 'Gastos (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Armazene na Flash', 720041451: 'Armazene no Cartão SD', 3514476519: 'Deslize para mudar de modo', 1898550184: 'TOQUE ou ENTER para capturar', 4228215415: 'Pino TX', 2612594937: 'Texto', 1454688268: 'Tema', 1180180513: 'Térmica', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (bits)', 725348723: 'Ferramentas', 3684696112: 'Limiar de toque', 2978718564: 'Touchscreen', 2732611775: 'Tentar mais?', 1487826746: 'Digitar a senha BIP39', 2061556020: 'Digite a chave', 2089395053: 'Unidade', 2845607430: 'Atualizando bootloader..\n\n%d%%', 4164597446: 'Atualização completa.\n\nDesligando..', 2736001501: 'Atualizando firmware..\n\n%d%%', 2674953168: 'Use uma superfície de fundo preta.', 2402455261: 'Use a entropia da câmera para criar um novo mnemônico', 236075140: 'Usado: ', 4003084591: 'Valor %s fora do alcance: [ %s, %s]', 4191058607: 'Pela câmera', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Por entrada manual', 2504354847: 'Aguarde a captura', 2297028319: 'Descritor de Carteira', 4232654916: 'Descritor da carteira', 2587172867: 'Descritor de saída da carteira carregado!', 2499782468: 'O descritor de saída da carteira não foi encontrado.', 1831109430: 'Atenção:\nDescritor de saída incompleto', 797660533: 'Palavra %d', 3742424146: 'Números de palavras', 2965123464: 'Palavras', 1303016265: 'Sim', 771968845: 'Suas alterações serão mantidas no armazenamento flash do dispositivo.', 2569054451: 'Suas alterações serão mantidas no cartão SD.', 2129700639: 'Modo de cor', 2589124277: 'Leitor', 1428624450: 'Lote de PSBT', 2969321168: 'PSBTs: %d', 727713407: '%d PSBTs salvos no cartão SD', 1378438641: 'Indexar endereços', 193612242: '%d endereços indexados', 2147369013: '%d de %d endereços encontrados', 3852737319: '%s\n\nNÃO FOI ENCONTRADO nos primeiros %d endereços de recepção ou troco', 3361449470: 'Verificar endereços', 4143091229: 'Verificando correspondência do endereço %d..', 3054758377: 'Carregar endereços do cartão SD?', 67015788: 'Pré-visualização da câmera', 2632697102: 'Cache de carteiras', 2607262189: '%d carteiras em cache excluídas'}, 'de-DE': {1185266064: '%d von %d Multisig', 2004520398: '%d. Änderung: \n\n%s\n\n', 3862364126: '%d. Selbstübertragung: \n\n%s\n\n', 3264377309: '%d. Ausgaben: \n\n%s\n\n', 2399232215: '%s\n\nist eine gültige Änderungsadresse!', 3921290840: '%s\n\nist eine gültige Empfangsadresse!', 1808355833: '  %s\n\nwurde in den ersten %d Änderungsadressen NICHT GEFUNDEN', 1306127065: '%s\n\nwurde in den ersten %d Empfangsadressen NICHT GEFUNDEN', 3772416878: '.', 248832578: ',', 2739590230: '12 Wörter', 1310058127: '24 Wörter', 2743272264: 'ABC', 1949634023: 'Über', 1517128857: 'Adafruit', 3270727197: 'Adresse', 2574498267: 'Zusätzliche Entropie aus der Kamera, die für den AES-CBC-Modus erforderlich ist', 283202181: 'Richten Sie die Kamera und Tiny Seed korrekt aus.', 88746165: 'Blendschutz deaktiviert', 1521033296: 'Blendschutz aktiviert', 1056821534: 'Bist du sicher?', 3247612282: 'BIP39 Mnemonic', 3455872521: 'Zurückkehren', 2541860807: 'Bootloader unterstützen..\n\n%d%%', 2256777600: 'Ungültige Unterschrift', 3937333362: 'Baudrate', 427617266: 'Bitcoin', 928727036: 'Randpolsterung', 213030954: 'CNC', 1207696150: 'Änderungsadresse', 3126552510: 'Änderungsadresse', 2697733395: 'Änderungen auf SD-Karte gespeichert!', 388908871: 'Änderungen dauern bis zum Herunterfahren.', 3442025874: 'Überprüfen Sie die SD -Karte', 3119547911: 'Überprüfen Sie die Adresse dieser Wallet gehört?', 2856261511: 'Überprüfte %d Änderungsadresse ohne Übereinstimmungen.', 2788541416: 'Überprüfte %d Empfängsadressen ohne Übereinstimmungen.', 2446472910: 'Überprüfen der Änderungsadresse %d auf Übereinstimmung.', 2470115694: 'Suche nach SD-Karte..', 3655273987: 'Überprüfen der Empfängsadresse %d auf Übereinstimmung.', 2407028014: 'Kompakt SeedQR', 4041895036: 'Fortsetzen?', 4094072796: 'Erstellen Sie QR -Code', 167798282: 'QR -Code aus dem Text erstellen?', 2767642191: 'Erstellt:', 124617190: 'Schnitttiefe', 597912140: 'Cut-Methode', 2504034831: 'Dezimal', 2751113454: 'Entschlüsseln?', 1016609898: 'Datei löschen?', 1364509700: 'Mnemonik löschen', 4102535566: 'Tiefe pro Durchgang', 2791699253: 'Ableitung: %s', 1230133196: 'Geräte-Flash-Speicher nicht erkannt.', 3836852788: 'Fertig?', 382368239: 'Driver', 374684711: 'Verschlüsseln Sie mnemonisch', 1244124409: 'Verschlüsselter QR -Code', 2968548114: 'Verschlüsseltes Mnemonik wurde nicht gespeichert', 3315319371: 'Verschlüsselter Mnemonik wurde mit ID gespeichert: ', 350279787: 'Verschlüsselung', 992186481: 'Verschlüsselungsmodus', 3504179008: 'Geben Sie jedes Wort Ihrer BIP-39 Mnemonic als Zahl von 1 bis 2048 ein.', 1100685007: 'Geben Sie jedes Wort Ihrer BIP-39-Mnemonik als Hexadezimalzahl von 1 bis 800 ein.', 4090266642: 'Geben Sie jedes Wort Ihrer BIP-39-Mnemonik als Oktalzahl von 1 bis 4000 ein.', 2780625730: 'Geben Sie jedes Wort Ihrer BIP-39 Mnemonic ein.', 784361051: 'Fehler:\n%s', 1505332462: 'Esc', 3838465623: 'Dateien erkunden?', 1711312434: 'Öffentlicher Schlüssel', 383371114: 'Versäumt zu entschlüsseln', 3048830188: 'PSBT könnte nicht geladen werden', 4192663412: 'Adresse könnte nicht geladen werden', 1996021743: 'Fehlgeschlagene Taste nicht laden', 1108715658: 'Nachricht konnte nicht geladen werden', 1081425878: 'Mnemonic könnte nicht geladen werden', 928667220: 'Ausgabedeskriptor konnte nicht geladen werden', 1620572516: 'Passphrase nicht laden', 2946146830: 'Mnemonisch nicht speichern', 1303554751: 'Gebühr: ', 104500973: 'Vorschubgeschwindigkeit', 2526278892: 'Datei ausgewählt:\n\n%s', 3313339187: 'Dateiname', 1982637349: 'Dateiname %s existiert auf SD-Karte, überschreiben?', 3737729752: 'Fingerabdruck: %s', 2542772894: 'Die Firmware übersteigt die maximale Größe: %d', 1406590538: 'Flötendurchmesser', 3086093110: 'Freier: ', 1893243331: 'Aus der Lagerung', 4120536442: 'GRBL', 299338213: 'Geben Sie diesem mnemonischen ID eine benutzerdefinierte ID?Andernfalls wird der aktuelle Fingerabdruck verwendet', 602716148: 'Go', 831562513: 'Wärmeintervall', 2300171403: 'Hitzezeit', 3580020863: 'Hex öffentlicher Schlüssel', 2691246967: 'Hexadezimal', 2736309107: 'ID existiert bereits\n', 631342955: 'Eingänge (%d): ', 2585599782: 'Ungültige Adresse', 2874529150: 'Ungültiger Bootloader', 4093416954: 'Ungültige mnemonische Lange', 1422874211: 'Ungültiger öffentlicher Schlüssel', 2443867979: 'Ungültige Wallet:\n%s', 4122897393: 'Umkehren', 3000888649: 'Taste', 2686333978: 'Taste:', 4123798664: 'Krux\n\n\nVersion\n%s', 3835918229: 'Krux -Drucker -Test QR', 766317539: 'Sprache', 972436696: 'Leitungsverzögerung', 3596093890: 'Linie: ', 2820726296: 'Mnemonic laden', 1842226768: 'PSBT von SD-Karte laden?', 1113467596: 'Nachricht von SD-Karte laden?', 669106195: 'Eine laden?', 3330705289: 'Laden?', 2596531078: 'Kamera laden..', 596389387: 'Lade Änderungsadresse %d..', 2538883522: 'Lade Empfangsadresse %d..', 3159494909: 'Wird geladen..', 1177338798: 'Gebietsschema', 2817059741: 'Speicherort', 63976957: 'Protokollebene', 86530918: 'Logging', 2917810189: 'Maximale Länge überschritten (%s)', 2030045667: 'Nachricht', 3928301843: 'Fehlende Signaturdatei', 1948316555: 'Mnemonic', 2123991188: 'Mnemonische ID', 3911073154: 'Mnemonische Speicher -ID', 570639842: 'Mnemonic wurde nicht entschlüsselt', 1746030071: 'Mnemonik war nicht verschlüsselt', 1458925155: 'Geändert:', 1845376098: 'Multisig', 2939797024: 'Netzwerk', 73574491: 'Neue Mnemonic', 2792272353: 'Neue Firmware erkannt.\n\nSHA256:\n%s\n\n\n\nInstallieren?', 4063104189: 'Nein', 3927838899: 'Keine bip39 Passphrase', 4092516657: 'Nicht genug Rollen!', 1577637745: 'Oktal', 2662729867: 'PBKDF2 -Iterationen', 721090621: 'PSBT', 995862913: 'Male gestanzte Punkte schwarz an, damit sie erkannt werden können.', 2987800462: 'Papierbreite', 3050763890: 'Teil\n%d / %d', 3559456868: 'Teilegröße', 4249903283: 'Passphrase', 3712257341: 'Passphrase:', 140802882: 'Speicher', 1703779997: 'Klartext-QR', 3561756278: 'Bitte laden Sie einen Brieftaschenausgangsbekriptor', 784609464: 'Tauchrate', 3037062877: 'TEST TEST QR', 4278257699: 'In QR drucken?\n\n%s\n\n', 516488026: 'Drucken?\n\n%s\n\n', 1123106929: 'Drucker', 3903571079: 'Druckertreiber nicht gesetzt!', 2609799302: 'Drucken\n%d / %d', 844861889: 'Drucken ...', 2580599003: 'Weitermachen?', 556126964: 'Wird bearbeitet ...', 1848310591: 'QR-Code', 710709610: 'RX Stift', 2697857197: 'Empfangsadresse', 1746677167: 'Empfangsadresse', 364354944: 'Region: ', 1662254634: 'Überprüfen Sie gescannte Daten und bearbeiten Sie sie bei Bedarf', 2771583845: 'Würfeln Sie mindestens %d Mal, um eine Eselsbrücke zu erzeugen.', 856795528: 'Rollen:\n\n%s', 255086803: 'Rollen: %d\n', 3976793317: 'SD-Karte', 2827687530: 'SD -Karte nicht erkannt', 2736513298: 'SD-Karte nicht erkannt.', 3593785196: 'SHA256 von Rollen:\n\n%s', 1143278725: 'SHA256 von Snapshot:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'PSBT auf SD-Karte speichern?', 843701745: 'Signatur auf SD-Karte speichern?', 242160059: 'PSBT auf SD-Karte gespeichert:\n%s', 3476501088: 'Signatur auf SD-Karte gespeichert:\n%s', 763824768: 'Skala', 4117455079: 'Adresse\nscannen', 3219991109: 'Scan bip39 Passphrase', 2537207336: 'Tastenschlüssel QR -Code scannen', 4006316572: 'Wörter 1-12 erneut scannen', 2736506158: 'Wörter 13-24 scannen', 266935239: 'Seedqr', 1698829144: 'Selbstübertragung oder Änderung (%d): ', 473154195: 'Einstellungen', 1825881236: 'Abschalten', 3672262613: 'Herunterfahren, um das Thema zu ändern?', 2120776272: 'Herunterfahren..', 1061961408: 'Unterzeichnen', 4282338366: 'Unterzeichnen?', 2710534130: 'Unterschrift:\n\n%s', 1988416729: 'Signierte Nachricht', 3672006076: 'Signiertes PSBT', 3279196260: 'Single-key', 4221794628: 'Kapazität: ', 2309020186: 'Ausgaben (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Auf Flash speichern', 720041451: 'Auf der SD -Karte speichern', 3514476519: 'Wischen Sie, um den Modus zu ändern', 1898550184: 'TOUCH oder ENTER zum Erfassen', 4228215415: 'TX Stift', 2612594937: 'Text', 1454688268: 'Thema', 1180180513: 'Thermisch', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (Bits)', 725348723: 'Werkzeug', 3684696112: 'Berühren Sie Schwellenwert', 2978718564: 'Touch-Screen', 2732611775: 'Mehr versuchen?', 1487826746: 'Typ BIP39 Passphrase', 2061556020: 'Geben Sie den Schlüssel ein', 2089395053: 'Einheit', 2845607430: 'Bootloader aktualisieren..\n\n%d%%', 4164597446: 'Upgrade abgeschlossen.\n\nHerunterfahren..', 2736001501: 'Firmware aktualisieren..\n\n%d%%', 2674953168: 'Verwenden Sie eine schwarze Hintergrundfläche.', 2402455261: 'Verwenden Sie die Entropie der Kamera, um eine neue Mnemonik zu erstellen', 236075140: 'Belegter: ', 4003084591: 'Wert %S außerhalb Bereich: [ %s, %s]', 4191058607: 'Über Kamera', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Über manuelle Eingabe', 2504354847: 'Warte auf die Gefangennahme', 2297028319: 'Wallet-Deskriptor', 4232654916: 'Brieftaschenausgang Deskriptor', 2587172867: 'Wallet-Ausgabedeskriptor geladen!', 2499782468: 'Wallet-Ausgabedeskriptor nicht gefunden.', 1831109430: 'Warnung:\nUnvollständiger Ausgabedeskriptor', 797660533: 'Wort %d', 3742424146: 'Wortzahlen', 2965123464: 'Wörter', 1303016265: 'Ja', 771968845: 'Änderungen werden im Flash-Speicher des Geräts gespeichert.', 2569054451: 'Ihre Änderungen werden auf der SD-Karte gespeichert.', 2129700639: 'Farbmodus', 2589124277: 'Scanner', 1428624450: 'PSBT-Stapel', 2969321168: 'PSBTs: %d', 727713407: '%d PSBTs auf SD-Karte gespeichert', 1378438641: 'Adressen indizieren', 193612242: '%d Adressen indiziert', 2147369013: '%d von %d Adressen gefunden', 3852737319: '%s\n\nwurde in den ersten %d Empfangs- oder Wechselgeldadressen NICHT GEFUNDEN', 3361449470: 'Adressen prüfen', 4143091229: 'Prüfe Adresse %d auf Übereinstimmung..', 3054758377: 'Adressen von SD-Karte laden?', 67015788: 'Kameravorschau', 2632697102: 'Wallets zwischenspeichern', 2607262189: '%d zwischengespeicherte Wallets gelöscht'}, 'fr-FR': {1185266064: '%d de %d multisignature', 2004520398: '%d. Changement : \n\n%s\n\n', 3862364126: '%d. Auto-transfert : \n\n%s\n\n', 3264377309: '%d. Dépense : \n\n%s\n\n', 2399232215: '%s\n\nest une adresse changement valide!', 3921290840: '%s\n\nest une adresse reçue valide!', 1808355833: 'INTROUVABLE dans les premières %d adresses de changement', 1306127065: '%s\n\nINTROUVABLE dans les premières %d adresses de reçues', 3772416878: '.', 248832578: ',', 2739590230: '12 mots', 1310058127: '24 mots', 2743272264: 'ABC', 1949634023: 'À propos', 1517128857: 'Adafruit', 3270727197: 'Adresse', 2574498267: 'Entropie supplémentaire de la caméra requise pour le mode AES-CBC', 283202181: 'Alignez correctement la caméra et Tiny Seed.', 88746165: 'Anti-éblouissement désactivé', 1521033296: 'Anti-éblouissement activé', 1056821534: 'Es-tu sûr?', 3247612282: 'BIP39 Mnémonique', 3455872521: 'Retour', 2541860807: 'Sauvegarde du chargeur de démarrage..\n\n%d%%', 2256777600: 'Mauvaise signature', 3937333362: 'Débit en bauds', 427617266: 'Bitcoin', 928727036: 'Rembourrage de bordure', 213030954: 'CNC', 1207696150: 'Changement', 3126552510: 'Adresses de Changement', 2697733395: 'Modifications enregistrées sur la carte SD!', 388908871: "Les modifications dureront jusqu'à l'arrêt.", 3442025874: 'Vérifiez la carte SD', 3119547911: "Vérifiez que l'adresse appartient à cette portefeuille?", 2856261511: 'Adresses %d changement vérifiées sans correspondance.', 2788541416: 'Adresses %d reçues vérifiées sans correspondance.', 2446472910: "Vérification de l'adresse changement %d pour correspondance..", 2470115694: 'Vérification de la carte SD..', 3655273987: "Vérification de l'adresse reçue %d pour correspondance..", 2407028014: 'SeedQR Compact', 4041895036: 'Continuer?', 4094072796: 'Créer du code QR', 167798282: 'Créer du code QR à partir du texte?', 2767642191: 'Créé:', 124617190: 'Profondeur de coupe', 597912140: 'Méthode de coupe', 2504034831: 'Décimal', 2751113454: 'Décrypter?', 1016609898: 'Supprimer le fichier?', 1364509700: 'Supprimer mnémonique', 4102535566: 'Profondeur par passage', 2791699253: 'Dérivation: %s', 1230133196: "Stockage flash de l'appareil non détecté.", 3836852788: 'Terminé?', 382368239: 'Conducteur', 374684711: 'Crypter mnémonique', 1244124409: 'Code QR crypté', 2968548114: "Le mnémonique crypté n'a pas été stocké", 3315319371: 'Mnémonique cryptée a été stockée avec ID:', 350279787: 'Chiffrement', 992186481: 'Mode de chiffrement', 3504179008: "Entrez chaque mot de votre BIP-39 mnémonique sous la forme d'un nombre 1 jusqu'à 2048.", 1100685007: "Entrez chaque mot de votre mnémonique BIP-39 sous la forme d'un nombre en hexadécimal de 1 à 800.", 4090266642: "Entrez chaque mot de votre mnémonique BIP-39 sous la forme d'un nombre en octal de 1 à 4000.", 2780625730: 'Entrez chaque mot de votre BIP-39 mnémonique.', 784361051: 'Erreur:\n%s', 1505332462: 'Esc', 3838465623: 'Explorer des fichiers?', 1711312434: 'Clé publique', 383371114: 'Échec de décrypter', 3048830188: 'Erreur de chargement PSBT', 4192663412: "Erreur de chargement d'adresse", 1996021743: 'Échec du chargement de la clé', 1108715658: 'Échec du chargement du message', 1081425878: 'Erreur de chargement mnémonique', 928667220: 'Échec du chargement du descripteur de sortie', 1620572516: 'Échec du chargement de la phrase secrète', 2946146830: 'Échec de stocker mnémonique', 1303554751: 'Frais: ', 104500973: "Taux d'alimentation", 2526278892: 'Fichier sélectionné :\n\n%s', 3313339187: 'Nom de fichier', 1982637349: 'Le nom de fichier %s existe sur la carte SD, écraser ?', 3737729752: 'Empreinte Digitale: %s', 2542772894: 'Le micrologiciel dépasse la taille maximale: %d', 1406590538: 'Diamètre de flûte', 3086093110: 'Libre: ', 1893243331: 'Du stockage', 4120536442: 'GRBL', 299338213: "Donnez à ce mnémonique un identifiant personnalisé?Sinon l'empreinte actuelle sera utilisée", 602716148: 'Go', 831562513: 'Intervalle de chauffe', 2300171403: 'Temps de chauffe', 3580020863: 'Clé public hexadécimal', 2691246967: 'Hexadécimal', 2736309107: 'Id existe déjà\n', 631342955: 'Entrées (%d) : ', 2585599782: 'Adresse invalide', 2874529150: 'Chargeur de démarrage invalide', 4093416954: 'Longueur mnémonique invalide', 1422874211: 'Clé publique non valide', 2443867979: 'Portefeuille invalide:\n%s', 4122897393: 'Inverser', 3000888649: 'Clé', 2686333978: 'Clé:', 4123798664: 'Krux\n\n\nVersion\n%s', 3835918229: "Test de l'imprimante Krux QR", 766317539: 'Langue', 972436696: 'Délai de Ligne', 3596093890: 'Ligne: ', 2820726296: 'Charger mnémonique', 1842226768: 'Charger PSBT de la carte SD ?', 1113467596: 'Charger le message de la carte SD ?', 669106195: "En charger qu'un?", 3330705289: 'Charger?', 2596531078: 'Caméra de Chargement..', 596389387: "Chargement de l'adresse de changement %d..", 2538883522: "Chargement de l'adresse de réception %d..", 3159494909: 'Chargement..', 1177338798: 'Paramètres régionaux', 2817059741: 'Emplacement', 63976957: 'Niveau de journalisation', 86530918: 'Enregistrement', 2917810189: 'Longueur maximale dépassée (% s)', 2030045667: 'Message', 3928301843: 'Fichier de signature manquant', 1948316555: 'Mnémonique', 2123991188: 'ID mnémonique', 3911073154: 'ID de stockage mnémonique', 570639842: "Mnémonique n'a pas été décryptée", 1746030071: "Mnémonique n'était pas cryptée", 1458925155: 'Modifié:', 1845376098: 'Multi\nsignature', 2939797024: 'Réseau', 73574491: 'Nouveau mnémonique', 2792272353: 'Nouveau micrologiciel détecté.\n\nSHA256:\n%s\n\n\n\nInstaller?', 4063104189: 'Non', 3927838899: 'Pas de phrase passante bip39', 4092516657: 'Pas assez de rouleaux !', 1577637745: 'Octale', 2662729867: 'Itérations pbkdf2', 721090621: 'PSBT', 995862913: "Peignez les points perforés en noir afin qu'ils puissent être détectés.", 2987800462: 'Largeur du papier', 3050763890: 'Partie\n%d / %d', 3559456868: 'Taille de la pièce', 4249903283: 'Phrase de passe', 3712257341: 'Phrass de passe:', 140802882: 'Persister', 1703779997: 'QR en Texte Brut', 3561756278: 'Veuillez charger un descripteur de sortie de portefeuille', 784609464: 'Taux de plongée', 3037062877: "Test d'impression QR", 4278257699: 'Imprimer en QR?\n\n%s\n\n', 516488026: 'Imprimer?\n\n%s\n\n', 1123106929: 'Imprimante', 3903571079: "Le conducteur d'imprimante n'est pas défini!", 2609799302: 'Impression\n%d / %d', 844861889: 'Impression ...', 2580599003: 'Procéder?', 556126964: 'Traitement ...', 1848310591: 'QR Code', 710709610: 'RX Fiche', 2697857197: 'Recevoir', 1746677167: 'Adresses de Réception', 364354944: 'Région: ', 1662254634: 'Examinez les données numérisées, modifiez-les si nécessaire', 2771583845: 'Lancez le dé au moins %d fois pour générer un mnémonique.', 856795528: 'Rouleaux:\n\n%s', 255086803: 'Rouleaux: %d\n', 3976793317: 'Carte SD', 2827687530: 'Carte SD non détectée', 2736513298: 'Carte SD non détectée.', 3593785196: 'SHA256 de rouleaux:\n\n%s', 1143278725: 'Sha256 de Snapshot:\n\n% s', 3338679392: 'SHA256:\n%s', 481947431: 'Enregistrer PSBT sur carte SD?', 843701745: 'Enregistrer la signature sur la carte SD?', 242160059: 'PSBT enregistré sur la carte SD:\n%s', 3476501088: 'Signature enregistrée sur la carte SD:\n%s', 763824768: "L'échelle", 4117455079: "Scannez l'adresse", 3219991109: 'Scan bip39 en phrase secrète', 2537207336: 'Scanner le code QR de la clé', 4006316572: 'Analyser à nouveau les mots 1 à 12', 2736506158: 'Analyser les mots 13 à 24', 266935239: 'Seedqr', 1698829144: 'Auto-transfert ou changement (%d): ', 473154195: 'Paramètres', 1825881236: 'Fermer', 3672262613: 'Arrêtez-vous pour changer le thème?', 2120776272: 'Éteindre..', 1061961408: 'Signature', 4282338366: 'Signature?', 2710534130: 'Signature:\n\n%s', 1988416729: 'Message signé', 3672006076: 'PSBT signé', 3279196260: 'Clé unique', 4221794628: 'Capacité: ', 2309020186: 'Dépense (%d) : ', 3355862324: 'Stackbit 1248', 3303592908: 'Stocker sur flash', 720041451: 'Stocker sur la carte SD', 3514476519: 'Faites glisser pour changer de mode', 1898550184: 'TOUCHEZ ou ENTER pour capturer', 4228215415: 'TX Fiche', 2612594937: 'Texte', 1454688268: 'Thème', 1180180513: 'Thermique', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (bits)', 725348723: 'Outils', 3684696112: 'Seuil Tactile', 2978718564: 'Écran Tactile', 2732611775: 'Réessayer?', 1487826746: 'Type Bip39 Plasque', 2061556020: 'Clé de type', 2089395053: 'Unité', 2845607430: 'Mise à jour du chargeur de démarrage..\n\n%d%%', 4164597446: 'Mise à niveau complète.\n\nÉteindre..', 2736001501: 'Mise à niveau du micrologiciel..\n\n%d%%', 2674953168: 'Utilisez une surface de fond noire.', 2402455261: "Utilisez l'entropie de la caméra pour créer un nouveau mnémonique", 236075140: 'Utilisé: ', 4003084591: 'Valeur% s hors de portée: [% s,% s]', 4191058607: 'Par caméra', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Par saisie manuelle', 2504354847: 'Attendez la capture', 2297028319: 'Descripteur de Portefeuille', 4232654916: 'Descripteur de sortie du portefeuille', 2587172867: 'Descripteur de sortie du portefeuille chargé!', 2499782468: 'Descripteur de sortie du portefeuille introuvable.', 1831109430: 'Attention:\nDescripteur de sortie incomplet', 797660533: 'Mot %d', 3742424146: 'Numéros de mots', 2965123464: 'Mots', 1303016265: 'Oui', 771968845: "Vos modifications seront conservées sur le stockage flash de l'appareil.", 2569054451: 'Vos modifications seront conservées sur la carte SD.', 2129700639: 'Mode couleur', 2589124277: 'Scanner', 1428624450: 'Lot de PSBT', 2969321168: 'PSBTs: %d', 727713407: '%d PSBT enregistrés sur la carte SD', 1378438641: 'Indexer les adresses', 193612242: '%d adresses indexées', 2147369013: '%d adresses trouvées sur %d', 3852737319: "%s\n\nN'A PAS ÉTÉ TROUVÉE dans les %d premières adresses de réception ou de monnaie", 3361449470: 'Vérifier les adresses', 4143091229: "Vérification de l'adresse %d..", 3054758377: 'Charger les adresses depuis la carte SD?', 67015788: 'Aperçu de la caméra', 2632697102: 'Cache des portefeuilles', 2607262189: '%d portefeuilles en cache supprimés'}, 'nl-NL': {1185266064: '%d van %d multisig', 2004520398: '%d. Wisselgeld: \n\n%s\n\n', 3862364126: '%d. Zelf overschrijving: \n\n%s\n\n', 3264377309: '%d. Uitgaven: \n\n%s\n\n', 2399232215: '%s\n\nis een valide wisselgeld-adres!', 3921290840: '%s\n\nis een valide ontvangst-adres!', 1808355833: '%s\n\nwerd NIET GEVONDEN in de eerste %d wisselgeld-adressen', 1306127065: '%s\n\nwerd NIET GEVONDEN in de eerste %d ontvangst-adressen', 3772416878: '.', 248832578: ',', 2739590230: '12 woorden', 1310058127: '24 woorden', 2743272264: 'ABC', 1949634023: 'Over', 1517128857: 'Adafruit', 3270727197: 'Adres', 2574498267: 'Aanvullende entropie van camera vereist voor AES-CBC modus', 283202181: 'Richt de camera en Tiny Seed op de juiste manier.', 88746165: 'Anti reflecterend uitgeschakeld', 1521033296: 'Anti reflecterend ingeschakeld', 1056821534: 'Weet je het zeker?', 3247612282: 'BIP-39 geheugensteun', 3455872521: 'Terug', 2541860807: 'Backup van de bootloader...\n\n%d%%', 2256777600: 'Ongeldige handtekening', 3937333362: 'Baudratio', 427617266: 'Bitcoin', 928727036: 'Rand opvulling', 213030954: 'CNC', 1207696150: 'Change', 3126552510: 'Adressen wijzigen', 2697733395: 'Wijzigingen aanhouden op SD kaart!', 388908871: 'Wijzigingen blijven van kracht tot afsluiten.', 3442025874: 'Controleer SD kaart', 3119547911: 'Controleer of dit adres bij deze portemonnee hoort?', 2856261511: 'Na %d geen wisselgeld-adressen gevonden.', 2788541416: 'Na %d geen ontvangst-adressen gevonden.', 2446472910: 'Wisselgeldadres %d controleren...', 2470115694: 'SD kaart controleren...', 3655273987: 'Ontvangstadres %d controleren...', 2407028014: 'Compact SeedQR', 4041895036: 'Doorgaan?', 4094072796: 'QR code maken', 167798282: 'QR code maken van tekst?', 2767642191: 'Aangemaakt:', 124617190: 'Snijdiepte', 597912140: 'Snijmethode', 2504034831: 'Decimaal', 2751113454: 'Ontsleutelen?', 1016609898: 'Bestand verwijderen?', 1364509700: 'Geheugensteun verwijderen', 4102535566: 'Diepte per pas', 2791699253: 'Afgeleide: %s', 1230133196: 'Opslag op apparaat is niet gedetecteerd.', 3836852788: 'Klaar?', 382368239: 'Driver', 374684711: 'Geheugensteun versleutelen', 1244124409: 'Versleutelde QR code', 2968548114: 'Versleutelde geheugensteun was niet opgeslagen', 3315319371: 'Versleutelde geheugensteun is opgeslagen met ID: ', 350279787: 'Versleutelen', 992186481: 'Versleutelen modus', 3504179008: 'Voer elk woord van jouw BIP-39 geheugensteun in als een nummer van 1 tot 2048.', 1100685007: 'Voer elk woord van jouw BIP-39 geheugensteun in als een hexadecimaal van 1 tot 800.', 4090266642: 'Voer elk woord van jouw BIP-39 geheugensteun in als een octaal van 1 tot 4000.', 2780625730: 'Voer elk woord van jouw BIP-39 geheugensteun.', 784361051: 'Fout:\n%s', 1505332462: 'Esc', 3838465623: 'Bestanden verkennen?', 1711312434: 'Uitgebreide publieke sleutel', 383371114: 'Ontsleutelen is niet gelukt', 3048830188: 'PSBT laden is niet gelukt', 4192663412: 'Adres laden is niet gelukt', 1996021743: 'Sleutel laden is niet gelukt', 1108715658: 'Bericht laden is niet gelukt', 1081425878: 'Geheugensteun laden is niet gelukt', 928667220: 'Descriptor laden is niet gelukt', 1620572516: 'Wachtwoord laden is niet gelukt', 2946146830: 'Geheugensteun opslaan is niet gelukt', 1303554751: 'Tarief: ', 104500973: 'Voedingssnelheid', 2526278892: 'Bestand geselecteerd:\n\n%s', 3313339187: 'Bestandsnaam', 1982637349: 'Bestandsnaam %s OVERSCHRIJVEN op SD kaart?', 3737729752: 'Vingerafdruk: %s', 2542772894: 'Firmware overschrijdt de maximale grootte: %d', 1406590538: 'Fluit diameter', 3086093110: 'Vrij: ', 1893243331: 'Uit data opslag', 4120536442: 'GRBL', 299338213: 'Eigen ID gebruiken voor geheugensteun? Anders vingerafdruk gebruiken', 602716148: 'Ga', 831562513: 'Warmte interval', 2300171403: 'Warmte tijd', 3580020863: 'Hex publieke sleutel', 2691246967: 'Hexadecimaal', 2736309107: 'ID bestaat al\n', 631342955: 'Invoer (%d): ', 2585599782: 'Ongeldig adres', 2874529150: 'Ongeldige bootloader', 4093416954: 'Ongeldige geheugensteun lengte', 1422874211: 'Ongeldige publieke sleutel', 2443867979: 'Ongeldige portemonnee:\n%s', 4122897393: 'Omkeren', 3000888649: 'Sleutel', 2686333978: 'Sleutel:', 4123798664: 'Krux\n\n\nVersie\n%s', 3835918229: 'Krux printer test QR', 766317539: 'Taal', 972436696: 'Lijn vertraging', 3596093890: 'Lijn: ', 2820726296: 'Geheugensteun laden', 1842226768: 'PSBT laden van SD kaart?', 1113467596: 'Bericht laden van SD kaart?', 669106195: 'Één laden?', 3330705289: 'Laden?', 2596531078: 'Camera laden...', 596389387: 'Wisselgeldadres %d laden...', 2538883522: 'Ontvangstadres %d laden...', 3159494909: 'Laden...', 1177338798: 'Taal:', 2817059741: 'Locatie', 63976957: 'Log niveau', 86530918: 'Loggen', 2917810189: 'Maximale lengte overschreden (%s)', 2030045667: 'Bericht', 3928301843: 'Handtekening bestand mist', 1948316555: 'Geheugensteun', 2123991188: 'Geheugensteun ID', 3911073154: 'Geheugensteun opslag ID', 570639842: 'Geheugensteun is niet ontsleuteld', 1746030071: 'Geheugensteun is niet versleuteld', 1458925155: 'Aangepast:', 1845376098: 'Multisig', 2939797024: 'Netwerk', 73574491: 'Geheugensteun maken', 2792272353: 'Nieuw firmware gevonden.\n\nSHA256:\n%s\n\n\n\nInstalleren?', 4063104189: 'Nee', 3927838899: 'Geen BIP-39 wachtwoord', 4092516657: 'Niet genoeg gedobbeld!', 1577637745: 'Octaal', 2662729867: 'PBKDF2 iteraties', 721090621: 'PSBT', 995862913: 'Maak geperforeerde stippen zwart zodat ze worden gedetecteerd.', 2987800462: 'Papier breedte', 3050763890: 'Deel\n%d / %d', 3559456868: 'Deel grootte', 4249903283: 'Wachtwoord', 3712257341: 'Wachtwoord:', 140802882: 'Aanhouden', 1703779997: 'Platte tekst QR', 3561756278: 'Laadt een portemonnee descriptor in', 784609464: 'Duik tarief', 3037062877: 'Test QR afdrukken', 4278257699: 'Afdrukken naar QR?\n\n%s\n\n', 516488026: 'Afdrukken?\n\n%s\n\n', 1123106929: 'Printer', 3903571079: 'Printer driver niet ingesteld!', 2609799302: 'Afdruk\n%d / %d', 844861889: 'Afdrukken...', 2580599003: 'Doorgaan?', 556126964: 'Verwerken...', 1848310591: 'QR code', 710709610: 'RX pin', 2697857197: 'Ontvangen', 1746677167: 'Ontvangstadres', 364354944: 'Regio: ', 1662254634: 'Controleer gescande gegevens en bewerk indien nodig', 2771583845: 'Dobbel een dobbelsteen minstens %d keer voor het genereren van een geheugensteun.', 856795528: 'Gedobbeld:\n\n%s', 255086803: 'Gedobbeld: %d\n', 3976793317: 'SD kaart', 2827687530: 'SD kaart niet gedetecteerd', 2736513298: 'SD kaart niet gedetecteerd.', 3593785196: 'Gedobbelde SHA256:\n\n%s', 1143278725: 'Momentopname van SHA256:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'PSBT opslaan op SD kaart?', 843701745: 'Handtekening bestand opslaan op SD kaart?', 242160059: 'Opgeslagen PSBT op SD kaart:\n%s', 3476501088: 'Opgeslagen handtekening bestanden op SD kaart:\n%s', 763824768: 'Schaal', 4117455079: 'Adres scannen', 3219991109: 'BIP-39 wachtwoord scannen', 2537207336: 'QR code sleutel scannen', 4006316572: 'Woorden 1 t/m 12 opnieuw scannen', 2736506158: 'Woorden 13 t/m 24 scannen', 266935239: 'SeedQR', 1698829144: 'Zelf overschrijving of wisselgeld (%d): ', 473154195: 'Instellingen', 1825881236: 'Afsluiten', 3672262613: 'Afsluiten voor veranderen van thema?', 2120776272: 'Bezig met afsluiten...', 1061961408: 'Ondertekenen', 4282338366: 'Ondertekenen?', 2710534130: 'Handtekening:\n\n%s', 1988416729: 'Bericht ondertekend', 3672006076: 'PSBT ondertekend', 3279196260: 'Enkele sleutel', 4221794628: 'Grootte: ', 2309020186: 'Uitgaven (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Opslaan op apparaat', 720041451: 'Opslaan op SD kaart', 3514476519: 'Verander modus', 1898550184: 'TIK of ENTER voor opname', 4228215415: 'TX pin', 2612594937: 'Tekst', 1454688268: 'Thema', 1180180513: 'Thermisch', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (Bits)', 725348723: 'Hulpmiddelen', 3684696112: 'Aanraak gevoeligheid', 2978718564: 'Aanraakscherm', 2732611775: 'Meer proberen?', 1487826746: 'Voer BIP-39 wachtwoord in', 2061556020: 'Voer sleutel in', 2089395053: 'Eenheid', 2845607430: 'Bootloader updaten...\n\n%d%%', 4164597446: 'Upgrade afgerond.\n\nBezig met afsluiten...', 2736001501: 'Firmware upgraden...\n\n%d%%', 2674953168: 'Gebruik een donker achergrond.', 2402455261: 'Gebruik de camera voor entropie voor het aanmaken van een nieuwe geheugensteun', 236075140: 'Gebruikt: ', 4003084591: 'Waarde %s is buiten bereik: [%s, %s]', 4191058607: 'Via camera', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Via handmatige invoer', 2504354847: 'Wacht op opname', 2297028319: 'Portemonnee descriptor', 4232654916: 'Portemonnee uitvoer descriptor', 2587172867: 'Portemonnee uitvoer descriptor geladen!', 2499782468: 'Portemonnee uitvoer descriptor niet gevonden.', 1831109430: 'Waarschuwing:\nIncomplete portemonnee uitvoer descriptor', 797660533: 'Woord %d', 3742424146: 'Woord nummers', 2965123464: 'Woorden', 1303016265: 'Yes', 771968845: 'Veranderingen worden opgeslagen in opslag van apparaat.', 2569054451: 'Veranderingen worden opgeslagen op SD kaart.', 2129700639: 'Kleurmodus', 2589124277: 'Scanner', 1428624450: 'PSBT-batch', 2969321168: "PSBT's: %d", 727713407: "%d PSBT's opgeslagen op SD-kaart", 1378438641: 'Adressen indexeren', 193612242: '%d adressen geïndexeerd', 2147369013: '%d van %d adressen gevonden', 3852737319: '%s\n\nwerd NIET GEVONDEN in de eerste %d ontvangst- of wisseladressen', 3361449470: 'Adressen controleren', 4143091229: 'Adres %d controleren op overeenkomst..', 3054758377: 'Adressen van SD-kaart laden?', 67015788: 'Cameravoorbeeld', 2632697102: 'Wallets cachen', 2607262189: '%d gecachte wallets verwijderd'}, 'en-US': {1185266064: '%d of %d multisig', 2004520398: '%d. Change: \n\n%s\n\n', 3862364126: '%d. Self-transfer: \n\n%s\n\n', 3264377309: '%d. Spend: \n\n%s\n\n', 2399232215: '%s\n\nis a valid change address!', 3921290840: '%s\n\nis a valid receive address!', 1808355833: '%s\n\nwas NOT FOUND in the first %d change addresses', 1306127065: '%s\n\nwas NOT FOUND in the first %d receive addresses', 3772416878: ',', 248832578: '.', 2739590230: '12 words', 1310058127: '24 words', 2743272264: 'ABC', 1949634023: 'About', 1517128857: 'Adafruit', 3270727197: 'Address', 2574498267: 'Additional entropy from camera required for AES-CBC mode', 283202181: 'Align camera and Tiny Seed properly.', 88746165: 'Anti-glare disabled', 1521033296: 'Anti-glare enabled', 1056821534: 'Are you sure?', 3247612282: 'BIP39 Mnemonic', 3455872521: 'Back', 2541860807: 'Backing up bootloader..\n\n%d%%', 2256777600: 'Bad signature', 3937333362: 'Baudrate', 427617266: 'Bitcoin', 928727036: 'Border Padding', 213030954: 'CNC', 1207696150: 'Change', 3126552510: 'Change Addresses', 2697733395: 'Changes persisted to SD card!', 388908871: 'Changes will last until shutdown.', 3442025874: 'Check SD Card', 3119547911: 'Check that address belongs to this wallet?', 2856261511: 'Checked %d change addresses with no matches.', 2788541416: 'Checked %d receive addresses with no matches.', 2446472910: 'Checking change address %d for match..', 2470115694: 'Checking for SD card..', 3655273987: 'Checking receive address %d for match..', 2407028014: 'Compact SeedQR', 4041895036: 'Continue?', 4094072796: 'Create QR Code', 167798282: 'Create QR code from text?', 2767642191: 'Created:', 124617190: 'Cut Depth', 597912140: 'Cut Method', 2504034831: 'Decimal', 2751113454: 'Decrypt?', 1016609898: 'Delete File?', 1364509700: 'Delete Mnemonic', 4102535566: 'Depth Per Pass', 2791699253: 'Derivation: %s', 1230133196: 'Device flash storage not detected.', 3836852788: 'Done?', 382368239: 'Driver', 374684711: 'Encrypt Mnemonic', 1244124409: 'Encrypted QR Code', 2968548114: 'Encrypted mnemonic was not stored', 3315319371: 'Encrypted mnemonic was stored with ID: ', 350279787: 'Encryption', 992186481: 'Encryption mode', 3504179008: 'Enter each word of your BIP-39 mnemonic as a number from 1 to 2048.', 1100685007: 'Enter each word of your BIP-39 mnemonic as a number in hexadecimal from 1 to 800.', 4090266642: 'Enter each word of your BIP-39 mnemonic as a number in octal from 1 to 4000.', 2780625730: 'Enter each word of your BIP-39 mnemonic.', 784361051: 'Error:\n%s', 1505332462: 'Esc', 3838465623: 'Explore files?', 1711312434: 'Extended Public Key', 383371114: 'Failed to decrypt', 3048830188: 'Failed to load PSBT', 4192663412: 'Failed to load address', 1996021743: 'Failed to load key', 1108715658: 'Failed to load message', 1081425878: 'Failed to load mnemonic', 928667220: 'Failed to load output descriptor', 1620572516: 'Failed to load passphrase', 2946146830: 'Failed to store mnemonic', 1303554751: 'Fee: ', 104500973: 'Feed Rate', 2526278892: 'File selected:\n\n%s', 3313339187: 'Filename', 1982637349: 'Filename %s exists on SD card, overwrite?', 3737729752: 'Fingerprint: %s', 2542772894: 'Firmware exceeds max size: %d', 1406590538: 'Flute Diameter', 3086093110: 'Free: ', 1893243331: 'From Storage', 4120536442: 'GRBL', 299338213: 'Give this mnemonic a custom ID? Otherwise current fingerprint will be used', 602716148: 'Go', 831562513: 'Heat Interval', 2300171403: 'Heat Time', 3580020863: 'Hex Public Key', 2691246967: 'Hexadecimal', 2736309107: 'ID already exists\n', 631342955: 'Inputs (%d): ', 2585599782: 'Invalid address', 2874529150: 'Invalid bootloader', 4093416954: 'Invalid mnemonic length', 1422874211: 'Invalid public key', 2443867979: 'Invalid wallet:\n%s', 4122897393: 'Invert', 3000888649: 'Key', 2686333978: 'Key:', 4123798664: 'Krux\n\n\nVersion\n%s', 3835918229: 'Krux Printer Test QR', 766317539: 'Language', 972436696: 'Line Delay', 3596093890: 'Line: ', 2820726296: 'Load Mnemonic', 1842226768: 'Load PSBT from SD card?', 1113467596: 'Load message from SD card?', 669106195: 'Load one?', 3330705289: 'Load?', 2596531078: 'Loading Camera..', 596389387: 'Loading change address %d..', 2538883522: 'Loading receive address %d..', 3159494909: 'Loading..', 1177338798: 'Locale', 2817059741: 'Location', 63976957: 'Log Level', 86530918: 'Logging', 2917810189: 'Maximum length exceeded (%s)', 2030045667: 'Message', 3928301843: 'Missing signature file', 1948316555: 'Mnemonic', 2123991188: 'Mnemonic ID', 3911073154: 'Mnemonic Storage ID', 570639842: 'Mnemonic was not decrypted', 1746030071: 'Mnemonic was not encrypted', 1458925155: 'Modified:', 1845376098: 'Multisig', 2939797024: 'Network', 73574491: 'New Mnemonic', 2792272353: 'New firmware detected.\n\nSHA256:\n%s\n\n\n\nInstall?', 4063104189: 'No', 3927838899: 'No BIP39 passphrase', 4092516657: 'Not enough rolls!', 1577637745: 'Octal', 2662729867: 'PBKDF2 iterations', 721090621: 'PSBT', 995862913: 'Paint punched dots black so they can be detected.', 2987800462: 'Paper Width', 3050763890: 'Part\n%d / %d', 3559456868: 'Part Size', 4249903283: 'Passphrase', 3712257341: 'Passphrase:', 140802882: 'Persist', 1703779997: 'Plaintext QR', 3561756278: 'Please load a wallet output descriptor', 784609464: 'Plunge Rate', 3037062877: 'Print Test QR', 4278257699: 'Print to QR?\n\n%s\n\n', 516488026: 'Print?\n\n%s\n\n', 1123106929: 'Printer', 3903571079: 'Printer Driver not set!', 2609799302: 'Printing\n%d / %d', 844861889: 'Printing ...', 2580599003: 'Proceed?', 556126964: 'Processing ...', 1848310591: 'QR Code', 710709610: 'RX Pin', 2697857197: 'Receive', 1746677167: 'Receive Addresses', 364354944: 'Region: ', 1662254634: 'Review scanned data, edit if necessary', 2771583845: 'Roll die at least %d times to generate a mnemonic.', 856795528: 'Rolls:\n\n%s', 255086803: 'Rolls: %d\n', 3976793317: 'SD card', 2827687530: 'SD card not detected', 2736513298: 'SD card not detected.', 3593785196: 'SHA256 of rolls:\n\n%s', 1143278725: 'SHA256 of snapshot:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'Save PSBT to SD card?', 843701745: 'Save signature to SD card?', 242160059: 'Saved PSBT to SD card:\n%s', 3476501088: 'Saved signature to SD card:\n%s', 763824768: 'Scale', 4117455079: 'Scan Address', 3219991109: 'Scan BIP39 passphrase', 2537207336: 'Scan Key QR code', 4006316572: 'Scanning words 1-12 again', 2736506158: 'Scanning words 13-24', 266935239: 'SeedQR', 1698829144: 'Self-transfer or Change (%d): ', 473154195: 'Settings', 1825881236: 'Shutdown', 3672262613: 'Shutdown to change the theme?', 2120776272: 'Shutting down..', 1061961408: 'Sign', 4282338366: 'Sign?', 2710534130: 'Signature:\n\n%s', 1988416729: 'Signed Message', 3672006076: 'Signed PSBT', 3279196260: 'Single-key', 4221794628: 'Size: ', 2309020186: 'Spend (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Store on Flash', 720041451: 'Store on SD Card', 3514476519: 'Swipe to change mode', 1898550184: 'TOUCH or ENTER to capture', 4228215415: 'TX Pin', 2612594937: 'Text', 1454688268: 'Theme', 1180180513: 'Thermal', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (Bits)', 725348723: 'Tools', 3684696112: 'Touch Threshold', 2978718564: 'Touchscreen', 2732611775: 'Try more?', 1487826746: 'Type BIP39 passphrase', 2061556020: 'Type Key', 2089395053: 'Unit', 2845607430: 'Updating bootloader..\n\n%d%%', 4164597446: 'Upgrade complete.\n\nShutting down..', 2736001501: 'Upgrading firmware..\n\n%d%%', 2674953168: 'Use a black background surface.', 2402455261: "Use camera's entropy to create a new mnemonic", 236075140: 'Used: ', 4003084591: 'Value %s out of range: [%s, %s]', 4191058607: 'Via Camera', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Via Manual Input', 2504354847: 'Wait for the capture', 2297028319: 'Wallet Descriptor', 4232654916: 'Wallet output descriptor', 2587172867: 'Wallet output descriptor loaded!', 2499782468: 'Wallet output descriptor not found.', 1831109430: 'Warning:\nIncomplete output descriptor', 797660533: 'Word %d', 3742424146: 'Word Numbers', 2965123464: 'Words', 1303016265: 'Yes', 771968845: 'Your changes will be kept on device flash storage.', 2569054451: 'Your changes will be kept on the SD card.', 2129700639: 'Color Mode', 2589124277: 'Scanner', 1428624450: 'PSBT Batch', 2969321168: 'PSBTs: %d', 727713407: 'Saved %d PSBTs to SD card', 1378438641: 'Index Addresses', 193612242: 'Indexed %d addresses', 2147369013: '%d of %d addresses found', 3852737319: '%s\n\nwas NOT FOUND in the first %d receive or change addresses', 3361449470: 'Check Addresses', 4143091229: 'Checking address %d for match..', 3054758377: 'Load addresses from SD card?', 67015788: 'Camera Preview', 2632697102: 'Cache Wallets', 2607262189: 'Deleted %d cached wallets'}, 'es-MX': {1185266064: '%d de %d multisig', 2004520398: '%d. Cambio: \n\n%s\n\n', 3862364126: '%d. Autotransferencia: \n\n%s\n\n', 3264377309: '%d. Gasto: \n\n%s\n\n', 2399232215: '%s\n\n¡es una dirección de cambio válida!', 3921290840: '%s\n\nes un dirección de depósito válido!', 1808355833: '%s\n\nNO FUE ENCONTRADO en las primeras %d direcciones de cambio', 1306127065: '%s\n\nNO FUE ENCONTRADO en las primeras %d direcciones de depósito', 3772416878: ',', 248832578: '.', 2739590230: '12 palabras', 1310058127: '24 palabras', 2743272264: 'ABC', 1949634023: 'Nosotros', 1517128857: 'Adafruit', 3270727197: 'Dirección', 2574498267: 'Entropía adicional desde la cámara requerida para el modo AES-CBC', 283202181: 'Alinee la cámara y Tiny Seed correctamente.', 88746165: 'Antideslumbrante desactivado', 1521033296: 'Antideslumbrante habilitado', 1056821534: '¿Estas seguro?', 3247612282: 'BIP39 Mnemónico', 3455872521: 'Atrás', 2541860807: 'Copia de seguridad del cargador de arranque..\n\n%d%%', 2256777600: 'Mala asignatura', 3937333362: 'Velocidad en baudios', 427617266: 'Bitcoin', 928727036: 'Relleno de borde', 213030954: 'CNC', 1207696150: 'Cambio', 3126552510: 'Direcciones de Cambio', 2697733395: '¡Cambios guardados en la tarjeta SD!', 388908871: 'Los cambios durarán hasta que se apague.', 3442025874: 'Verifique la tarjeta SD', 3119547911: '¿Compruebe que la dirección pertenece a esta cartera?', 2856261511: 'La dirección de cambio %d no coincide.', 2788541416: 'Comprobado %d dirección de depósito sin coincidencias.', 2446472910: 'Verificación de coincidencia de dirección de cambio %d ..', 2470115694: 'Comprobación de la tarjeta SD..', 3655273987: 'Comprobando la dirección de depósito %d para alguna coincidencia..', 2407028014: 'SeedQR Compacto', 4041895036: '¿Continuar?', 4094072796: 'Crear código QR', 167798282: '¿Crear código QR desde el texto?', 2767642191: 'Creado: ', 124617190: 'Profundidad de corte', 597912140: 'Método de corte', 2504034831: 'Decimal', 2751113454: 'Descifrar?', 1016609898: '¿Borrar archivo?', 1364509700: 'Eliminar mnemónico', 4102535566: 'Profundidad por pasada', 2791699253: 'Derivación: %s', 1230133196: 'Almacenamiento flash del dispositivo no detectado.', 3836852788: '¿Listo?', 382368239: 'Operador', 374684711: 'Cifrado mnemónico', 1244124409: 'Código QR cifrado', 2968548114: 'Mnemonic cifrado no se almacenó', 3315319371: 'Mnemónica cifrada fue almacenada con ID:', 350279787: 'Encriptación', 992186481: 'Modo de encriptación', 3504179008: 'Ingrese cada palabra de su mnemónico BIP-39 como un número del 1 al 2048.', 1100685007: 'Ingrese cada palabra de su mnemónico BIP-39 como un número en hexadecimal del 1 al 800.', 4090266642: 'Ingrese cada palabra de su mnemónico BIP-39 como un número en octal del 1 al 4000.', 2780625730: 'Ingrese cada palabra de su mnemónico BIP-39.', 784361051: 'Error:\n%s', 1505332462: 'Esc', 3838465623: 'Explorar archivos?', 1711312434: 'Llave Pública', 383371114: 'No se descife', 3048830188: 'No se puede cargar la PSBT', 4192663412: 'No se puede cargar la address', 1996021743: 'No se pudo cargar la clave', 1108715658: 'No se pudo cargar el mensaje', 1081425878: 'No se puede cargar la mnemotécnica', 928667220: 'No se pudo cargar el descriptor de salida', 1620572516: 'No se pudo cargar frase de pases', 2946146830: 'No pudo almacenar mnemonic', 1303554751: 'Comisión: ', 104500973: 'Tasa de alimentación', 2526278892: 'Archivo seleccionado:\n\n%s', 3313339187: 'Nombre del archivo', 1982637349: 'El nombre de archivo %s existe en la tarjeta SD, ¿sobrescribir?', 3737729752: 'Huella Dactilar: %s', 2542772894: 'El firmware supera el tamaño máximo: %d', 1406590538: 'Diámetro de la flauta', 3086093110: 'Libre: ', 1893243331: 'Desde el almacenamiento', 4120536442: 'GRBL', 299338213: '¿Darle a este mnemónico una identificación personalizada?De lo contrario se utilizará la huella digital actual', 602716148: 'Ir', 831562513: 'Intervalo de calor', 2300171403: 'Tiempo de calor', 3580020863: 'Clave pública hexadecimal', 2691246967: 'Hexadecimal', 2736309107: 'ID ya existe\n', 631342955: 'Entradas (%d): ', 2585599782: 'Dirección inválida', 2874529150: 'Cargador de arranque inválido', 4093416954: 'Longitud mnemotécnica no válida', 1422874211: 'Tecla pública inválida', 2443867979: 'Cartera inválida:\n%s', 4122897393: 'Invertir', 3000888649: 'Clave', 2686333978: 'Clave:', 4123798664: 'Krux\n\n\nVersión\n%s', 3835918229: 'Prueba de impresora Krux QR', 766317539: 'Idioma', 972436696: 'Retraso de línea', 3596093890: 'Línea: ', 2820726296: 'Cargar el mnemónico', 1842226768: '¿Cargar PSBT de tarjeta SD?', 1113467596: '¿Cargar mensaje de tarjeta SD?', 669106195: '¿Cargar algo?', 3330705289: '¿Cargar?', 2596531078: 'Cargando Camara..', 596389387: 'Cargando dirección de cambio %d..', 2538883522: 'Cargando dirección de recepción %d..', 3159494909: 'Cargando..', 1177338798: 'Idioma', 2817059741: 'Ubicación', 63976957: 'Nivel de registro', 86530918: 'Registro', 2917810189: 'Longitud máxima excedida (%s)', 2030045667: 'Mensaje', 3928301843: 'Falta de firma faltante', 1948316555: 'Mnemotécnica', 2123991188: 'Identificación de lo mnemónico', 3911073154: 'ID de almacenamiento mnemónico', 570639842: 'Mnemonic no fue descifrado', 1746030071: 'Mnemonic no fue descifrado', 1458925155: 'Modificado: ', 1845376098: 'Multisig', 2939797024: 'La red', 73574491: 'Nuevo Mnemónico', 2792272353: 'Nuevo firmware detectado.\n\nSHA256:\n%s\n\n\n\n¿Instalar?', 4063104189: 'No', 3927838899: 'Sin frase de contraseña BIP39', 4092516657: '¡No hay suficientes rollos!', 1577637745: 'Octales', 2662729867: 'Iteraciones PBKDF2', 721090621: 'PSBT', 995862913: 'Pinte los puntos perforados de negro para que puedan ser detectados.', 2987800462: 'Ancho del papel', 3050763890: 'Parte\n%d / %d', 3559456868: 'Tamaño de la pieza', 4249903283: 'Contraseña', 3712257341: 'Frase de pases:', 140802882: 'Salvar', 1703779997: 'QR de Texto', 3561756278: 'Cargue un descriptor de billetera', 784609464: 'Tasa de caída', 3037062877: 'Prueba de impresión QR', 4278257699: '¿Imprimir con Codigo QR?\n\n%s\n\n', 516488026: '¿Impresión?\n\n%s\n\n', 1123106929: 'Impresora', 3903571079: '¡El controlador de impresora no está configurado!', 2609799302: 'Imprimiendo\n%d / %d', 844861889: 'Imprimiendo ...', 2580599003: '¿Continuar?', 556126964: 'Procesando ...', 1848310591: 'Código QR', 710709610: 'RX Alfiler', 2697857197: 'Recepción', 1746677167: 'Direcciones de Recepción', 364354944: 'Región: ', 1662254634: 'Revise los datos escaneados, edítelos si es necesario', 2771583845: 'Tira el dado al menos %d veces para generar un mnemotécnico.', 856795528: 'Rollos:\n\n%s', 255086803: 'Rollos: %d\n', 3976793317: 'Tarjeta SD', 2827687530: 'Tarjeta SD no detectada', 2736513298: 'Tarjeta SD no detectada.', 3593785196: 'SHA256 de rollos:\n\n%s', 1143278725: 'SHA256 de la instantánea:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: '¿Guardar PSBT en la tarjeta SD?', 843701745: '¿Guardar firma en la tarjeta SD?', 242160059: 'PSBT guardado en la tarjeta SD:\n%s', 3476501088: 'Firma guardada en la tarjeta SD:\n%s', 763824768: 'Escala', 4117455079: 'Escanear Dirección', 3219991109: 'Escanear frase de pases BIP39', 2537207336: 'Escanear el código QR', 4006316572: 'Escaneo de palabras 1-12 de nuevo', 2736506158: 'Escaneo de palabras 13-24', 266935239: 'Seedqr', 1698829144: 'Autotransferencia o Cambio (%d): ', 473154195: 'Ajustes', 1825881236: 'Apagar', 3672262613: 'Apagar para cambiar el tema?', 2120776272: 'Apagando..', 1061961408: 'Firmar', 4282338366: '¿Firmar?', 2710534130: 'Firma:\n\n%s', 1988416729: 'Mensaje firmado', 3672006076: 'PSBT firmado', 3279196260: 'Single-key', 4221794628: 'Espacio: ', 2309020186: 'Gastos (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Almacenar en flash', 720041451: 'Almacenar en la tarjeta SD', 3514476519: 'Deslizar para cambiar de modo', 1898550184: 'TOQUE o ENTER para capturar', 4228215415: 'TX Alfiler', 2612594937: 'Texto', 1454688268: 'Tema', 1180180513: 'Térmico', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (bits)', 725348723: 'Herramientas', 3684696112: 'Umbral Táctil', 2978718564: 'Pantalla táctil', 2732611775: '¿Intentar con mas?', 1487826746: 'Escriba la frase de pases BIP39', 2061556020: 'Introduzca la clave', 2089395053: 'Unidad', 2845607430: 'Actualización de Bootloader..\n\n%d%%', 4164597446: 'Actualización completa.\n\nApagando..', 2736001501: 'Actualización de firmware..\n\n%d%%', 2674953168: 'Use una superficie de fondo negra.', 2402455261: 'Use la entropía de la cámara para crear una nueva mnemónica', 236075140: 'Usado: ', 4003084591: 'Valor %s fuera del rango: [ %s, %s]', 4191058607: 'Vía cámara', 1254681955: 'Via D20', 525309547: 'Via D6', 590330112: 'Mediante entrada manual', 2504354847: 'Espera la captura', 2297028319: 'Descriptor de Cartera', 4232654916: 'Descriptor de salida de billetera', 2587172867: '¡Se ha cargado el descriptor de salida de la cartera!', 2499782468: 'No se encontró el descriptor de salida de la cartera.', 1831109430: 'Advertencia:\nDescriptor de salida incompleto', 797660533: 'Palabra %d', 3742424146: 'Números de palabra', 2965123464: 'Palabras', 1303016265: 'Sí', 771968845: 'Sus cambios se guardarán en el almacenamiento flash del dispositivo.', 2569054451: 'Sus cambios se guardarán en la tarjeta SD.', 2129700639: 'Modo de color', 2589124277: 'Escáner', 1428624450: 'Lote de PSBT', 2969321168: 'PSBTs: %d', 727713407: '%d PSBTs guardados en la tarjeta SD', 1378438641: 'Indexar direcciones', 193612242: '%d direcciones indexadas', 2147369013: '%d de %d direcciones encontradas', 3852737319: '%s\n\nNO SE ENCONTRÓ en las primeras %d direcciones de recepción o cambio', 3361449470: 'Verificar direcciones', 4143091229: 'Verificando coincidencia de la dirección %d..', 3054758377: '¿Cargar direcciones desde la tarjeta SD?', 67015788: 'Vista previa de la cámara', 2632697102: 'Guardar billeteras en caché', 2607262189: '%d billeteras en caché eliminadas'}, 'vi-VN': {1185266064: '%d của %d đa chữ kí', 2004520398: '%d. Thay đổi: \n\n%s\n\n', 3862364126: '%d. Tự chuyển nhượng: \n\n%s\n\n', 3264377309: '%d. Chi tiêu: \n\n%s\n\n', 2399232215: '%s\n\nis một địa chỉ thay đổi hợp lệ!', 3921290840: '%s\n\nlà một địa chỉ khả dụng!', 1808355833: '%s\n\nKHÔNG TÌM ĐƯỢC trong địa chỉ %d đầu tiên', 1306127065: '%s\n\nKHÔNG TÌM ĐƯỢC trong địa chỉ %d đầu tiên', 3772416878: ',', 248832578: '.', 2739590230: '12 từ', 1310058127: '24 từ', 2743272264: 'ABC', 1949634023: 'Về chúng tôi', 1517128857: 'Adafruit', 3270727197: 'Địa chỉ', 2574498267: 'Entropy bổ sung từ máy ảnh cần thiết cho chế độ AES-CBC', 283202181: 'Căn chỉnh camera và Tiny Seed đúng cách.', 88746165: 'Chống lóa bị vô hiệu hóa', 1521033296: 'Đã bật chống lóa', 1056821534: 'Bạn có chắc không?', 3247612282: 'Mã mnemonic dạng chuẩn BIP39', 3455872521: 'Trở lại', 2541860807: 'Sao lưu bộ tải khởi động..\n\n%d%%', 2256777600: 'Chữ ký xấu', 3937333362: 'Tốc độ baud', 427617266: 'Bitcoin', 928727036: 'Đệm viền', 213030954: 'CNC', 1207696150: 'Thay đổi', 3126552510: 'Thay địa chỉ', 2697733395: 'Thay đổi được lưu trên thẻ SD!', 388908871: 'Thay đổi sẽ kéo dài cho đến khi tắt máy.', 3442025874: 'Kiểm tra thẻ SD', 3119547911: 'Kiểm tra địa chỉ đó có thuộc về ví này không?', 2856261511: 'Đã kiểm tra %d địa chỉ thay đổi không có kết quả phù hợp.', 2788541416: 'Đã kiểm tra %d địa chỉ nhận được và không tìm thấy tương thích.', 2446472910: 'Đang kiểm tra địa chỉ thay đổi %d để khớp..', 2470115694: 'Kiểm tra thẻ SD..', 3655273987: 'Đang kiểm tra %d địa chỉ..', 2407028014: 'SeedQR nhỏ gọn', 4041895036: 'Tiếp tục?', 4094072796: 'Tạo mã QR', 167798282: 'Tạo mã QR từ văn bản?', 2767642191: 'Tạo:', 124617190: 'Chiều sâu cắt', 597912140: 'Phương pháp cắt', 2504034831: 'Số thập phân', 2751113454: 'Phản đối?', 1016609898: 'Xóa tài liệu?', 1364509700: 'Xóa ghi nhớ', 4102535566: 'Độ sâu mỗi lần vượt qua', 2791699253: 'Nguồn gốc: %s', 1230133196: 'Không phát hiện bộ lưu trữ flash của thiết bị.', 3836852788: 'Hoàn tất?', 382368239: 'Người cầm lái', 374684711: 'Mã hóa Mnemonic', 1244124409: 'Mã QR được mã hóa', 2968548114: 'MNemon được mã hóa không được lưu trữ', 3315319371: 'Mnemonic được mã hóa được lưu trữ với ID:', 350279787: 'Mã hóa', 992186481: 'Chế độ mã hóa', 3504179008: 'Nhập từng kí tự của mã mnemonic BIP-39 của bạn dưới dạng số từ 1 đến 2048.', 1100685007: 'Nhập từng từ trong bản ghi nhớ BIP-39 của bạn dưới dạng số thập lục phân từ 1 đến 800.', 4090266642: 'Nhập từng từ trong bản ghi nhớ BIP-39 của bạn dưới dạng số bát phân từ 1 đến 4000.', 2780625730: 'Nhập từng kí tự của mã mnemonic BIP-39 của bạn.', 784361051: 'Lỗi:\n%s', 1505332462: 'Esc', 3838465623: 'Khám phá các tập tin?', 1711312434: 'Khóa công cộng', 383371114: 'Không giải mã được', 3048830188: 'Tải PSBT thất bại', 4192663412: 'Tải địa chỉ thất bại', 1996021743: 'Không tải khóa', 1108715658: 'Không tải được tin nhắn', 1081425878: 'Tải mã mnemonic thất bại', 928667220: 'Không thể tải bộ mô tả đầu ra', 1620572516: 'Không tải được cụm mật khẩu', 2946146830: 'Không lưu trữ MNemonic', 1303554751: 'Phí: ', 104500973: 'Tỷ lệ thức ăn', 2526278892: 'Tệp được chọn:\n\n%s', 3313339187: 'Tên tệp', 1982637349: 'Tên tệp %s tồn tại trên thẻ SD, ghi đè lên?', 3737729752: 'Dấu vân tay: %s', 2542772894: 'Phần sụn vượt quá kích thước tối đa: %d', 1406590538: 'Đường kính ống sáo', 3086093110: 'Khả dụng: ', 1893243331: 'Từ lưu trữ', 4120536442: 'GRBL', 299338213: 'Cung cấp cho Mnemonic này một ID tùy chỉnh?Nếu không thì dấu vân tay hiện tại sẽ được sử dụng', 602716148: 'Đến', 831562513: 'Khoảng thời gian nhiệt', 2300171403: 'Thời gian nhiệt', 3580020863: 'Khóa công khai Hex', 2691246967: 'Thập lục phân', 2736309107: 'Id đã tồn tại\n', 631342955: 'Đầu vào (%d): ', 2585599782: 'Địa chỉ không hợp lệ', 2874529150: 'Bộ tải khởi động không hợp lệ', 4093416954: 'Độ dài mã mnemonic không hợp lệ', 1422874211: 'Khóa công khai không hợp lệ', 2443867979: 'Ví không hợp lệ:\n%s', 4122897393: 'Đảo ngược', 3000888649: 'Chìa khóa', 2686333978: 'Chìa khóa:', 4123798664: 'Krux\n\n\nPhiên Bản\n%s', 3835918229: 'QR kiểm tra máy in Krux', 766317539: 'Ngôn ngữ', 972436696: 'Độ trễ Dòng', 3596093890: 'Đường kẻ: ', 2820726296: 'Tải mã mnemonic', 1842226768: 'Tải PSBT từ thẻ SD?', 1113467596: 'Chọn tệp tin nhắn từ thẻ SD?', 669106195: 'Tải một?', 3330705289: 'Tải?', 2596531078: 'Đang tải máy ảnh..', 596389387: 'Đang tải thay đổi địa chỉ %d..', 2538883522: 'Đang tải địa chỉ nhận %d..', 3159494909: 'Đang tải..', 1177338798: 'Ngôn ngữ', 2817059741: 'Vị trí cửa hàng', 63976957: 'Log Level', 86530918: 'Khai thác gỗ', 2917810189: 'Chiều dài tối đa vượt quá (%s)', 2030045667: 'Tin nhắn', 3928301843: 'Thiếu tập tin chữ ký', 1948316555: 'Mã mnemonic', 2123991188: 'ID ghi nhớ', 3911073154: 'ID lưu trữ ghi nhớ', 570639842: 'Ghi nhớ không được giải mã', 1746030071: 'Ghi nhớ không được mã hóa', 1458925155: 'Đã sửa đổi:', 1845376098: 'Đa chữ kí', 2939797024: 'Mạng lưới', 73574491: 'Mnemonic mới', 2792272353: 'Phát hiện phần sụn mới.\n\nSHA256:\n%s\n\n\n\nCài đặt phần mềm?', 4063104189: 'Không', 3927838899: 'Không có cụm mật khẩu BIP39', 4092516657: 'Không đủ cuộn!', 1577637745: 'Bát phân', 2662729867: 'Lặp lại PBKDF2', 721090621: 'PSBT', 995862913: 'Sơn các chấm đục lỗ màu đen để chúng có thể được phát hiện.', 2987800462: 'Chiều rộng giấy', 3050763890: 'Phần\n%d / %d', 3559456868: 'Kích thước một phần', 4249903283: 'Cụm mật khẩu', 3712257341: 'Cụm cụm:', 140802882: 'Vị trí lưu', 1703779997: 'Văn bản rõ QR', 3561756278: 'Vui lòng tải bộ mô tả đầu ra ví', 784609464: 'Tỷ lệ sụt giảm', 3037062877: 'In kiểm tra QR', 4278257699: 'In ra mã QR?\n\n%s\n\n', 516488026: 'In?\n\n%s\n\n', 1123106929: 'Máy in', 3903571079: 'Trình điều khiển máy in không đặt!', 2609799302: 'Đang in\n%d / %d', 844861889: 'In ấn ...', 2580599003: 'Thực hiện?', 556126964: 'Xử lý ...', 1848310591: 'Mã QR', 710709610: 'RX Ghim', 2697857197: 'Nhận được', 1746677167: 'Nhận địa chỉ', 364354944: 'Vùng: ', 1662254634: 'Xem lại dữ liệu đã quét, chỉnh sửa nếu cần', 2771583845: 'Lăn xúc xắc ít nhất %d lần để tạo khả năng ghi nhớ.', 856795528: 'Súc sắc cuộn:\n\n%s', 255086803: 'Súc sắc cuộn: %d\n', 3976793317: 'Thẻ SD', 2827687530: 'Thẻ SD không được phát hiện', 2736513298: 'Thẻ SD không được phát hiện.', 3593785196: 'SHA256 của súc sắc cuộn:\n\n%s', 1143278725: 'Sha256 của ảnh chụp nhanh:\n\n%s', 3338679392: 'SHA256:\n%s', 481947431: 'Lưu PSBT vào thẻ SD?', 843701745: 'Lưu chữ ký vào thẻ SD?', 242160059: 'Đã lưu PSBT vào thẻ SD:\n%s', 3476501088: 'Đã lưu chữ ký vào thẻ SD:\n%s', 763824768: 'Cái cân', 4117455079: 'Quét địa chỉ', 3219991109: 'Quét BIP39 Cụm cụm', 2537207336: 'Quét mã QR khóa', 4006316572: 'Quét lại từ 1-12', 2736506158: 'Quét từ 13-24', 266935239: 'SEEDQR', 1698829144: 'Tự chuyển nhượng hoặc Thay đổi (%d): ', 473154195: 'Cài đặt', 1825881236: 'Tắt', 3672262613: 'Tắt máy để thay đổi chủ đề?', 2120776272: 'Đang tắt..', 1061961408: 'Chữ kí', 4282338366: 'Kí?', 2710534130: 'Chữ ký:\n\n%s', 1988416729: 'Tin nhắn đã ký', 3672006076: 'Đã ký PSBT', 3279196260: 'Khóa đơn', 4221794628: 'Dung lượng: ', 2309020186: 'Chi tiêu (%d): ', 3355862324: 'Stackbit 1248', 3303592908: 'Lưu trữ trên flash', 720041451: 'Lưu trữ trên thẻ SD', 3514476519: 'Vuốt để thay đổi chế độ', 1898550184: 'TOUCH hoặc ENTER để chụp', 4228215415: 'TX Ghim', 2612594937: 'Chữ', 1454688268: 'Chủ đề', 1180180513: 'Nhiệt', 4119292117: 'Tiny Seed', 1732872974: 'Tiny Seed (bit)', 725348723: 'Công cụ', 3684696112: 'Ngưỡng cảm ứng', 2978718564: 'Màn hình cảm ứng', 2732611775: 'Thử thêm nữa?', 1487826746: 'Nhập cụm BIP39', 2061556020: 'Nhập khóa', 2089395053: 'Đơn vị', 2845607430: 'Cập nhật bộ tải khởi động..\n\n%d%%', 4164597446: 'Nâng cấp hoàn tất.\n\nĐang Tắt..', 2736001501: 'Nâng cấp firmware..\n\n%d%%', 2674953168: 'Sử dụng bề mặt nền đen.', 2402455261: 'Sử dụng entropy của máy ảnh để tạo ra một bản ghi âm mới', 236075140: 'Đã sử dụng: ', 4003084591: 'Giá trị %s ngoài phạm vi: [ %s, %s]', 4191058607: 'Qua máy ảnh', 1254681955: 'Qua D20', 525309547: 'Qua D6', 590330112: 'Thông qua đầu vào thủ công', 2504354847: 'Chờ bắt', 2297028319: 'Trình mô tả ví', 4232654916: 'Ví đầu ra mô tả', 2587172867: 'Đã tải bộ mô tả đầu ra của ví!', 2499782468: 'Không tìm thấy bộ mô tả đầu ra ví.', 1831109430: 'Cảnh báo:\nBộ mô tả đầu ra chưa hoàn chỉnh', 797660533: 'Kí tự %d', 3742424146: 'Từ số', 2965123464: 'Từ ngữ', 1303016265: 'Đúng', 771968845: 'Thay đổi của bạn sẽ được lưu trên bộ nhớ flash của thiết bị.', 2569054451: 'Các thay đổi của bạn sẽ được lưu trên thẻ SD.', 2129700639: 'Chế độ màu', 2589124277: 'Máy quét', 1428624450: 'Lô PSBT', 2969321168: 'PSBT: %d', 727713407: 'Đã lưu %d PSBT vào thẻ SD', 1378438641: 'Lập chỉ mục địa chỉ', 193612242: 'Đã lập chỉ mục %d địa chỉ', 2147369013: 'Tìm thấy %d trên %d địa chỉ', 3852737319: '%s\n\nKHÔNG TÌM THẤY trong %d địa chỉ nhận hoặc tiền thối đầu tiên', 3361449470: 'Kiểm tra địa chỉ', 4143091229: 'Đang kiểm tra địa chỉ %d..', 3054758377: 'Tải địa chỉ từ thẻ SD?', 67015788: 'Xem trước máy ảnh', 2632697102: 'Lưu bộ nhớ đệm ví', 2607262189: 'Đã xóa %d ví trong bộ nhớ đệm'}}
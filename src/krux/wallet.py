@@ -23,13 +23,30 @@ try:
     import ujson as json
 except ImportError:
     import json
+import hashlib
+import hmac
+import io
+import os
+from binascii import hexlify
 from ur.ur import UR
 from embit.descriptor.descriptor import Descriptor
 from embit.descriptor.arguments import Key, KeyHash, AllowedDerivation
+from embit import compact, script as embit_script
+from embit.bip32 import HARDENED_INDEX
 from embit.script import Script, address_to_scriptpubkey
 import urtypes
 from .krux_settings import t
 
+# Max number of intermediate nodes kept by a DerivationCache
+DERIVATION_CACHE_SIZE = 32
+# Max number of address pages kept by an AddressPageCache
+ADDRESS_PAGE_CACHE_SIZE = 8
+
+WALLET_CACHE_MAGIC = b"KWC\x02"
+WALLET_CACHE_MAC_SIZE = 32
+WALLET_CACHE_PREFIX = "wallet-"
+WALLET_CACHE_EXTENSION = ".cache"
+
 
 class Wallet:
     """Represents the wallet that the current key belongs to"""
@@ -41,10 +58,14 @@ class Wallet:
         self.descriptor = None
         self.label = None
         self.policy = None
+        self.derivations = DerivationCache()
+        self.addresses = None
+        self.address_pages = AddressPageCache()
         if not self.key.multisig:
             self.descriptor = Descriptor.from_string(
                 "wpkh(%s/{0,1}/*)" % self.key.key_expression()
             )
+            self.addresses = AddressEngine(self.descriptor)
             self.label = t("Single-key")
             self.policy = {"type": self.descriptor.scriptpubkey_type()}
 
@@ -77,11 +98,10 @@ class Wallet:
         self.wallet_data = wallet_data
         self.wallet_qr_format = qr_format
         self.descriptor = to_unambiguous_descriptor(descriptor)
-        self.label = label
+        self.addresses = AddressEngine(self.descriptor)
+        self.address_pages.clear()
 
         if self.descriptor.key:
-            if not self.label:
-                self.label = t("Single-key")
             self.policy = {"type": self.descriptor.scriptpubkey_type()}
         else:
             m = int(str(self.descriptor.miniscript.args[0]))
@@ -89,29 +109,325 @@ class Wallet:
             cosigners = [key.key.to_base58() for key in self.descriptor.keys]
             if self.descriptor.is_sorted:
                 cosigners = sorted(cosigners)
-            if not self.label:
-                self.label = t("%d of %d multisig") % (m, n)
             self.policy = {
                 "type": self.descriptor.scriptpubkey_type(),
                 "m": m,
                 "n": n,
                 "cosigners": cosigners,
             }
+        self.label = label or self.default_label()
+
+    def default_label(self):
+        """Returns the label of a wallet whose data doesn't name it"""
+        if "cosigners" in self.policy:
+            return t("%d of %d multisig") % (self.policy["m"], self.policy["n"])
+        return t("Single-key")
+
+    def cache_filename(self, wallet_data):
+        """Returns the name of the fast-load cache file of the wallet data for
+        this key
+        """
+        digest = hashlib.sha256(
+            wallet_data_bytes(wallet_data) + self.key.fingerprint
+        ).digest()
+        return (
+            WALLET_CACHE_PREFIX + hexlify(digest[:8]).decode() + WALLET_CACHE_EXTENSION
+        )
+
+    def _cache_mac(self, wallet_data, payload):
+        # Keyed with our private account key, so a cache can't be forged, and
+        # bound to the wallet data, so it can't be copied to another one
+        secret = self.key.signing_node().key.secret
+        return hmac.new(
+            secret,
+            WALLET_CACHE_MAGIC + wallet_data_bytes(wallet_data) + payload,
+            digestmod="sha256",
+        ).digest()
+
+    def write_cache(self, stream):
+        """Writes the loaded, validated wallet to the stream as a fast-load cache: a
+        compact record of its unambiguous descriptor, the label its data names it
+        by, if any, and its policy
+        """
+        # The default label is left out, so it follows the locale when loaded
+        label = self.label if self.label != self.default_label() else ""
+        # Cosigners are recorded by the index of their key in the descriptor
+        keys = [key.key.to_base58() for key in self.descriptor.keys]
+        cosigners = self.policy.get("cosigners", [])
+        payload = bytearray()
+        for text in (self.descriptor.to_string(), label, self.policy["type"]):
+            data = text.encode()
+            payload += compact.to_bytes(len(data)) + data
+        payload += compact.to_bytes(self.policy.get("m", 0))
+        payload += compact.to_bytes(len(cosigners))
+        for cosigner in cosigners:
+            payload += compact.to_bytes(keys.index(cosigner))
+        stream.write(WALLET_CACHE_MAGIC)
+        stream.write(self._cache_mac(self.wallet_data, payload))
+        stream.write(payload)
+
+    def load_cached(self, wallet_data, qr_format, stream):
+        """Loads the wallet from a fast-load cache written by write_cache for the
+        same wallet data, skipping its parsing and validation
+        """
+        data = stream.read()
+        header_size = len(WALLET_CACHE_MAGIC) + WALLET_CACHE_MAC_SIZE
+        if data[: len(WALLET_CACHE_MAGIC)] != WALLET_CACHE_MAGIC:
+            raise ValueError("invalid wallet cache")
+        payload = data[header_size:]
+        if not digests_equal(
+            data[len(WALLET_CACHE_MAGIC) : header_size],
+            self._cache_mac(wallet_data, payload),
+        ):
+            raise ValueError("invalid wallet cache")
+        record = io.BytesIO(payload)
+        descriptor, label, script_type = [
+            record.read(compact.read_from(record)).decode() for _ in range(3)
+        ]
+        m = compact.read_from(record)
+        n = compact.read_from(record)
+        descriptor = Descriptor.from_string(descriptor)
+        policy = {"type": script_type}
+        if n:
+            policy["m"] = m
+            policy["n"] = n
+            policy["cosigners"] = [
+                descriptor.keys[compact.read_from(record)].key.to_base58()
+                for _ in range(n)
+            ]
+
+        self.wallet_data = wallet_data
+        self.wallet_qr_format = qr_format
+        self.descriptor = descriptor
+        self.addresses = AddressEngine(self.descriptor)
+        self.address_pages.clear()
+        self.policy = policy
+        self.label = label or self.default_label()
 
     def wallet_qr(self):
         """Returns the original wallet data and qr format for display back as a QR code"""
         return (self.wallet_data, self.wallet_qr_format)
 
-    def obtain_addresses(self, i=0, limit=None, branch_index=0):
-        """Returns an iterator deriving addresses (default branch_index is receive)
-        for the wallet up to the provided limit"""
+    def obtain_scriptpubkeys(self, i=0, limit=None, branch_index=0):
+        """Returns an iterator deriving scriptpubkeys (default branch_index is
+        receive) for the wallet up to the provided limit"""
         starting_index = i
         while limit is None or i < starting_index + limit:
-            yield self.descriptor.derive(i, branch_index=branch_index).address(
-                network=self.key.network
-            )
+            yield self.addresses.scriptpubkey(i, branch_index)
             i += 1
 
+    def obtain_addresses(self, i=0, limit=None, branch_index=0):
+        """Returns an iterator deriving addresses (default branch_index is receive)
+        for the wallet up to the provided limit"""
+        for sc in self.obtain_scriptpubkeys(i, limit, branch_index):
+            yield sc.address(network=self.key.network)
+
+    def address_page(self, i, size, branch_index=0, progress=None):
+        """Returns the list of size addresses starting at index i of the branch,
+        reusing recently derived pages. Calls progress(n) after deriving each
+        address of a page that is not cached.
+        """
+        key = (branch_index, i, size)
+        page = self.address_pages.get(key)
+        if page is None:
+            page = []
+            for addr in self.obtain_addresses(i, limit=size, branch_index=branch_index):
+                page.append(addr)
+                if progress is not None:
+                    progress(len(page))
+            self.address_pages.put(key, page)
+        return page
+
+    def prefetch_address_page(self, i, size, branch_index=0):
+        """Generator caching the page address_page would return, deriving one
+        address per step, so it can be run a little at a time
+        """
+        key = (branch_index, i, size)
+        if self.address_pages.get(key) is not None:
+            return
+        page = []
+        for addr in self.obtain_addresses(i, limit=size, branch_index=branch_index):
+            page.append(addr)
+            yield
+        self.address_pages.put(key, page)
+
+
+class AddressPageCache:
+    """Keeps the max_pages most recently used pages of addresses, so paging back
+    and forth through them doesn't derive them again
+    """
+
+    def __init__(self, max_pages=ADDRESS_PAGE_CACHE_SIZE):
+        self.max_pages = max_pages
+        self.pages = {}
+        self.order = []
+
+    def get(self, key):
+        """Returns the page stored under key, or None, marking it as recently used"""
+        page = self.pages.get(key)
+        if page is not None:
+            self.order.remove(key)
+            self.order.append(key)
+        return page
+
+    def put(self, key, page):
+        """Stores the page under key, evicting the least recently used page when
+        full
+        """
+        if key in self.pages:
+            self.order.remove(key)
+        elif len(self.order) >= self.max_pages:
+            del self.pages[self.order.pop(0)]
+        self.pages[key] = page
+        self.order.append(key)
+
+    def clear(self):
+        """Releases all cached pages"""
+        self.pages = {}
+        self.order = []
+
+
+class AddressEngine:
+    """Derives the scriptpubkeys of a descriptor one index at a time. The branch
+    nodes (.../0, .../1) of every key are derived once, so each address only
+    takes the last non-hardened step, and scripts are built straight from the
+    pubkeys. Descriptors other than single-key or basic multisig fall back to
+    Descriptor.derive.
+    """
+
+    def __init__(self, descriptor):
+        self.descriptor = descriptor
+        self.branches = {}
+        self.threshold = None
+        if descriptor.is_basic_multisig:
+            self.threshold = int(str(descriptor.miniscript.args[0]))
+        self.incremental = (
+            descriptor.scriptpubkey_type() != "p2tr"
+            and (descriptor.key is not None or self.threshold is not None)
+            and all(self._derivable(key) for key in descriptor.keys)
+        )
+
+    @staticmethod
+    def _derivable(key):
+        if not key.is_extended or key.allowed_derivation is None:
+            return False
+        indexes = key.allowed_derivation.indexes
+        if not indexes or indexes[-1] is not None:
+            return False
+        for index in indexes[:-1]:
+            for i in index if isinstance(index, list) else [index]:
+                if i is None or i >= HARDENED_INDEX:
+                    return False
+        return True
+
+    def branch_nodes(self, branch_index):
+        """Returns the branch node of every key, derived on first use"""
+        if branch_index not in self.branches:
+            self.branches[branch_index] = [
+                key.key.derive(key.allowed_derivation.fill(0, branch_index)[:-1])
+                for key in self.descriptor.keys
+            ]
+        return self.branches[branch_index]
+
+    def scriptpubkey(self, i, branch_index=0):
+        """Returns the scriptpubkey at index i of the branch"""
+        if not self.incremental:
+            return self.descriptor.derive(i, branch_index=branch_index).script_pubkey()
+        pubkeys = [node.child(i).key for node in self.branch_nodes(branch_index)]
+        if self.threshold is None:
+            if self.descriptor.is_legacy:
+                sc = embit_script.p2pkh(pubkeys[0])
+            else:
+                sc = embit_script.p2wpkh(pubkeys[0])
+        else:
+            if self.descriptor.is_sorted:
+                pubkeys.sort(key=lambda pubkey: pubkey.sec())
+            sc = embit_script.multisig(self.threshold, pubkeys)
+            if self.descriptor.wsh:
+                sc = embit_script.p2wsh(sc)
+        if self.descriptor.sh:
+            sc = embit_script.p2sh(sc)
+        return sc
+
+
+class DerivationCache:
+    """Memoizes the intermediate nodes of BIP32 derivations, so keys of an
+    already seen branch (.../0 or .../1) are derived in a single step. Nodes
+    are keyed by the parent key's chain code and key, not by the HDKey object,
+    so equal keys parsed from different PSBTs share them. Keeps the max_nodes
+    most recently used nodes.
+    """
+
+    def __init__(self, max_nodes=DERIVATION_CACHE_SIZE):
+        self.max_nodes = max_nodes
+        self.nodes = {}
+        self.order = []
+
+    def derive(self, xpub, path):
+        """Returns the key derived from xpub along path, a sequence of
+        non-hardened indexes
+        """
+        if not path:
+            return xpub
+        prefix = tuple(path[:-1])
+        if not prefix:
+            return xpub.child(path[-1])
+        xpub_id = xpub.chain_code + xpub.key.serialize()
+        return self._node(xpub, xpub_id, prefix).child(path[-1])
+
+    def _node(self, xpub, xpub_id, prefix):
+        key = (xpub_id, prefix)
+        node = self.nodes.get(key)
+        if node is not None:
+            self.order.remove(key)
+            self.order.append(key)
+            return node
+        if len(prefix) == 1:
+            node = xpub.child(prefix[0])
+        else:
+            node = self._node(xpub, xpub_id, prefix[:-1]).child(prefix[-1])
+        if len(self.order) >= self.max_nodes:
+            del self.nodes[self.order.pop(0)]
+        self.nodes[key] = node
+        self.order.append(key)
+        return node
+
+    def clear(self):
+        """Releases all cached nodes"""
+        self.nodes = {}
+        self.order = []
+
+
+def delete_wallet_caches(folder):
+    """Deletes the fast-load wallet caches in the folder, returning how many"""
+    deleted = 0
+    for filename in os.listdir(folder):
+        if filename.startswith(WALLET_CACHE_PREFIX) and filename.endswith(
+            WALLET_CACHE_EXTENSION
+        ):
+            os.remove(folder + "/" + filename)
+            deleted += 1
+    return deleted
+
+
+def wallet_data_bytes(wallet_data):
+    """Returns the wallet data as bytes, whatever form it was read in"""
+    if isinstance(wallet_data, UR):
+        return wallet_data.type.encode() + wallet_data.cbor
+    if isinstance(wallet_data, str):
+        return wallet_data.encode()
+    return wallet_data
+
+
+def digests_equal(a, b):
+    """Compares two digests in constant time, as hmac.compare_digest is not
+    available on the firmware
+    """
+    diff = len(a) ^ len(b)
+    for x, y in zip(a, b):
+        diff |= x ^ y
+    return diff == 0
+
 
 def to_unambiguous_descriptor(descriptor):
     """If child derivation info is missing to generate receive addresses,
@@ -253,3 +569,25 @@ def parse_address(address_data):
         raise ValueError("invalid address")
 
     return addr
+
+
+def parse_addresses(addresses_data):
+    """Parses a list of addresses separated by whitespace, commas or semicolons,
+    returning them without duplicates in their original order.
+
+    If any of the addresses cannot be parsed, an exception is raised.
+    """
+    if isinstance(addresses_data, bytes):
+        addresses_data = addresses_data.decode()
+    for separator in ",;":
+        addresses_data = addresses_data.replace(separator, " ")
+    addrs = []
+    seen = set()
+    for address_data in addresses_data.split():
+        addr = parse_address(address_data)
+        if addr not in seen:
+            seen.add(addr)
+            addrs.append(addr)
+    if not addrs:
+        raise ValueError("no addresses")
+    return addrs
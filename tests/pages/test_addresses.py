@@ -0,0 +1,370 @@
+from ..shared_mocks import MockPrinter, get_mock_fs
+from .conftest import create_ctx
+
+
+def test_list_address_type(mocker, m5stickv, tdata):
+    from krux.pages.addresses import Addresses
+    from krux.wallet import Wallet
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE_PREV
+
+    wallet = Wallet(tdata.SINGLEKEY_12_WORD_KEY)
+    btn_seq = [
+        BUTTON_PAGE_PREV,  # Back
+        BUTTON_PAGE_PREV,  # 5..8
+        BUTTON_ENTER,  # Next page
+        BUTTON_ENTER,  # 1..4, previous page
+        BUTTON_PAGE_PREV,  # Back
+        BUTTON_ENTER,
+    ]
+    ctx = create_ctx(mocker, btn_seq, wallet, None)
+    addresses = Addresses(ctx)
+    mocker.spy(wallet, "obtain_addresses")
+    # Prefetching finishes before any input
+    mocker.patch("time.ticks_ms", new=mocker.MagicMock(return_value=0))
+
+    addresses.list_address_type()
+
+    # Each page is derived once, the next one ahead of time, revisits are cached
+    assert [call.args[0] for call in wallet.obtain_addresses.call_args_list] == [
+        0,
+        4,
+        8,
+    ]
+    ctx.display.draw_centered_text.assert_called_once_with(
+        "Loading receive address 1.."
+    )
+    assert ctx.input.wait_for_button.call_count == len(btn_seq)
+
+
+def test_scan_address(mocker, m5stickv, tdata):
+    from krux.pages.addresses import Addresses
+    from krux.wallet import Wallet
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE
+    from krux.qr import FORMAT_PMOFN, FORMAT_NONE
+
+    cases = [
+        # Single-key, loaded, owned address, No print prompt, search successful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "bc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER],
+        ),
+        # Single-key, not loaded, owned address, No print prompt, search successful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            False,
+            "bc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, owned address, Print, search successful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "bc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y",
+            MockPrinter(),
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, owned address, Decline to print, search successful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "bc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y",
+            MockPrinter(),
+            True,
+            [BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER, BUTTON_ENTER],
+        ),
+        # Multisig, loaded, owned address, No print prompt, search successful
+        (
+            tdata.MULTISIG_12_WORD_KEY,
+            tdata.SPECTER_MULTISIG_WALLET_DATA,
+            True,
+            "bc1q6y95p2qkcmsr7kp5zpnt04qx5l2slq73d9um62ka3s5nr83mlcfsywsn65",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER],
+        ),
+        # Multisig, not loaded, owned address, No print prompt, can't search
+        (
+            tdata.MULTISIG_12_WORD_KEY,
+            tdata.SPECTER_MULTISIG_WALLET_DATA,
+            False,
+            "bc1q6y95p2qkcmsr7kp5zpnt04qx5l2slq73d9um62ka3s5nr83mlcfsywsn65",
+            None,
+            True,
+            [BUTTON_ENTER],
+        ),
+        # Multisig, loaded, owned address, Print, search successful
+        (
+            tdata.MULTISIG_12_WORD_KEY,
+            tdata.SPECTER_MULTISIG_WALLET_DATA,
+            True,
+            "bc1q6y95p2qkcmsr7kp5zpnt04qx5l2slq73d9um62ka3s5nr83mlcfsywsn65",
+            MockPrinter(),
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER],
+        ),
+        # Multisig, loaded, owned address, Decline to print, search successful
+        (
+            tdata.MULTISIG_12_WORD_KEY,
+            tdata.SPECTER_MULTISIG_WALLET_DATA,
+            True,
+            "bc1q6y95p2qkcmsr7kp5zpnt04qx5l2slq73d9um62ka3s5nr83mlcfsywsn65",
+            MockPrinter(),
+            True,
+            [BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, unowned address, No print prompt, search unsuccessful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "bc1q6y95p2qkcmsr7kp5zpnt04qx5l2slq73d9um62ka3s5nr83mlcfsywsn65",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Multisig, loaded, unowned address, No print prompt, search unsuccessful
+        (
+            tdata.MULTISIG_12_WORD_KEY,
+            tdata.SPECTER_MULTISIG_WALLET_DATA,
+            True,
+            "bc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, unowned m/44 address, No print prompt, skip search
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "14ihRbmxbgZ6JN9HdDDo6u6nGradHDy4GJ",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_PAGE],
+        ),
+        # Single-key, loaded, unowned m/44 address, No print prompt, search unsuccessful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "14ihRbmxbgZ6JN9HdDDo6u6nGradHDy4GJ",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, unowned m/44 address, No print prompt, 2x search unsuccessful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "14ihRbmxbgZ6JN9HdDDo6u6nGradHDy4GJ",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, unowned m/48/0/0/2 address, No print prompt, search unsuccessful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "1BRwWQ3GHabCV5DP6MfnCpr6dF6GBAwQ7k",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, unowned m/84 address, No print prompt, search unsuccessful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "bc1qx2zuday8d6j4ufh4df6e9ttd06lnfmn2cuz0vn",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, unowned m/49 address, No print prompt, search unsuccessful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "32iCX1pY1iztdgM5qzurGLPMu5xhNfAUtg",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, unowned m/0 address, No print prompt, search unsuccessful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "3KLoUhwLihgC5aPQPFHakWUtJ4QoBkT7Aw",
+            None,
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, unowned m/0 address, Print, search unsuccessful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "3KLoUhwLihgC5aPQPFHakWUtJ4QoBkT7Aw",
+            MockPrinter(),
+            True,
+            [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, unowned m/0 address, Decline to print, search unsuccessful
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "3KLoUhwLihgC5aPQPFHakWUtJ4QoBkT7Aw",
+            MockPrinter(),
+            True,
+            [BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER, BUTTON_PAGE, BUTTON_ENTER],
+        ),
+        # Single-key, loaded, fail to capture QR of address, No print prompt, can't search
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            None,
+            None,
+            False,
+            [],
+        ),
+        # Single-key, loaded, invalid address, No print prompt, can't search
+        (
+            tdata.SINGLEKEY_12_WORD_KEY,
+            tdata.SPECTER_SINGLEKEY_WALLET_DATA,
+            True,
+            "invalidaddress",
+            None,
+            False,
+            [],
+        ),
+    ]
+    for case in cases:
+        wallet = Wallet(case[0])
+        if case[2]:
+            wallet.load(case[1], FORMAT_PMOFN)
+
+        ctx = create_ctx(mocker, case[6], wallet, case[4])
+        addresses = Addresses(ctx)
+        mocker.patch.object(
+            addresses, "capture_qr_code", new=lambda: (case[3], FORMAT_NONE)
+        )
+        mocker.patch.object(
+            addresses,
+            "display_qr_codes",
+            new=lambda data, qr_format, title=None, allow_any_btn=True: ctx.input.wait_for_button(),
+        )
+        mocker.spy(addresses, "print_qr_prompt")
+        mocker.spy(addresses, "capture_qr_code")
+        mocker.spy(addresses, "display_qr_codes")
+
+        addresses.scan_address()
+
+        addresses.capture_qr_code.assert_called_once()
+        if case[5]:
+            addresses.display_qr_codes.assert_called_once()
+            addresses.print_qr_prompt.assert_called_once()
+        else:
+            addresses.display_qr_codes.assert_not_called()
+            addresses.print_qr_prompt.assert_not_called()
+
+        assert ctx.input.wait_for_button.call_count == len(case[6])
+
+
+def test_scan_address_with_index(mocker, m5stickv, tdata):
+    from krux.pages.addresses import Addresses
+    from krux.wallet import Wallet
+    from krux.input import BUTTON_ENTER
+    from krux.qr import FORMAT_NONE
+
+    files = {}
+    mocker.patch("builtins.open", new=get_mock_fs(files))
+    mocker.patch("os.listdir", new=mocker.MagicMock(return_value=[]))
+    mocker.patch("krux.address_index.ADDRESS_INDEX_STEP", 5)
+
+    wallet = Wallet(tdata.SINGLEKEY_12_WORD_KEY)
+    btn_seq = [BUTTON_ENTER, BUTTON_ENTER, BUTTON_ENTER]
+    ctx = create_ctx(mocker, btn_seq, wallet, None)
+    addresses = Addresses(ctx)
+
+    addresses.index_addresses()
+    addresses.index_addresses()
+    assert len([f for f in files if f.startswith("/sd/addresses-")]) == 1
+    ctx.display.flash_text.assert_called_with("Indexed 20 addresses")
+
+    mocker.patch.object(
+        addresses,
+        "capture_qr_code",
+        new=lambda: ("bc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y", FORMAT_NONE),
+    )
+    mocker.patch.object(
+        addresses,
+        "display_qr_codes",
+        new=lambda data, qr_format, title=None, allow_any_btn=True: ctx.input.wait_for_button(),
+    )
+    mocker.spy(wallet, "obtain_scriptpubkeys")
+
+    addresses.scan_address()
+
+    wallet.obtain_scriptpubkeys.assert_not_called()
+    ctx.display.draw_centered_text.assert_called_with(
+        "1. \n\nbc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y\n\nis a valid receive address!"
+    )
+    assert ctx.input.wait_for_button.call_count == len(btn_seq)
+
+
+def test_check_addresses(mocker, m5stickv, tdata):
+    from krux.pages.addresses import Addresses
+    from krux.wallet import Wallet
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(tdata.SINGLEKEY_12_WORD_KEY)
+    change_addr = list(wallet.obtain_addresses(42, limit=1, branch_index=1))[0]
+    unrelated_addr = "bc1q6y95p2qkcmsr7kp5zpnt04qx5l2slq73d9um62ka3s5nr83mlcfsywsn65"
+    data = "bc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y, %s\n%s\n" % (
+        change_addr,
+        unrelated_addr,
+    )
+    btn_seq = [
+        BUTTON_PAGE,  # Try more? No
+        BUTTON_ENTER,  # Summary
+        BUTTON_ENTER,  # Receive address result
+        BUTTON_ENTER,  # Change address result
+        BUTTON_ENTER,  # Not found result
+    ]
+    ctx = create_ctx(mocker, btn_seq, wallet, None)
+    addresses = Addresses(ctx)
+    mocker.patch.object(addresses, "capture_qr_code", new=lambda: (data, FORMAT_NONE))
+    mocker.spy(wallet, "obtain_scriptpubkeys")
+
+    addresses.check_addresses()
+
+    assert wallet.obtain_scriptpubkeys.call_count == 2
+    ctx.display.draw_centered_text.assert_any_call("2 of 3 addresses found")
+    ctx.display.draw_centered_text.assert_any_call(
+        "1. \n\nbc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y\n\nis a valid receive address!"
+    )
+    ctx.display.draw_centered_text.assert_any_call(
+        "43. \n\n%s\n\nis a valid change address!" % change_addr
+    )
+    ctx.display.draw_centered_text.assert_called_with(
+        "%s\n\nwas NOT FOUND in the first 100 receive or change addresses"
+        % unrelated_addr
+    )
+    assert ctx.input.wait_for_button.call_count == len(btn_seq)
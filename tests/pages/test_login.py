@@ -355,6 +355,49 @@ def test_load_12w_camera_qrcode_words(m5stickv, mocker, mocker_printer):
     assert ctx.wallet.key.mnemonic == MNEMONIC
 
 
+def test_load_key_forgets_seed_of_rejected_fingerprint(
+    m5stickv, mocker, mocker_printer
+):
+    from krux import key as key_module
+    from krux.pages.login import Login
+    from krux.input import BUTTON_ENTER, BUTTON_PAGE
+    from krux.qr import FORMAT_NONE
+
+    BTN_SEQUENCE = (
+        # 1 press to proceed with the 12 words
+        [BUTTON_ENTER]
+        +
+        # 2 presses to move to No passphrase and 1 to skip it
+        [BUTTON_PAGE, BUTTON_PAGE, BUTTON_ENTER]
+        +
+        # 1 press to reject the fingerprint
+        [BUTTON_PAGE]
+        +
+        # Skip the passphrase again and confirm the fingerprint
+        [BUTTON_PAGE, BUTTON_PAGE, BUTTON_ENTER, BUTTON_ENTER]
+        +
+        # 1 press to select single-key
+        [BUTTON_ENTER]
+    )
+    MNEMONIC = (
+        "olympic term tissue route sense program under choose bean emerge velvet absurd"
+    )
+
+    ctx = create_ctx(mocker, BTN_SEQUENCE)
+    login = Login(ctx)
+    mocker.patch.object(
+        login, "capture_qr_code", mocker.MagicMock(return_value=(MNEMONIC, FORMAT_NONE))
+    )
+    forget_seed = mocker.spy(key_module, "forget_seed")
+    mocker.patch("krux.pages.login.forget_seed", new=forget_seed)
+    login.load_key_from_qr_code()
+
+    assert ctx.wallet.key.mnemonic == MNEMONIC
+    forget_seed.assert_called_once()
+    # The loaded key keeps its seed memoized
+    assert list(key_module.SEED_MEMO) == [(MNEMONIC, "")]
+
+
 def test_load_12w_camera_qrcode_numbers(m5stickv, mocker, mocker_printer):
     from krux.pages.login import Login
     from krux.input import BUTTON_ENTER, BUTTON_PAGE
@@ -1419,6 +1462,7 @@ def test_settings_m5stickv(m5stickv, mocker, mocker_printer):
                 # Leave Settings
                 BUTTON_PAGE,
                 BUTTON_PAGE,
+                BUTTON_PAGE,
                 BUTTON_ENTER,
             ),
             [
@@ -1463,6 +1507,7 @@ def test_settings_m5stickv(m5stickv, mocker, mocker_printer):
                 BUTTON_PAGE,
                 BUTTON_PAGE,
                 BUTTON_PAGE,
+                BUTTON_PAGE,
                 BUTTON_ENTER,
             ),
             [
@@ -1520,6 +1565,7 @@ def test_settings_m5stickv(m5stickv, mocker, mocker_printer):
                 # Leave Settings
                 BUTTON_PAGE,
                 BUTTON_PAGE,
+                BUTTON_PAGE,
                 BUTTON_ENTER,
             ),
             [
@@ -1568,7 +1614,7 @@ def test_settings_on_amigo_tft(amigo_tft, mocker, mocker_printer):
     LOCALE_INDEX = 2
     LOGGING_INDEX = 3
     PRINTER_INDEX = 5
-    LEAVE_INDEX = 8
+    LEAVE_INDEX = 9
 
     cases = [
         (
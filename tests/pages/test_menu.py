@@ -62,6 +62,45 @@ def test_run_loop(mocker, m5stickv):
     assert status == MENU_EXIT
 
 
+def test_run_loop_steps_prefetch_between_input_polls(mocker, m5stickv):
+    import itertools
+    import time
+    from krux.pages import Menu, MENU_EXIT, PREFETCH_STEP_TIME
+    from krux.input import BUTTON_ENTER
+
+    ctx = mock_context(mocker)
+    ctx.power_manager.battery_charge_remaining.return_value = 1
+    menu = Menu(ctx, [("Option", lambda: MENU_EXIT)])
+    steps = []
+
+    def prefetch():
+        for i in range(5):
+            steps.append(i)
+            yield
+
+    # Every step takes longer than the time allowed between polls
+    mocker.patch.object(
+        time,
+        "ticks_ms",
+        new=mocker.MagicMock(side_effect=itertools.count(0, PREFETCH_STEP_TIME + 1)),
+    )
+    ctx.input.wait_for_button.side_effect = [None, BUTTON_ENTER]
+
+    assert menu.run_loop(prefetch=prefetch()) == (0, MENU_EXIT)
+    assert steps == [0, 1]
+    ctx.input.wait_for_button.assert_called_with(block=False, wait_duration=0)
+
+    # Done before the user presses anything, then waits for input as usual
+    steps.clear()
+    mocker.patch.object(time, "ticks_ms", new=mocker.MagicMock(return_value=0))
+    ctx.input.wait_for_button.reset_mock()
+    ctx.input.wait_for_button.side_effect = [BUTTON_ENTER]
+
+    assert menu.run_loop(prefetch=prefetch()) == (0, MENU_EXIT)
+    assert steps == [0, 1, 2, 3, 4]
+    ctx.input.wait_for_button.assert_called_once_with()
+
+
 def test_run_loop_on_amigo_tft(mocker, amigo_tft):
     from krux.pages import Menu, MENU_CONTINUE, MENU_EXIT, MENU_SHUTDOWN
     from krux.input import BUTTON_ENTER, BUTTON_PAGE, BUTTON_PAGE_PREV, BUTTON_TOUCH
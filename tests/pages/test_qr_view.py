@@ -0,0 +1,23 @@
+from .conftest import create_ctx
+
+
+def test_highlight_last_region_of_29x29_code(mocker, m5stickv):
+    from krux.pages.qr_view import SeedQRView
+    from krux.qr_matrix import QRMatrix
+    from krux.themes import WHITE, BLACK
+
+    code = QRMatrix(29)
+    code.data[:] = b"\xff" * len(code.data)
+    ctx = create_ctx(mocker, [], None, None)
+    seed_qr_view = SeedQRView(ctx, code=code, title="Test")
+    assert seed_qr_view.region_size == 5
+
+    # The last region spans rows and columns 25..29, one module past the code
+    seed_qr_view.highlight_qr_region(code, region=(25, 25, 5, 5))
+
+    colors = [call.args[4] for call in ctx.display.fill_rectangle.call_args_list]
+    assert len(colors) == 25
+    for y in range(5):
+        for x in range(5):
+            expected = BLACK if x < 4 and y < 4 else WHITE
+            assert colors[y * 5 + x] == expected
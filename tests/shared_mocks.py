@@ -42,6 +42,23 @@ def get_mock_open(files: dict[str, str]):
     return mock.MagicMock(side_effect=open_mock)
 
 
+def get_mock_fs(files: dict[str, bytes]):
+    """Returns an open mock backed by files, where written files are stored
+    when closed and missing files raise OSError"""
+    from io import BytesIO
+
+    def open_mock(filename, mode="r", *args, **kwargs):
+        if "r" in mode:
+            if filename not in files:
+                raise OSError("(mock) Unable to open {filename}")
+            return BytesIO(files[filename])
+        stream = BytesIO()
+        stream.close = lambda: files.update({filename: stream.getvalue()})
+        return stream
+
+    return mock.MagicMock(side_effect=open_mock)
+
+
 def statvfs(_):
     return (8192, 8192, 1896512, 1338303, 1338303, 0, 0, 0, 0, 255)
 
@@ -106,11 +123,15 @@ class Mockqrcode:
     def payload(self):
         return self.data
 
+    def rect(self):
+        return (100, 80, 80, 80)
+
 
 SNAP_SUCCESS = 0
 SNAP_HISTOGRAM_FAIL = 1
 SNAP_FIND_QRCODES_FAIL = 2
 SNAP_REPEAT_QRCODE = 3
+SNAP_MULTIPLE_QRCODES = 4
 
 
 def snapshot_generator(outcome=SNAP_SUCCESS):
@@ -120,12 +141,22 @@ def snapshot_generator(outcome=SNAP_SUCCESS):
         nonlocal count
         count += 1
         m = mock.MagicMock()
+        m.width.return_value = 320
+        m.height.return_value = 240
         if outcome == SNAP_HISTOGRAM_FAIL and count == 2:
             m.get_histogram.return_value = "failed"
             m.find_qrcodes.return_value = [Mockqrcode(str(count))]
         elif outcome == SNAP_FIND_QRCODES_FAIL and count == 2:
             m.get_histogram.return_value = Mockhistogram()
             m.find_qrcodes.return_value = []
+        elif outcome == SNAP_MULTIPLE_QRCODES:
+            # Two new codes per frame, one of them shown twice
+            m.get_histogram.return_value = Mockhistogram()
+            m.find_qrcodes.return_value = [
+                Mockqrcode(str(2 * count - 1)),
+                Mockqrcode(str(2 * count)),
+                Mockqrcode(str(2 * count - 1)),
+            ]
         elif outcome == SNAP_REPEAT_QRCODE and count == 2:
             m.get_histogram.return_value = Mockhistogram()
             m.find_qrcodes.return_value = [Mockqrcode(str(count - 1))]
@@ -0,0 +1,125 @@
+import pytest
+
+
+@pytest.fixture
+def tdata(mocker):
+    from collections import namedtuple
+    from embit.networks import NETWORKS
+    from krux.key import Key
+
+    TEST_MNEMONIC = (
+        "olympic term tissue route sense program under choose bean emerge velvet absurd"
+    )
+    SINGLEKEY_KEY = Key(TEST_MNEMONIC, False, NETWORKS["main"])
+    # First receive address of SINGLEKEY_KEY
+    RECEIVE_ADDRESS = "bc1qrhjqrz2d9tdym3p2r9m2vwzn2sn2yl6k5m357y"
+    UNRELATED_ADDRESS = "bc1q6y95p2qkcmsr7kp5zpnt04qx5l2slq73d9um62ka3s5nr83mlcfsywsn65"
+
+    return namedtuple(
+        "TestData",
+        ["SINGLEKEY_KEY", "RECEIVE_ADDRESS", "UNRELATED_ADDRESS"],
+    )(SINGLEKEY_KEY, RECEIVE_ADDRESS, UNRELATED_ADDRESS)
+
+
+def test_extend(mocker, m5stickv, tdata):
+    from krux.address_index import AddressIndex, ENTRY_SIZE
+    from krux.wallet import Wallet
+
+    index = AddressIndex(Wallet(tdata.SINGLEKEY_KEY))
+    progress = mocker.MagicMock()
+    index.extend(10, progress)
+    index.extend(5)
+
+    assert index.depths == [15, 15]
+    assert len(index.entries) == 30 * ENTRY_SIZE
+    entries = [
+        index.entries[i : i + ENTRY_SIZE]
+        for i in range(0, len(index.entries), ENTRY_SIZE)
+    ]
+    assert entries == sorted(entries)
+    assert progress.call_count == 20
+    progress.assert_called_with(1, 9)
+
+    # Merged in place, the same table as indexing them all at once
+    merged = index.entries
+    index.extend(7)
+    assert index.entries is merged
+    reference = AddressIndex(Wallet(tdata.SINGLEKEY_KEY))
+    reference.extend(22)
+    assert index.entries == reference.entries
+
+
+def test_lookup(mocker, m5stickv, tdata):
+    from embit.script import address_to_scriptpubkey
+    from krux.address_index import AddressIndex
+    from krux.wallet import Wallet
+
+    wallet = Wallet(tdata.SINGLEKEY_KEY)
+    index = AddressIndex(wallet)
+    index.extend(10)
+    receive_sc = address_to_scriptpubkey(tdata.RECEIVE_ADDRESS)
+    change_sc = list(wallet.obtain_scriptpubkeys(3, limit=1, branch_index=1))[0]
+
+    assert index.lookup(receive_sc) == 0
+    assert index.lookup(receive_sc, 1) is None
+    for i, sc in enumerate(wallet.obtain_scriptpubkeys(0, limit=10)):
+        assert index.lookup(sc) == i
+    assert index.lookup(change_sc, 1) == 3
+    assert index.lookup(address_to_scriptpubkey(tdata.UNRELATED_ADDRESS)) is None
+
+
+def test_lookup_confirms_by_derivation(mocker, m5stickv, tdata):
+    from embit.script import address_to_scriptpubkey
+    from krux.address_index import AddressIndex, scriptpubkey_hash
+    from krux.wallet import Wallet
+
+    index = AddressIndex(Wallet(tdata.SINGLEKEY_KEY))
+    index.extend(10)
+    # A tampered table claims the unrelated address is receive address 7
+    unrelated_sc = address_to_scriptpubkey(tdata.UNRELATED_ADDRESS)
+    index.entries = scriptpubkey_hash(unrelated_sc) + (7).to_bytes(4, "big")
+
+    assert index.lookup(unrelated_sc) is None
+
+
+def test_read_write(mocker, m5stickv, tdata):
+    from io import BytesIO
+    from embit.script import address_to_scriptpubkey
+    from krux.address_index import AddressIndex
+    from krux.wallet import Wallet
+
+    wallet = Wallet(tdata.SINGLEKEY_KEY)
+    index = AddressIndex(wallet)
+    index.extend(10)
+    stream = BytesIO()
+    index.write_to(stream)
+
+    loaded = AddressIndex(wallet)
+    file = BytesIO(stream.getvalue())
+    read = mocker.spy(file, "read")
+    loaded.read_from(file)
+    assert loaded.depths == [10, 10]
+    # Searched in the file, reading single entries
+    assert loaded.lookup(address_to_scriptpubkey(tdata.RECEIVE_ADDRESS)) == 0
+    for i, sc in enumerate(wallet.obtain_scriptpubkeys(0, limit=10, branch_index=1)):
+        assert loaded.lookup(sc, 1) == i
+    assert not loaded.entries
+    assert all(call.args[0] <= 20 for call in read.call_args_list)
+    loaded.load()
+    assert loaded.entries == index.entries
+    assert loaded.lookup(address_to_scriptpubkey(tdata.RECEIVE_ADDRESS)) == 0
+    assert index.filename() == "addresses-%s.idx" % index.checksum
+
+    # Extending a table read from a file loads it first
+    loaded.read_from(BytesIO(stream.getvalue()))
+    loaded.extend(5)
+    index.extend(5)
+    assert loaded.entries == index.entries
+
+    with pytest.raises(ValueError):
+        loaded.read_from(BytesIO(b"not an index"))
+    with pytest.raises(ValueError):
+        loaded.read_from(BytesIO(stream.getvalue()[:-1]))
+    other = stream.getvalue().replace(index.checksum.encode(), b"00000000")
+    with pytest.raises(ValueError):
+        loaded.read_from(BytesIO(other))
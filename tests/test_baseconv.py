@@ -117,3 +117,26 @@ def test_base_encode_to_unsupported_base(mocker, m5stickv):
 
     with pytest.raises(ValueError):
         base_encode(b"", 21)
+
+
+def test_base_encode_decode_large_payloads(mocker, m5stickv):
+    import random
+    from krux.baseconv import base_encode, base_decode, B43CHARS, B58CHARS
+
+    def reference_encode(data, base, chars):
+        # Whole-payload big integer conversion, one digit at a time
+        long_value = int.from_bytes(data, "big")
+        result = []
+        while long_value > 0:
+            long_value, digit = divmod(long_value, base)
+            result.append(chars[digit])
+        n_pad = len(data) - len(data.lstrip(b"\x00"))
+        return (chars[0] * n_pad + "".join(reversed(result))).encode()
+
+    rng = random.Random(0)
+    for size in (1024, 2048, 4096, 8192, 16384):
+        data = b"\x00\x00" + bytes(rng.getrandbits(8) for _ in range(size))
+        for base, chars in ((43, B43CHARS), (58, B58CHARS)):
+            encoded = base_encode(data, base)
+            assert encoded == reference_encode(data, base, chars)
+            assert base_decode(encoded, base) == data
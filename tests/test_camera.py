@@ -5,6 +5,7 @@ from .shared_mocks import (
     SNAP_REPEAT_QRCODE,
     SNAP_HISTOGRAM_FAIL,
     SNAP_FIND_QRCODES_FAIL,
+    SNAP_MULTIPLE_QRCODES,
 )
 
 
@@ -203,3 +204,178 @@ def test_capture_qr_code_loop_skips_duplicate_qrcode(mocker, m5stickv):
     assert prev_parsed_count == MockQRPartParser.TOTAL - 1
     krux.camera.sensor.run.assert_called_with(0)
     krux.camera.wdt.feed.assert_called()
+
+
+def test_capture_qr_code_loop_parses_multiple_qrcodes_per_frame(mocker, m5stickv):
+    mocker.patch(
+        "krux.camera.sensor.snapshot",
+        new=snapshot_generator(outcome=SNAP_MULTIPLE_QRCODES),
+    )
+    mocker.patch("krux.camera.QRPartParser", new=MockQRPartParser)
+    parse = mocker.spy(MockQRPartParser, "parse")
+    from krux.camera import Camera
+
+    c = Camera()
+
+    prev_parsed_count = -1
+
+    def progress_callback(total_count, parsed_count, is_new):
+        nonlocal prev_parsed_count
+        if parsed_count > 0:
+            assert is_new
+            assert parsed_count == prev_parsed_count + 2
+        prev_parsed_count = parsed_count
+        return False
+
+    result, format = c.capture_qr_code_loop(progress_callback)
+    assert result == "12345678910"
+    assert format == MockQRPartParser.FORMAT
+    # Each part is parsed once, even when shown twice in a frame
+    assert parse.call_count == MockQRPartParser.TOTAL
+
+
+def test_capture_qr_code_loop_tracks_qrcode_region(mocker, m5stickv):
+    snapshot = snapshot_generator(outcome=SNAP_SUCCESS)
+    images = []
+
+    def tracked_snapshot():
+        img = snapshot()
+        images.append(img)
+        return img
+
+    mocker.patch("krux.camera.sensor.snapshot", new=tracked_snapshot)
+    mocker.patch("krux.camera.QRPartParser", new=MockQRPartParser)
+    mocker.patch("krux.camera.QR_FULL_FRAME_PERIOD", 3)
+    from krux.camera import Camera
+
+    c = Camera()
+
+    result, _ = c.capture_qr_code_loop(lambda total, parsed, is_new: False)
+    assert result == "12345678910"
+
+    # Codes are searched around the last one found, with a full frame search
+    # every QR_FULL_FRAME_PERIOD frames
+    roi = (60, 40, 160, 160)
+    rois = [img.find_qrcodes.call_args.kwargs.get("roi") for img in images]
+    assert rois == [None, roi, roi, None, roi, roi, None, roi, roi, None]
+
+
+def test_find_qrcodes_falls_back_to_full_frame(mocker, m5stickv):
+    from krux.camera import Camera
+    from .shared_mocks import Mockqrcode
+
+    c = Camera()
+    img = mocker.MagicMock()
+    code = Mockqrcode("1")
+    img.find_qrcodes.side_effect = lambda roi=None: [] if roi else [code]
+
+    assert c.find_qrcodes(img, (60, 40, 160, 160)) == [code]
+    assert img.find_qrcodes.call_count == 2
+    assert img.find_qrcodes.call_args_list[0].kwargs == {"roi": (60, 40, 160, 160)}
+
+
+def test_qr_roi(mocker, m5stickv):
+    from krux.camera import Camera
+
+    c = Camera()
+    img = mocker.MagicMock()
+    img.width.return_value = 320
+    img.height.return_value = 240
+
+    def code(rect):
+        return mocker.MagicMock(rect=mocker.MagicMock(return_value=rect))
+
+    assert c.qr_roi(img, [code((100, 80, 80, 80))]) == (60, 40, 160, 160)
+    # Clipped to the image
+    assert c.qr_roi(img, [code((0, 200, 100, 40))]) == (0, 180, 150, 60)
+    # Bounding box of all codes
+    assert c.qr_roi(img, [code((0, 0, 20, 20)), code((60, 40, 20, 20))]) == (
+        0,
+        0,
+        120,
+        90,
+    )
+
+
+def test_capture_qr_code_loop_color_mode(mocker, m5stickv):
+    mocker.patch(
+        "krux.camera.sensor.snapshot", new=snapshot_generator(outcome=SNAP_SUCCESS)
+    )
+    mocker.patch("krux.camera.QRPartParser", new=MockQRPartParser)
+    import krux
+    from krux.camera import Camera
+    from krux.krux_settings import Settings
+
+    c = Camera()
+
+    # Scans in grayscale by default
+    c.capture_qr_code_loop(lambda total, parsed, is_new: False)
+    assert (
+        krux.camera.sensor.set_pixformat.call_args.args[0]._extract_mock_name()
+        == "mock.GRAYSCALE"
+    )
+
+    Settings().scanner.color_mode = "color"
+    c.capture_qr_code_loop(lambda total, parsed, is_new: False)
+    assert (
+        krux.camera.sensor.set_pixformat.call_args.args[0]._extract_mock_name()
+        == "mock.RGB565"
+    )
+    Settings().scanner.color_mode = "grayscale"
+
+
+def test_capture_qr_code_loop_in_color_on_amigo(mocker, amigo_tft):
+    mocker.patch(
+        "krux.camera.sensor.snapshot", new=snapshot_generator(outcome=SNAP_SUCCESS)
+    )
+    mocker.patch("krux.camera.QRPartParser", new=MockQRPartParser)
+    import krux
+    from krux.camera import Camera
+
+    c = Camera()
+
+    c.capture_qr_code_loop(lambda total, parsed, is_new: False)
+    assert (
+        krux.camera.sensor.set_pixformat.call_args.args[0]._extract_mock_name()
+        == "mock.RGB565"
+    )
+
+
+def test_capture_qr_code_loop_preview_policy(mocker, m5stickv):
+    import board
+    from krux.camera import PREVIEW_ALWAYS, PREVIEW_PERIODIC, PREVIEW_UNTIL_LOCK
+    from krux.krux_settings import Settings
+
+    cases = [
+        (PREVIEW_ALWAYS, {}, 10),
+        (PREVIEW_PERIODIC, {}, 5),
+        (PREVIEW_PERIODIC, {"preview_period": 3}, 4),
+        (PREVIEW_UNTIL_LOCK, {}, 1),
+    ]
+    for preview, camera_config, previews in cases:
+        mocker.patch(
+            "krux.camera.sensor.snapshot",
+            new=snapshot_generator(outcome=SNAP_SUCCESS),
+        )
+        mocker.patch("krux.camera.QRPartParser", new=MockQRPartParser)
+        board.config["krux"]["camera"] = camera_config
+        Settings().scanner.preview = preview
+        import krux
+        from krux.camera import Camera
+
+        c = Camera()
+        krux.camera.lcd.display.reset_mock()
+
+        result, _ = c.capture_qr_code_loop(lambda total, parsed, is_new: False)
+        assert result == "12345678910"
+        assert krux.camera.lcd.display.call_count == previews
+    del board.config["krux"]["camera"]
+
+
+def test_preview_setting_defaults(mocker, m5stickv):
+    from krux.camera import PREVIEW_ALWAYS, PREVIEW_PERIODIC
+    from krux.krux_settings import ScannerSettings
+
+    # The small M5StickV display only refreshes periodically by default
+    assert ScannerSettings.preview.default_value == PREVIEW_PERIODIC
+    assert PREVIEW_ALWAYS in ScannerSettings.preview.categories
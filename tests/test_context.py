@@ -51,3 +51,17 @@ def test_clear_clears_printer(mocker, m5stickv):
 
     assert c.wallet is None
     c.printer.clear.assert_called()
+
+
+def test_clear_clears_key(mocker, m5stickv):
+    mock_modules(mocker)
+    from krux.context import Context
+
+    c = Context()
+    key = mocker.MagicMock(clear=mocker.MagicMock())
+    c.wallet = mocker.MagicMock(key=key)
+
+    c.clear()
+
+    assert c.wallet is None
+    key.clear.assert_called()
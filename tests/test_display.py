@@ -447,6 +447,16 @@ def test_draw_qr_code(mocker, m5stickv):
 
     d.draw_qr_code(0, TEST_QR)
 
-    krux.display.lcd.draw_qr_code.assert_called_with(
-        0, TEST_QR_WITH_BORDER, 135, QR_DARK_COLOR, QR_LIGHT_COLOR, DEFAULT_BG_COLOR
-    )
+    # 35 modules with the border, scaled by 3 and centered
+    calls = krux.display.lcd.fill_rectangle.call_args_list
+    assert calls[0] == mocker.call(15, 15, 105, 105, QR_LIGHT_COLOR)
+    modules = [["0"] * 35 for _ in range(35)]
+    for call in calls[1:]:
+        x, y, width, height, color = call.args
+        assert color == QR_DARK_COLOR
+        for row in range((y - 15) // 3, (y - 15 + height) // 3):
+            for col in range((x - 15) // 3, (x - 15 + width) // 3):
+                modules[row][col] = "1"
+    assert "\n".join("".join(row) for row in modules) == TEST_QR_WITH_BORDER.strip()
+    # Neither the text form nor the firmware's text renderer are used
+    krux.display.lcd.draw_qr_code.assert_not_called()
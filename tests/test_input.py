@@ -436,6 +436,18 @@ def test_wait_for_button_returns_when_nonblocking(mocker, m5stickv):
     krux.input.wdt.feed.assert_called()
 
 
+def test_wait_for_button_returns_after_wait_duration(mocker, m5stickv):
+    import time
+    from krux.input import Input
+
+    input = Input()
+    input = reset_input_states(mocker, input)
+    mocker.patch.object(time, "ticks_ms", new=mocker.MagicMock(side_effect=[0, 1]))
+
+    assert input.wait_for_button(False, wait_duration=0) is None
+    time.sleep_ms.assert_not_called()
+
+
 def test_long_press_page_simulates_swipe_left(mocker, m5stickv):
     import threading
     import krux
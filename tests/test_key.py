@@ -246,6 +246,49 @@ def test_sign_fails_with_invalid_hash(mocker, m5stickv, tdata):
         key.sign(tdata.TEST_INVALID_HASH)
 
 
+def test_signing_node(mocker, m5stickv, tdata):
+    mock_modules(mocker)
+    from krux.key import Key
+
+    key = Key(tdata.TEST_MNEMONIC, False)
+
+    assert key.signing_node().to_public().to_base58() == key.account.to_base58()
+    branch = key.signing_node(1)
+    assert branch is key.signing_node(1)
+    assert branch.to_base58() == key.root.derive(key.derivation + "/1").to_base58()
+    with pytest.raises(ValueError):
+        key.signing_node(2)
+
+    key.clear()
+    assert key.signing_nodes == {}
+
+
+def test_mnemonic_to_seed(mocker, m5stickv, tdata):
+    mock_modules(mocker)
+    import hashlib
+    from embit import bip39
+    import krux
+    from krux.key import mnemonic_to_seed, forget_seed
+
+    forget_seed()
+    expected = bip39.mnemonic_to_seed(tdata.TEST_MNEMONIC, "test")
+    mocker.patch(
+        "krux.key.hashlib",
+        new=mocker.MagicMock(pbkdf2_hmac=mocker.MagicMock(wraps=hashlib.pbkdf2_hmac)),
+    )
+
+    assert mnemonic_to_seed(tdata.TEST_MNEMONIC, "test") == expected
+    assert mnemonic_to_seed(tdata.TEST_MNEMONIC, "test") == expected
+    assert krux.key.hashlib.pbkdf2_hmac.call_count == 1
+
+    mnemonic_to_seed(tdata.TEST_MNEMONIC)
+    assert krux.key.hashlib.pbkdf2_hmac.call_count == 2
+
+    forget_seed()
+    with pytest.raises(ValueError):
+        mnemonic_to_seed("not a mnemonic")
+
+
 def test_to_mnemonic_words(mocker, m5stickv, tdata):
     mock_modules(mocker)
     import hashlib
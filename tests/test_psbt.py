@@ -208,6 +208,152 @@ def test_init_multisig(mocker, m5stickv, tdata):
         assert isinstance(signer, PSBTSigner)
 
 
+def test_init_detects_encoding(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE, FORMAT_PMOFN, FORMAT_UR
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, False, NETWORKS["test"]))
+    cases = [
+        (tdata.P2WPKH_PSBT, FORMAT_NONE, "binary", None),
+        (tdata.P2WPKH_PSBT, FORMAT_PMOFN, "binary", 64),
+        (tdata.P2WPKH_PSBT_B43, FORMAT_PMOFN, 43, 43),
+        (tdata.P2WPKH_PSBT_B58, FORMAT_PMOFN, 58, 58),
+        (tdata.P2WPKH_PSBT_B64, FORMAT_PMOFN, 64, 64),
+        (tdata.P2WPKH_PSBT_UR_PSBT, FORMAT_UR, "ur", None),
+    ]
+
+    for case in cases:
+        signer = PSBTSigner(wallet, case[0], case[1])
+        assert signer.source_encoding == case[2]
+        assert signer.base_encoding == case[3]
+
+
+def test_detect_encoding(mocker, m5stickv, tdata):
+    from krux.psbt import detect_encoding
+
+    cases = [
+        (tdata.P2WPKH_PSBT, "binary"),
+        (tdata.P2WPKH_PSBT_B43.encode(), 43),
+        (tdata.P2WPKH_PSBT_B58.encode(), 58),
+        (tdata.P2WPKH_PSBT_B64.encode(), 64),
+        (b"", None),
+        (b"thisisnotavalidpsbt", None),
+        (b"not a psbt", None),
+    ]
+
+    for case in cases:
+        assert detect_encoding(case[0]) == case[1]
+
+
+def test_init_from_stream(mocker, m5stickv, tdata):
+    from io import BytesIO
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_PMOFN
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, False, NETWORKS["test"]))
+    cases = [
+        (tdata.P2WPKH_PSBT, "binary", tdata.SIGNED_P2WPKH_PSBT),
+        (tdata.P2WPKH_PSBT_B64.encode(), 64, tdata.SIGNED_P2WPKH_PSBT),
+        (tdata.P2SH_P2WPKH_PSBT, "binary", tdata.SIGNED_P2SH_P2WPKH_PSBT),
+    ]
+
+    for case in cases:
+        signer = PSBTSigner(wallet, BytesIO(case[0]), FORMAT_PMOFN)
+        assert signer.source_encoding == case[1]
+        assert signer.base_encoding == 64
+        signer.sign()
+        signed = BytesIO()
+        signer.psbt.write_to(signed)
+        assert signed.getvalue() == case[2]
+
+    with pytest.raises(ValueError):
+        PSBTSigner(wallet, BytesIO(tdata.P2WPKH_PSBT[:-20]), FORMAT_PMOFN)
+
+
+def test_init_from_stream_keeps_existing_signatures(mocker, m5stickv, tdata):
+    from io import BytesIO
+    from embit.networks import NETWORKS
+    from embit.psbt import PSBT
+    from krux.psbt import PSBTSigner
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, True, NETWORKS["test"]))
+    # Signed by another cosigner already
+    psbt = PSBT.parse(tdata.P2WSH_PSBT)
+    cosigner_sigs = []
+    for inp in psbt.inputs:
+        pub = [
+            pub
+            for pub, der in inp.bip32_derivations.items()
+            if der.fingerprint != wallet.key.fingerprint
+        ][0]
+        inp.partial_sigs[pub] = b"cosigner signature"
+        cosigner_sigs.append(pub)
+    partially_signed = psbt.serialize()
+
+    for psbt_data in (BytesIO(partially_signed), partially_signed):
+        signer = PSBTSigner(wallet, psbt_data, FORMAT_NONE)
+        signer.sign()
+        assert [len(inp.partial_sigs) for inp in signer.psbt.inputs] == [2, 2]
+        for inp, pub in zip(signer.psbt.inputs, cosigner_sigs):
+            assert inp.partial_sigs[pub] == b"cosigner signature"
+
+
+def test_init_from_stream_drops_non_witness_utxo(mocker, m5stickv, tdata):
+    from io import BytesIO
+    import tracemalloc
+    from embit.networks import NETWORKS
+    from embit.psbt import PSBT
+    from embit.script import Script
+    from embit.transaction import Transaction, TransactionInput, TransactionOutput
+    from krux.psbt import PSBTSigner, StreamedPSBT
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, False, NETWORKS["test"]))
+    psbt = PSBT.parse(tdata.P2WPKH_PSBT)
+    # A previous transaction much larger than the rest of the PSBT
+    padding = TransactionOutput(0, Script(b"\x6a\x4c\xc8" + b"\x00" * 200))
+    prev_tx = Transaction(
+        vin=[TransactionInput(b"\x00" * 32, 0)],
+        vout=[psbt.inputs[0].witness_utxo] + [padding] * 200,
+    )
+    psbt.inputs[0].txid = prev_tx.txid()
+    psbt.inputs[0].vout = 0
+    psbt.inputs[0].non_witness_utxo = prev_tx
+    psbt_data = psbt.serialize()
+
+    signer = PSBTSigner(wallet, BytesIO(psbt_data), FORMAT_NONE)
+    assert signer.psbt.inputs[0].non_witness_utxo is None
+    assert signer.psbt.inputs[0].is_verified
+    assert signer.psbt.inputs[0].utxo == psbt.inputs[0].witness_utxo
+    signer.sign()
+    assert len(signer.psbt.inputs[0].partial_sigs) == 1
+
+    peaks = []
+    for psbt_cls in (PSBT, StreamedPSBT):
+        tracemalloc.start()
+        parsed = psbt_cls.read_from(BytesIO(psbt_data))
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        del parsed
+    assert peaks[1] * 4 < peaks[0]
+
+    # The previous transaction must still match the input
+    psbt.inputs[0].txid = b"\x01" * 32
+    with pytest.raises(ValueError):
+        PSBTSigner(wallet, BytesIO(psbt.serialize()), FORMAT_NONE)
+
+
 def test_init_fails_on_invalid_psbt(mocker, m5stickv, tdata):
     from embit.networks import NETWORKS
     from ur.ur import UR
@@ -296,6 +442,160 @@ def test_sign_multisig(mocker, m5stickv, tdata):
         assert signer.psbt_qr() == (case[2], case[1])
 
 
+def build_multisig_psbt(keys, num_inputs):
+    from embit import bip32, script
+    from embit.psbt import DerivationPath, PSBT
+    from embit.transaction import Transaction, TransactionInput, TransactionOutput
+
+    def scope_data(branch, index):
+        pubkeys = []
+        derivations = {}
+        for key in keys:
+            pubkey = key.account.derive([branch, index]).key
+            pubkeys.append(pubkey)
+            derivations[pubkey] = DerivationPath(
+                key.fingerprint, bip32.parse_path(key.derivation) + [branch, index]
+            )
+        witness_script = script.multisig(2, sorted(pubkeys, key=lambda p: p.sec()))
+        return witness_script, derivations
+
+    change_script, change_derivations = scope_data(1, 0)
+    tx = Transaction(
+        vin=[TransactionInput(bytes(32), i) for i in range(num_inputs)],
+        vout=[
+            TransactionOutput(num_inputs * 9000, script.p2wsh(change_script)),
+            TransactionOutput(
+                num_inputs * 900, script.p2wpkh(keys[0].account.derive([0, 0]))
+            ),
+        ],
+    )
+    psbt = PSBT(tx)
+    for key in keys:
+        psbt.xpubs[key.account] = DerivationPath(
+            key.fingerprint, bip32.parse_path(key.derivation)
+        )
+    for i, inp in enumerate(psbt.inputs):
+        inp.witness_script, inp.bip32_derivations = scope_data(0, i)
+        inp.witness_utxo = TransactionOutput(10000, script.p2wsh(inp.witness_script))
+    psbt.outputs[0].witness_script = change_script
+    psbt.outputs[0].bip32_derivations = change_derivations
+    return psbt.serialize()
+
+
+def test_sign_multisig_many_inputs(mocker, m5stickv, tdata):
+    from embit import bip32
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    keys = [
+        Key(tdata.TEST_MNEMONIC, True, NETWORKS["test"]),
+        Key(tdata.TEST_MNEMONIC, True, NETWORKS["test"], "cosigner 2"),
+        Key(tdata.TEST_MNEMONIC, True, NETWORKS["test"], "cosigner 3"),
+    ]
+    child = mocker.spy(bip32.HDKey, "child")
+
+    for num_inputs in (1, 20, 100):
+        psbt_data = build_multisig_psbt(keys, num_inputs)
+        wallet = Wallet(keys[0])
+        child.reset_mock()
+
+        signer = PSBTSigner(wallet, psbt_data, FORMAT_NONE)
+        # Each pubkey takes a single derivation step from its cached branch node
+        assert child.call_count == len(keys) * (num_inputs + 1)
+        assert signer.policy["m"] == 2 and signer.policy["n"] == len(keys)
+
+        summary, messages = signer.outputs()
+        assert summary.startswith("Inputs (%d): " % num_inputs)
+        assert "Self-transfer or Change (1): " in summary
+        assert len(list(messages)) == 2
+
+        signer.sign()
+        assert all(len(inp.partial_sigs) == 1 for inp in signer.psbt.inputs)
+
+
+def test_serialize(mocker, m5stickv, tdata):
+    import urtypes
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner, cbor_bytes_header
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, False, NETWORKS["test"]))
+    signer = PSBTSigner(wallet, tdata.P2WPKH_PSBT, FORMAT_NONE)
+    signer.sign()
+    write_to = mocker.spy(signer.psbt, "write_to")
+
+    assert signer.serialize() == tdata.SIGNED_P2WPKH_PSBT
+    assert (
+        signer.serialize(cbor=True)
+        == urtypes.crypto.PSBT(tdata.SIGNED_P2WPKH_PSBT).to_cbor()
+    )
+    # Written once per call
+    assert write_to.call_count == 2
+    for length in (0, 23, 24, 255, 256, 65535, 65536):
+        assert (
+            cbor_bytes_header(length)
+            == urtypes.crypto.PSBT(bytes(length)).to_cbor()[: -length or None]
+        )
+
+
+def test_psbt_qr_ur_is_not_larger_than_imported(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner, cbor_bytes_header
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import find_min_num_parts, FORMAT_UR
+
+    cases = [
+        (False, tdata.P2WPKH_PSBT_UR_PSBT),
+        (False, tdata.P2SH_P2WPKH_PSBT_UR_PSBT),
+        (True, tdata.P2WSH_PSBT_UR_PSBT),
+        (True, tdata.P2SH_P2WSH_PSBT_UR_PSBT),
+    ]
+
+    for case in cases:
+        wallet = Wallet(Key(tdata.TEST_MNEMONIC, case[0], NETWORKS["test"]))
+        signer = PSBTSigner(wallet, case[1], FORMAT_UR)
+        signer.sign()
+        signed_ur, qr_format = signer.psbt_qr()
+        assert qr_format == FORMAT_UR
+
+        # Raw PSBT bytes in a minimal CBOR byte string
+        signed_psbt = signer.psbt.serialize()
+        assert signed_ur.cbor == cbor_bytes_header(len(signed_psbt)) + signed_psbt
+
+        for qr_data_width in (33, 45, 61, 93):
+            assert find_min_num_parts(
+                signed_ur, qr_data_width, FORMAT_UR
+            ) <= find_min_num_parts(case[1], qr_data_width, FORMAT_UR)
+
+
+def test_check_signable(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from embit.psbt import PSBT
+    from krux.psbt import PSBTSigner
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, False, NETWORKS["test"]))
+    signer = PSBTSigner(wallet, tdata.P2WPKH_PSBT, FORMAT_NONE)
+    sign_with = mocker.spy(signer.psbt, "sign_with")
+    signer.check_signable()
+    assert sign_with.call_count == 0
+
+    foreign = PSBT.parse(tdata.P2WPKH_PSBT)
+    for inp in foreign.inputs:
+        inp.bip32_derivations = {}
+    signer = PSBTSigner(wallet, foreign.serialize(), FORMAT_NONE)
+    with pytest.raises(ValueError):
+        signer.check_signable()
+
+
 def test_sign_fails_with_0_sigs_added(mocker, m5stickv, tdata):
     from embit.networks import NETWORKS
     from krux.psbt import PSBTSigner
@@ -309,7 +609,72 @@ def test_sign_fails_with_0_sigs_added(mocker, m5stickv, tdata):
 
     with pytest.raises(ValueError):
         signer.sign()
-    signer.psbt.sign_with.assert_called_with(wallet.key.root)
+    signer.psbt.sign_with.assert_called_once()
+
+
+def test_derive_own(mocker, m5stickv, tdata):
+    from embit import bip32
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, False, NETWORKS["test"]))
+    signer = PSBTSigner(wallet, tdata.P2WPKH_PSBT, FORMAT_NONE)
+    account_derivation = bip32.parse_path(wallet.key.derivation)
+
+    for derivation in [
+        account_derivation + [1, 5],
+        # Hardened steps below the account can only be derived privately
+        account_derivation + [bip32.HARDENED_INDEX + 1, 2],
+        bip32.parse_path("m/49h/1h/0h/0/3"),
+    ]:
+        assert (
+            signer.derive_own(derivation).sec()
+            == wallet.key.root.derive(derivation).sec()
+        )
+
+
+def test_sign_uses_cached_signing_nodes(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from krux.psbt import PSBTSigner
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, False, NETWORKS["test"]))
+    mocker.spy(wallet.key.root, "derive")
+    signer = PSBTSigner(wallet, tdata.P2WPKH_PSBT, FORMAT_NONE)
+    signer.sign()
+
+    assert signer.psbt_qr() == (tdata.SIGNED_P2WPKH_PSBT, FORMAT_NONE)
+    wallet.key.root.derive.assert_not_called()
+
+
+def test_signing_key_for_account_derivation(mocker, m5stickv, tdata):
+    from embit import bip32
+    from embit.networks import NETWORKS
+    from embit.psbt import DerivationPath
+    from krux.psbt import PSBTSigner
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, False, NETWORKS["test"]))
+    account_derivation = bip32.parse_path(wallet.key.derivation)
+    signer = PSBTSigner(wallet, tdata.P2WPKH_PSBT, FORMAT_NONE)
+    # An input spent by the account key itself
+    signer.psbt.inputs[0].bip32_derivations = {
+        wallet.key.account.get_public_key(): DerivationPath(
+            wallet.key.fingerprint, account_derivation
+        )
+    }
+
+    signing_key = signer.signing_key()
+
+    assert signing_key.key == wallet.key.signing_node()
+    assert signing_key.origin.derivation == account_derivation
 
 
 def test_outputs_singlekey(mocker, m5stickv, tdata):
@@ -341,8 +706,8 @@ def test_outputs_singlekey(mocker, m5stickv, tdata):
 
     for case in cases:
         signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
-        outputs = signer.outputs()
-        assert outputs == case[1]
+        summary, messages = signer.outputs()
+        assert [summary] + list(messages) == case[1]
 
 
 def test_outputs_multisig(mocker, m5stickv, tdata):
@@ -374,8 +739,8 @@ def test_outputs_multisig(mocker, m5stickv, tdata):
 
     for case in cases:
         signer = PSBTSigner(wallet, case[0], FORMAT_NONE)
-        outputs = signer.outputs()
-        assert outputs == case[1]
+        summary, messages = signer.outputs()
+        assert [summary] + list(messages) == case[1]
 
 
 def test_xpubs_fails_with_no_xpubs(mocker, m5stickv, tdata):
@@ -408,5 +773,27 @@ def test_sign_single_1_input_1_output_no_change(m5stickv):
 
     wallet = Wallet(Key(MNEMONIC, False, NETWORKS["test"]))
     signer = PSBTSigner(wallet, PSBT_B64, FORMAT_PMOFN)
-    outputs = signer.outputs()
-    assert outputs == OUTPUT
+    summary, messages = signer.outputs()
+    assert [summary] + list(messages) == OUTPUT
+
+
+def test_outputs_builds_messages_lazily(mocker, m5stickv, tdata):
+    from embit.networks import NETWORKS
+    from embit.script import Script
+    from krux.psbt import PSBTSigner
+    from krux.key import Key
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE
+
+    wallet = Wallet(Key(tdata.TEST_MNEMONIC, False, NETWORKS["test"]))
+    signer = PSBTSigner(wallet, tdata.P2WPKH_PSBT, FORMAT_NONE)
+    address = mocker.spy(Script, "address")
+
+    summary, messages = signer.outputs()
+    assert summary.startswith("Inputs (1): ")
+    address.assert_not_called()
+
+    assert next(messages).startswith("1. Spend: ")
+    assert address.call_count == 1
+    assert next(messages).startswith("1. Change: ")
+    assert address.call_count == 2
@@ -62,7 +62,7 @@ def test_init(mocker, m5stickv):
     parser = QRPartParser()
 
     assert isinstance(parser, QRPartParser)
-    assert parser.parts == {}
+    assert parser.parts == []
     assert parser.total == -1
     assert parser.format is None
     assert isinstance(parser.decoder, URDecoder)
@@ -118,6 +118,82 @@ def test_parser(mocker, m5stickv, tdata):
             assert res == tdata.TEST_DATA_B58
 
 
+def test_parser_skips_recent_payloads(mocker, m5stickv, tdata):
+    import krux
+    from krux.qr import QRPartParser, QR_PARSER_RECENT_PAYLOADS
+
+    data = tdata.TEST_DATA_B58
+    size = len(data) // 8 + 1
+    parts = ["p%dof8 %s" % (i + 1, data[i * size : (i + 1) * size]) for i in range(8)]
+    parse_part = mocker.patch(
+        "krux.qr.parse_pmofn_qr_part", wraps=krux.qr.parse_pmofn_qr_part
+    )
+
+    parser = QRPartParser()
+    # Each frame of the animation captured several times
+    for part in parts[:-1]:
+        for _ in range(3):
+            parser.parse(part)
+            assert parser.parsed_count() == parts.index(part) + 1
+            assert parser.total_count() == len(parts)
+    assert parse_part.call_count == len(parts) - 1
+    assert not parser.is_complete()
+
+    # Payloads parsed long ago are parsed again, without adding parts
+    assert len(parts) - 1 > QR_PARSER_RECENT_PAYLOADS
+    parser.parse(parts[0])
+    assert parse_part.call_count == len(parts)
+    assert parser.parsed_count() == len(parts) - 1
+
+    parser.parse(parts[-1])
+    assert parser.is_complete()
+    assert parser.result() == tdata.TEST_DATA_B58
+
+
+def test_parser_pmofn_assembly(mocker, m5stickv, tdata):
+    from krux.qr import QRPartParser
+
+    def pmofn_parts(data, sizes):
+        parts = []
+        start = 0
+        for i, size in enumerate(sizes):
+            parts.append("p%dof%d %s" % (i + 1, len(sizes), data[start : start + size]))
+            start += size
+        return parts
+
+    data = tdata.TEST_DATA_B58
+    size = len(data) // 5 + 1
+    uniform = pmofn_parts(data, [size] * 4 + [len(data) - 4 * size])
+    cases = [
+        # In order, parts copied into the preallocated buffer
+        (uniform, True),
+        # Out of order, starting with the shorter last part
+        ([uniform[4], uniform[2], uniform[0], uniform[3], uniform[1]], False),
+        # Parts of different lengths
+        (pmofn_parts(data, [10, size, 30, size, len(data) - 2 * size - 40]), False),
+        (pmofn_parts(data, [len(data)]), False),
+    ]
+    for parts, buffered in cases:
+        parser = QRPartParser()
+        for i, part in enumerate(parts):
+            assert not parser.is_complete()
+            parser.parse(part)
+            assert parser.parsed_count() == i + 1
+            assert parser.total_count() == len(parts)
+        assert parser.is_complete()
+        assert parser.result() == data
+        if buffered:
+            assert parser.parts == [None] * len(parts)
+
+    # Parts of another sequence are ignored
+    parser = QRPartParser()
+    parser.parse(uniform[0])
+    parser.parse("p2of3 abc")
+    parser.parse("p9of5 abc")
+    assert parser.parsed_count() == 1
+    assert parser.total_count() == 5
+
+
 def test_to_qr_codes(mocker, m5stickv, tdata):
     from krux.qr import to_qr_codes, FORMAT_NONE, FORMAT_PMOFN, FORMAT_UR
 
@@ -145,3 +221,174 @@ def test_to_qr_codes(mocker, m5stickv, tdata):
                 break
             i += 1
         assert len(codes) == expected_parts
+
+
+def test_qr_code_cache(mocker, m5stickv, tdata):
+    from .shared_mocks import encode_to_string
+    from krux.qr import QRCodeCache, to_qr_codes, FORMAT_NONE, FORMAT_PMOFN
+
+    cases = [
+        (FORMAT_NONE, tdata.TEST_DATA_B58, 1),
+        (FORMAT_PMOFN, tdata.TEST_DATA_B58, 3),
+    ]
+    for case in cases:
+        fmt = case[0]
+        data = case[1]
+        expected_parts = case[2]
+
+        expected_codes = [code for code, _ in to_qr_codes(data, 135, fmt)]
+        encoder = mocker.patch(
+            "krux.qr_matrix.qrcode.encode_to_string", side_effect=encode_to_string
+        )
+
+        cache = QRCodeCache(data, 135, fmt)
+        for i in range(3 * expected_parts):
+            if i == expected_parts:
+                encoder.reset_mock()
+            code, total, index = cache.next_frame()
+            assert total == expected_parts
+            assert index == i % expected_parts
+            assert code == expected_codes[index]
+
+        # Later loops are served from the cache without encoding again
+        encoder.assert_not_called()
+        assert len(cache.frames) == expected_parts
+
+        cache.clear()
+        assert cache.frames == {}
+        assert cache.cached_bytes == 0
+
+
+def test_qr_code_cache_respects_budget(mocker, m5stickv, tdata):
+    from krux.qr import QRCodeCache, to_qr_codes, FORMAT_PMOFN
+
+    expected_codes = [
+        code for code, _ in to_qr_codes(tdata.TEST_DATA_B58, 135, FORMAT_PMOFN)
+    ]
+
+    # Room for a single frame only
+    cache = QRCodeCache(
+        tdata.TEST_DATA_B58, 135, FORMAT_PMOFN, max_bytes=len(expected_codes[0].data)
+    )
+    for i in range(2 * len(expected_codes)):
+        code, _, index = cache.next_frame()
+        assert code == expected_codes[i % len(expected_codes)]
+        assert cache.cached_bytes <= len(expected_codes[0].data)
+    assert list(cache.frames.keys()) == [0]
+
+
+def test_qr_code_cache_splits_data_once(mocker, m5stickv, tdata):
+    import krux
+    from krux.qr import QRCodeCache, FORMAT_PMOFN
+
+    mocker.spy(krux.qr, "to_qr_parts")
+    mocker.spy(krux.qr, "find_min_num_parts")
+
+    # Room for no frame at all, so every later loop encodes them again
+    cache = QRCodeCache(tdata.TEST_DATA_B58, 135, FORMAT_PMOFN, max_bytes=0)
+    for _ in range(9):
+        cache.next_frame()
+
+    assert cache.frames == {}
+    assert len(cache.payloads) == 3
+    krux.qr.to_qr_parts.assert_called_once()
+    krux.qr.find_min_num_parts.assert_called_once()
+
+
+def test_qr_code_cache_mixes_ur_parts(mocker, m5stickv, tdata):
+    import krux
+    from krux.qr import QRCodeCache, QRMatrix, FORMAT_UR
+
+    def ur_parts(data, max_width, qr_format):
+        seq_num = 0
+        while True:
+            seq_num += 1
+            yield ("ur:bytes/%d-3/part" % seq_num, 3)
+
+    mocker.patch("krux.qr.to_qr_parts", side_effect=ur_parts)
+    mocker.spy(krux.qr.QRMatrix, "encode")
+
+    cache = QRCodeCache(b"data", 135, FORMAT_UR)
+    frames = [cache.next_frame() for _ in range(9)]
+
+    # One pass of pure fragments, then cached ones interleaved with new mixed
+    # parts from the same fountain encoder
+    krux.qr.to_qr_parts.assert_called_once()
+    assert [call.args[0] for call in QRMatrix.encode.call_args_list] == [
+        "ur:bytes/1-3/part",
+        "ur:bytes/2-3/part",
+        "ur:bytes/3-3/part",
+        "ur:bytes/4-3/part",
+        "ur:bytes/5-3/part",
+        "ur:bytes/6-3/part",
+    ]
+    assert frames[3][0] is frames[0][0]
+    assert frames[5][0] is frames[1][0]
+    assert frames[7][0] is frames[2][0]
+    assert all(total == 3 for _, total, _ in frames)
+
+
+def test_find_min_num_parts(mocker, m5stickv, tdata):
+    import math
+    from ur.ur import UR
+    from ur.ur_encoder import UREncoder
+    from urtypes.crypto.psbt import PSBT
+    from krux.qr import (
+        find_min_num_parts,
+        get_size,
+        data_len,
+        FORMAT_PMOFN,
+        FORMAT_UR,
+    )
+    from krux.qr_matrix import qrcode
+
+    def brute_force_num_parts(data, max_width, qr_format):
+        # Previous implementation, encoding candidate parts one count at a time
+        num_parts = 1
+        part_size = math.ceil(data_len(data) / num_parts)
+        while True:
+            part = ""
+            if qr_format == FORMAT_PMOFN:
+                part_number = "p1of%d " % num_parts
+                part = part_number + data[0:part_size]
+            elif qr_format == FORMAT_UR:
+                encoder = UREncoder(data, part_size, 0)
+                part = encoder.next_part()
+            if len(part) < 3918:
+                code = qrcode.encode_to_string(part)
+                if get_size(code) <= max_width:
+                    break
+            num_parts += 1
+            part_size = math.ceil(data_len(data) / num_parts)
+        return num_parts
+
+    sizes = (20, 100, 350, 1000, 2500)
+    cases = [((tdata.TEST_DATA_B58 * 20)[:size], FORMAT_PMOFN) for size in sizes] + [
+        (
+            UR("crypto-psbt", PSBT((tdata.TEST_DATA_BYTES * 10)[:size]).to_cbor()),
+            FORMAT_UR,
+        )
+        for size in sizes
+    ]
+    for data, fmt in cases:
+        for max_width in (33, 45, 53, 60, 80):
+            assert find_min_num_parts(data, max_width, fmt) == brute_force_num_parts(
+                data, max_width, fmt
+            )
+
+
+def test_qr_version(mocker, m5stickv):
+    from krux.qr import qr_version, get_size
+    from krux.qr_matrix import qrcode
+
+    for length in (1, 17, 18, 100, 1000, 2953):
+        part = "p" * length
+        code = qrcode.encode_to_string(part)
+        assert 17 + 4 * qr_version(part) == get_size(code)
+
+    # Numeric and alphanumeric parts fit more characters per version
+    assert qr_version("1" * 41) == 1
+    assert qr_version("1" * 42) == 2
+    assert qr_version("A" * 25) == 1
+    assert qr_version("A" * 26) == 2
+    assert qr_version("a" * 2954) is None
@@ -0,0 +1,29 @@
+def test_qr_matrix(mocker, m5stickv):
+    from .shared_mocks import encode_to_string
+    from krux.qr_matrix import QRMatrix, qr_matrix
+
+    for data in ("", "krux", "p1of3 " + "a" * 100, "1" * 500):
+        text = encode_to_string(data)
+        lines = text.strip().split("\n")
+        size = len(lines)
+
+        matrix = QRMatrix.from_text(text)
+        assert matrix.size == size
+        assert len(matrix.data) == size * ((size + 7) // 8)
+        assert qr_matrix(text) == matrix
+        assert qr_matrix(matrix) is matrix
+        for y in range(size):
+            for x in range(size):
+                assert matrix.get(x, y) == int(lines[y][x])
+            row = ""
+            for _, length, dark in matrix.runs(y):
+                row += str(dark) * length
+            assert row == lines[y]
+
+        assert matrix.to_text(border=0) == "\n".join(lines)
+        framed = matrix.to_text().split("\n")
+        assert framed[0] == framed[-1] == "0" * (size + 2)
+        assert framed[1:-1] == ["0" + line + "0" for line in lines]
+
+        for x, y in ((-1, 0), (0, -1), (size, 0), (0, size), (size + 7, size + 7)):
+            assert matrix.get(x, y) == 0
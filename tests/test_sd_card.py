@@ -43,3 +43,17 @@ def test_sd_read_with_mock(m5stickv, mocker_sd_card_ok):
 
     machine.SDCard.remount.assert_called()
     assert ex == False  # runned with mock, everything fine!
+
+
+def test_sd_streams(m5stickv, mocker, mocker_sd_card_ok):
+    from krux.sd_card import SDHandler
+
+    obj = mocker.MagicMock()
+    with SDHandler() as sd:
+        sd.write_stream("afile", obj)
+        with sd.open_binary("afile") as file:
+            assert file.read() == ""
+
+    obj.write_to.assert_called_once()
+    open.assert_any_call("/sd/afile", "wb")
+    open.assert_called_with("/sd/afile", "rb")
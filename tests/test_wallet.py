@@ -624,6 +624,21 @@ def test_parse_address(mocker, m5stickv, tdata):
         assert parse_address(case[0]) == case[1]
 
 
+def test_parse_addresses(mocker, m5stickv, tdata):
+    from krux.wallet import parse_addresses
+
+    addr1 = "bc1q6y95p2qkcmsr7kp5zpnt04qx5l2slq73d9um62ka3s5nr83mlcfsywsn65"
+    addr2 = "bc1qv72e35u2qjtzm60qznzzc63aq6mjlxg6y8xnctw9vq5q9mp43lasj69v67"
+
+    assert parse_addresses(addr1) == [addr1]
+    assert parse_addresses(
+        ("%s,%s;\nbitcoin:%s?amount=1\n" % (addr1, addr2, addr1)).encode()
+    ) == [addr1, addr2]
+    for data in ["", " ,;\n", addr1 + " invalidaddress"]:
+        with pytest.raises(ValueError):
+            parse_addresses(data)
+
+
 def test_parse_address_raises_errors(mocker, m5stickv, tdata):
     from krux.wallet import parse_address
 
@@ -670,3 +685,249 @@ def test_to_unambiguous_descriptor(mocker, m5stickv, tdata):
             Descriptor.from_string(case[0])
         )
         assert unambiguous_descriptor.to_string() == case[1]
+
+
+def test_derivation_cache(mocker, m5stickv, tdata):
+    from embit.bip32 import HDKey
+    from krux.wallet import DerivationCache
+
+    xpub = tdata.SINGLEKEY_KEY.account
+    xpub_id = xpub.chain_code + xpub.key.serialize()
+    cache = DerivationCache(max_nodes=2)
+
+    for branch in (0, 1):
+        for i in range(3):
+            assert cache.derive(xpub, [branch, i]) == xpub.derive([branch, i])
+    assert set(cache.nodes) == {(xpub_id, (0,)), (xpub_id, (1,))}
+
+    # An equal key parsed again, as from another PSBT, shares the nodes
+    same_xpub = HDKey.from_string(xpub.to_base58())
+    mocker.spy(same_xpub, "child")
+    assert cache.derive(same_xpub, [1, 5]) == xpub.derive([1, 5])
+    same_xpub.child.assert_not_called()
+
+    # Evicts the least recently used node when full: (0,) was used last
+    # before (1,), and (0, 0) needs (0,)
+    assert cache.derive(xpub, [0, 0, 7]) == xpub.derive([0, 0, 7])
+    assert set(cache.nodes) == {(xpub_id, (0,)), (xpub_id, (0, 0))}
+    cache.derive(xpub, [1, 2])
+    assert set(cache.nodes) == {(xpub_id, (0, 0)), (xpub_id, (1,))}
+
+    assert cache.derive(xpub, []) == xpub
+    cache.clear()
+    assert cache.nodes == {}
+
+
+def test_address_engine(mocker, m5stickv, tdata):
+    from embit.descriptor import Descriptor
+    from krux.wallet import AddressEngine, to_unambiguous_descriptor
+
+    xpub = "[55f8fc5d/84h/0h/0h]xpub6DPMTPxGMqdtzMwpqT1dDQaVdyaEppEm2qYSaJ7ANsuES7HkNzrXJst1Ed8D7NAnijUdgSDUFgph1oj5LKKAD5gyxWNhNP2AuDqaKYqzphA"
+    multisig_args = tdata.UNAMBIGUOUS_MULTISIG_DESCRIPTOR[4:-1]
+    cases = [
+        (tdata.UNAMBIGUOUS_SINGLEKEY_DESCRIPTOR, True),
+        ("sh(wpkh(%s/{0,1}/*))" % xpub, True),
+        ("pkh(%s/{0,1}/*)" % xpub, True),
+        (tdata.UNAMBIGUOUS_MULTISIG_DESCRIPTOR, True),
+        (tdata.UNSORTED_MULTISIG_DESCRIPTOR, True),
+        ("sh(wsh(%s))" % multisig_args, True),
+        ("sh(%s)" % multisig_args, True),
+        (tdata.UR_OUTPUT_MULTISIG_DESCRIPTOR, True),
+        ("tr(%s/{0,1}/*)" % xpub, False),
+    ]
+
+    for descriptor_str, incremental in cases:
+        descriptor = to_unambiguous_descriptor(Descriptor.from_string(descriptor_str))
+        engine = AddressEngine(descriptor)
+        assert engine.incremental == incremental
+        for branch_index in range(descriptor.num_branches):
+            for i in range(3):
+                assert (
+                    engine.scriptpubkey(i, branch_index)
+                    == descriptor.derive(i, branch_index=branch_index).script_pubkey()
+                )
+
+
+def test_address_engine_derives_branches_once(mocker, m5stickv, tdata):
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_PMOFN
+
+    wallet = Wallet(tdata.MULTISIG_KEY1)
+    wallet.load(tdata.SPECTER_MULTISIG_WALLET_DATA, FORMAT_PMOFN)
+    keys = [key.key for key in wallet.descriptor.keys]
+    for key in keys:
+        mocker.spy(key, "derive")
+
+    addrs = list(wallet.obtain_addresses(0, limit=20))
+    assert addrs == list(wallet.obtain_addresses(0, limit=20))
+    for key in keys:
+        assert key.derive.call_count == 1
+
+
+def test_address_page_cache(mocker, m5stickv, tdata):
+    from krux.wallet import AddressPageCache
+
+    cache = AddressPageCache(max_pages=2)
+    cache.put((0, 0, 4), ["a"])
+    cache.put((0, 4, 4), ["b"])
+    assert cache.get((0, 0, 4)) == ["a"]
+
+    # Evicts the least recently used page
+    cache.put((1, 0, 4), ["c"])
+    assert cache.get((0, 4, 4)) is None
+    assert cache.get((0, 0, 4)) == ["a"]
+    assert cache.get((1, 0, 4)) == ["c"]
+
+    cache.put((1, 0, 4), ["d"])
+    assert cache.get((1, 0, 4)) == ["d"]
+    assert len(cache.pages) == len(cache.order) == 2
+    cache.clear()
+    assert cache.get((1, 0, 4)) is None
+
+
+def test_address_page(mocker, m5stickv, tdata):
+    from krux.wallet import Wallet
+
+    wallet = Wallet(tdata.SINGLEKEY_KEY)
+    progress = mocker.MagicMock()
+    page = wallet.address_page(4, 4, 1, progress)
+
+    assert page == list(wallet.obtain_addresses(4, limit=4, branch_index=1))
+    assert progress.call_count == 4
+    progress.assert_called_with(4)
+
+    mocker.spy(wallet, "obtain_addresses")
+    assert wallet.address_page(4, 4, 1) is page
+    wallet.obtain_addresses.assert_not_called()
+
+
+def test_prefetch_address_page(mocker, m5stickv, tdata):
+    from krux.wallet import Wallet
+
+    wallet = Wallet(tdata.SINGLEKEY_KEY)
+    prefetch = wallet.prefetch_address_page(4, 4, 1)
+    next(prefetch)
+    # Not cached until all its addresses are derived
+    assert wallet.address_pages.get((1, 4, 4)) is None
+    assert len(list(prefetch)) == 3
+
+    mocker.spy(wallet, "obtain_addresses")
+    assert wallet.address_page(4, 4, 1) == list(
+        Wallet(tdata.SINGLEKEY_KEY).obtain_addresses(4, limit=4, branch_index=1)
+    )
+    assert list(wallet.prefetch_address_page(4, 4, 1)) == []
+    wallet.obtain_addresses.assert_not_called()
+
+
+def test_digests_equal(mocker, m5stickv):
+    from krux.wallet import digests_equal
+
+    assert digests_equal(b"\x01\x02", b"\x01\x02")
+    assert not digests_equal(b"\x01\x02", b"\x01\x03")
+    assert not digests_equal(b"\x01\x02", b"\x01")
+    assert not digests_equal(b"", b"\x01")
+
+
+def test_wallet_cache(mocker, m5stickv, tdata):
+    from io import BytesIO
+    import krux
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_PMOFN
+
+    wallet = Wallet(tdata.MULTISIG_KEY1)
+    wallet.load(tdata.SPECTER_MULTISIG_WALLET_DATA, FORMAT_PMOFN)
+    stream = BytesIO()
+    wallet.write_cache(stream)
+    cache = stream.getvalue()
+
+    mocker.spy(krux.wallet, "parse_wallet")
+    cached = Wallet(tdata.MULTISIG_KEY1)
+    cached.load_cached(tdata.SPECTER_MULTISIG_WALLET_DATA, FORMAT_PMOFN, BytesIO(cache))
+    krux.wallet.parse_wallet.assert_not_called()
+    assert cached.is_loaded()
+    assert cached.wallet_qr() == wallet.wallet_qr()
+    assert cached.descriptor.to_string() == wallet.descriptor.to_string()
+    assert cached.label == wallet.label
+    assert cached.policy == wallet.policy
+    assert list(cached.obtain_addresses(0, limit=3)) == list(
+        wallet.obtain_addresses(0, limit=3)
+    )
+
+    # Keyed by the wallet data and the key fingerprint
+    assert wallet.cache_filename(
+        tdata.SPECTER_MULTISIG_WALLET_DATA
+    ) == cached.cache_filename(tdata.SPECTER_MULTISIG_WALLET_DATA)
+    assert wallet.cache_filename(
+        tdata.SPECTER_MULTISIG_WALLET_DATA
+    ) != wallet.cache_filename(tdata.SPECTER_SINGLEKEY_WALLET_DATA)
+    assert wallet.cache_filename(tdata.SPECTER_MULTISIG_WALLET_DATA) != Wallet(
+        tdata.MULTISIG_KEY2
+    ).cache_filename(tdata.SPECTER_MULTISIG_WALLET_DATA)
+
+    tampered = cache.replace(b"Specter", b"Spectre")
+    for data in [b"", b"not a cache", tampered]:
+        with pytest.raises(ValueError):
+            Wallet(tdata.MULTISIG_KEY1).load_cached(
+                tdata.SPECTER_MULTISIG_WALLET_DATA, FORMAT_PMOFN, BytesIO(data)
+            )
+    # Nor can it be copied to another wallet's data
+    with pytest.raises(ValueError):
+        Wallet(tdata.MULTISIG_KEY1).load_cached(
+            tdata.SPECTER_MULTISIG_WALLET_DATA.replace("Specter", "Spectre"),
+            FORMAT_PMOFN,
+            BytesIO(cache),
+        )
+    # Another key can't use, nor forge, this key's cache
+    with pytest.raises(ValueError):
+        Wallet(tdata.MULTISIG_KEY2).load_cached(
+            tdata.SPECTER_MULTISIG_WALLET_DATA, FORMAT_PMOFN, BytesIO(cache)
+        )
+
+
+def test_wallet_cache_record(mocker, m5stickv, tdata):
+    from io import BytesIO
+    from krux.wallet import Wallet
+    from krux.qr import FORMAT_NONE, FORMAT_PMOFN
+
+    # A compact binary record, not the wallet data or JSON
+    wallet = Wallet(tdata.MULTISIG_KEY1)
+    wallet.load(tdata.SPECTER_MULTISIG_WALLET_DATA, FORMAT_PMOFN)
+    stream = BytesIO()
+    wallet.write_cache(stream)
+    cache = stream.getvalue()
+    assert cache.startswith(b"KWC")
+    assert b"\"label\"" not in cache and b"devices" not in cache
+    assert len(cache) < len(tdata.SPECTER_MULTISIG_WALLET_DATA)
+
+    # A default label isn't stored, but derived again when loaded
+    wallet = Wallet(tdata.SINGLEKEY_KEY)
+    wallet.load(tdata.BLUEWALLET_SINGLEKEY_WALLET_DATA, FORMAT_NONE)
+    assert wallet.label == "Single-key"
+    stream = BytesIO()
+    wallet.write_cache(stream)
+    assert b"Single-key" not in stream.getvalue()
+    cached = Wallet(tdata.SINGLEKEY_KEY)
+    cached.load_cached(
+        tdata.BLUEWALLET_SINGLEKEY_WALLET_DATA,
+        FORMAT_NONE,
+        BytesIO(stream.getvalue()),
+    )
+    assert cached.label == wallet.label
+    assert cached.policy == wallet.policy
+    assert cached.descriptor.to_string() == wallet.descriptor.to_string()
+
+
+def test_delete_wallet_caches(mocker, m5stickv):
+    import krux
+    from krux.wallet import delete_wallet_caches
+
+    mocker.patch(
+        "os.listdir",
+        return_value=["settings.json", "wallet-0a1b.cache", "wallet-2c3d.cache"],
+    )
+    mocker.patch("os.remove")
+    assert delete_wallet_caches("/sd") == 2
+    krux.wallet.os.remove.assert_has_calls(
+        [mocker.call("/sd/wallet-0a1b.cache"), mocker.call("/sd/wallet-2c3d.cache")]
+    )
+    assert krux.wallet.os.remove.call_count == 2